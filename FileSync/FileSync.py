@@ -21,19 +21,33 @@ the Free Software Foundation; either version 2 of the License, or
 ********************************************************************
 """
 import os, qgis, webbrowser
-import shutil
+import stat
+import re
+import sqlite3
+import json
+import contextlib
+import mmap
+import io
+import concurrent.futures
+import collections
+import itertools
+import types
 import typing
 import time
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 from pathlib import Path
 from configparser import ConfigParser
-from PIL import Image, IptcImagePlugin
-from PIL.ExifTags import TAGS, GPSTAGS
+
+try:
+    # optional pure EXIF-parser, faster than Pillow, if no image-dimensions/iptc are required
+    import exifread
+except ImportError:
+    exifread = None
 
 from FileSync.tools import MyTools
 from FileSync.tools.MyTools import debug_log, re_open_attribute_tables
-from FileSync.settings.constants import Qt_Roles
+from FileSync.settings.constants import Qt_Roles, STRING_TYPES, DOUBLE_TYPES, DATE_TIME_TYPES, INT_TYPES, POINT_WKB_TYPES, EMPTY_VALUES, ITEM_FLAGS_DEFAULT, ITEM_FLAGS_NOT_SELECTABLE, ITEM_FLAGS_ENABLED
 from FileSync.dialogs.FileSyncDialog import FileSyncDialog
 
 from FileSync.tools.MapTools import FeatureDigitizeMapTool
@@ -43,163 +57,772 @@ class FileMetaExtractor():
     """Tool to extract metadata from files"""
 
     # Rev. 2025-06-11
-    def __init__(self, hash_alg: str = 'sha1'):
+
+    # XMP-search only in the first bytes for these image-types, see extract_xmp_metas
+    xmp_window_size = 262144
+    xmp_window_extensions = {'.jpg', '.jpeg', '.png', '.tif', '.tiff', '.webp'}
+    # ...with full-scan-fallback for these types, which allow XMP behind the image-data
+    xmp_late_extensions = {'.png', '.tif', '.tiff'}
+
+    # markers for XMP and IPTC (Photoshop-APP13-segment), searched together in one pass, see scan_markers
+    xmp_marker = b'<x:xmpmeta'
+    iptc_marker = b'Photoshop 3.0\x00'
+    marker_pattern = re.compile(re.escape(xmp_marker) + b'|' + re.escape(iptc_marker))
+    # IPTC inside APP13 near the file-start, for other image-types (TIFF: tag 33723) the marker-check is not applicable
+    iptc_marker_extensions = {'.jpg', '.jpeg'}
+
+    # only files with these extensions (or others registered by Pillow) are opened as image, see read_expensive_metas
+    image_extensions = frozenset({'.jpg', '.jpeg', '.png', '.tif', '.tiff', '.webp', '.gif', '.bmp', '.heic', '.heif'})
+
+    # EXIF tag-ids for the targeted lookup in extract_image_metas, fixed by the EXIF-standard
+    # same as PIL.ExifTags.Base.ExifOffset/GPSInfo/DateTimeOriginal, without importing Pillow at plugin-start
+    exif_offset_id = 0x8769
+    gps_info_id = 0x8825
+    date_time_original_id = 0x9003
+
+    # files in flight and threads in iter_expensive_metas_threaded
+    threaded_queue_size = 64
+    threaded_max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+    # central configuration part: which metadata can be extracted from file?
+    # key: meta_name, value: dictionary meta-metas
+    # built once at class-definition, read-only for all instances
+    extractable_file_metas = types.MappingProxyType({
+        'abs_path': {
+            # type of the field
+            'field_type': QtCore.QMetaType.QString,
+            # is the field mandatory
+            'mandatory': True,
+            # default-field-name if used to create a new layer, mostly same value as meta_name
+            'default_field_name': 'abs_path',
+            # description used as user-info
+            'description': 'absolute path to file'
+        },
+        'file_hash': {
+            'field_type': QtCore.QMetaType.QString,
+            'mandatory': False,
+            'default_field_name': 'file_hash',
+            'description': 'unique BLAKE3-hash (BLAKE2b without the optional package blake3, fingerprint, usable to identify duplicates independend from filename or file-meta-data)',
+            'url': 'https://en.wikipedia.org/wiki/BLAKE_(hash_function)#BLAKE3'
+        },
+        'rel_path': {
+            'field_type': QtCore.QMetaType.QString,
+            'mandatory': False,
+            'default_field_name': 'rel_path',
+            'description': 'Path relative to a root directory to be specified (without file-name)'
+        },
+        'file_name': {
+            'field_type': QtCore.QMetaType.QString,
+            'mandatory': False,
+            'default_field_name': 'file_name',
+            'description': 'file-name'
+        },
+        'extension': {
+            'field_type': QtCore.QMetaType.QString,
+            'mandatory': False,
+            'default_field_name': 'extension',
+            'description': 'file-extension (lowercase without dot)'
+        },
+        'exif_metas': {
+            'field_type': QtCore.QMetaType.QString,
+            'mandatory': False,
+            'default_field_name': 'exif_metas',
+            'description': 'EXIF-metadata (Exchangeable image file format\nonly for images, f. e. camera, time, GPS)',
+            'url': 'https://en.wikipedia.org/wiki/Exif'
+        },
+        'iptc_metas': {
+            'field_type': QtCore.QMetaType.QString,
+            'mandatory': False,
+            'default_field_name': 'iptc_metas',
+            'description': 'IPTC-metadata (if available)',
+            'url': 'https://en.wikipedia.org/wiki/IPTC_Information_Interchange_Model'
+        },
+        'xmp_metas': {
+            'field_type': QtCore.QMetaType.QString,
+            'mandatory': False,
+            'default_field_name': 'xmp_metas',
+            'description': 'XMP-metadata (Extensible Metadata, if available)',
+            'url': 'https://en.wikipedia.org/wiki/Extensible_Metadata_Platform'
+        },
+
+        'file_size': {
+            'field_type': QtCore.QMetaType.Int,
+            'mandatory': False,
+            'default_field_name': 'file_size',
+            'description': 'total size in bytes',
+        },
+
+        'image_width': {
+            'field_type': QtCore.QMetaType.Int,
+            'mandatory': False,
+            'default_field_name': 'image_width',
+            'description': 'for images: width in pixel',
+        },
+        'image_height': {
+            'field_type': QtCore.QMetaType.Int,
+            'mandatory': False,
+            'default_field_name': 'image_height',
+            'description': 'for images: height in pixel',
+        },
+        'gps_latitude': {
+            'field_type': QtCore.QMetaType.Double,
+            'mandatory': False,
+            'default_field_name': 'gps_latitude',
+            'description': 'for images with exif-header containing GPS-metas:\nlatitude of recording point',
+        },
+        'gps_longitude': {
+            'field_type': QtCore.QMetaType.Double,
+            'mandatory': False,
+            'default_field_name': 'gps_longitude',
+            'description': 'for images with exif-header containing GPS-metas:\nlongitude of recording point',
+
+        },
+        'gps_altitude': {
+            'field_type': QtCore.QMetaType.Double,
+            'mandatory': False,
+            'default_field_name': 'gps_altitude',
+            'description': 'for images with exif-header containing GPS-metas:\naltitude of recording point',
+        },
+        'gps_img_direction': {
+            'field_type': QtCore.QMetaType.Double,
+            'mandatory': False,
+            'default_field_name': 'gps_img_direction',
+            'description': 'for images with exif-header containing GPS-metas:\nrecording-direction counter-clockwise against north',
+        },
+        'm_time': {
+            'field_type': QtCore.QMetaType.QDateTime,
+            'mandatory': False,
+            'default_field_name': 'm_time',
+            'description': 'Modification time: time when the content of the file most recently changed\n(even if file was identically saved)',
+            'url': 'https://en.wikipedia.org/wiki/MAC_times'
+        },
+        'c_time': {
+            'field_type': QtCore.QMetaType.QDateTime,
+            'mandatory': False,
+            'default_field_name': 'c_time',
+            'description': 'Windows → creation time vs. Unix → change of metadata (owner, permission)',
+            'url': 'https://en.wikipedia.org/wiki/MAC_times'
+        },
+        'a_time': {
+            'field_type': QtCore.QMetaType.QDateTime,
+            'mandatory': False,
+            'default_field_name': 'a_time',
+            'description': 'Access time: time when the file was most recently opened for reading\n(Note: in Windows file access time updating is disabled by default)',
+            'url': 'https://en.wikipedia.org/wiki/MAC_times'
+        },
+        'date_time_original': {
+            'field_type': QtCore.QMetaType.QDateTime,
+            'mandatory': False,
+            'description': 'for images with exif-header: recording-time',
+            'default_field_name': 'date_time_original',
+        },
+    })
+
+    # static texts for the pre- and post-scan-widgets, see create_description_label
+    # (outermost iterable of a comprehension is evaluated in class-scope)
+    meta_type_names = {meta_name: QtCore.QMetaType.typeName(extract_meta['field_type']) for meta_name, extract_meta in extractable_file_metas.items()}
+    meta_description_htmls = {meta_name: extract_meta['description'] + (f" <a href='{extract_meta['url']}'>link</a>" if extract_meta.get('url') else '') for meta_name, extract_meta in extractable_file_metas.items()}
+
+    # fixed set of instance-attributes, no per-instance __dict__
+    __slots__ = (
+        'hash_alg',
+        'pre_scan_widget',
+        'qle_pre_scan_rel_root_dir',
+        'pre_scan_qcbs',
+        'pre_scan_qles',
+        'post_scan_widget',
+        'qle_post_scan_rel_root_dir',
+        'post_scan_qcbxs',
+        'qcb_pre_scan_select_all',
+        'post_scan_header_wdgs',
+        'post_scan_row_wdgs',
+        'post_scan_rel_root_dir_wdg',
+        'post_scan_cache_key',
+        'image_meta_names',
+        'meta_handlers',
+        'meta_cache_file_name',
+        'meta_cache_version',
+        '_meta_cache',
+    )
+
+    def __init__(self, hash_alg: str = 'blake3'):
         """
         constructor
-        :param hash_alg: hash-algorithm to calculate hash-value for a file, default sha1, unique fingerprint, usable for duplicate-check
+        :param hash_alg: hash-algorithm to calculate hash-value for a file, default blake3, unique fingerprint, usable for duplicate-check
         """
         # Rev. 2025-06-11
 
-        # central configuration part: which metadata can be extracted from file?
-        # key: meta_name, value: dictionary meta-metas
-        self.extractable_file_metas = {
-            'abs_path': {
-                # type of the field
-                'field_type': QtCore.QMetaType.QString,
-                # is the field mandatory
-                'mandatory': True,
-                # default-field-name if used to create a new layer, mostly same value as meta_name
-                'default_field_name': 'abs_path',
-                # description used as user-info
-                'description': 'absolute path to file'
-            },
-            'file_hash': {
-                'field_type': QtCore.QMetaType.QString,
-                'mandatory': False,
-                'default_field_name': 'file_hash',
-                'description': 'unique hash (fingerprint, usable to identify duplicates independend from filename or file-meta-data)',
-                'url': 'https://de.wikipedia.org/wiki/Secure_Hash_Algorithm'
-            },
-            'rel_path': {
-                'field_type': QtCore.QMetaType.QString,
-                'mandatory': False,
-                'default_field_name': 'rel_path',
-                'description': 'Path relative to a root directory to be specified (without file-name)'
-            },
-            'file_name': {
-                'field_type': QtCore.QMetaType.QString,
-                'mandatory': False,
-                'default_field_name': 'file_name',
-                'description': 'file-name'
-            },
-            'extension': {
-                'field_type': QtCore.QMetaType.QString,
-                'mandatory': False,
-                'default_field_name': 'extension',
-                'description': 'file-extension (lowercase without dot)'
-            },
-            'exif_metas': {
-                'field_type': QtCore.QMetaType.QString,
-                'mandatory': False,
-                'default_field_name': 'exif_metas',
-                'description': 'EXIF-metadata (Exchangeable image file format\nonly for images, f. e. camera, time, GPS)',
-                'url': 'https://en.wikipedia.org/wiki/Exif'
-            },
-            'iptc_metas': {
-                'field_type': QtCore.QMetaType.QString,
-                'mandatory': False,
-                'default_field_name': 'iptc_metas',
-                'description': 'IPTC-metadata (if available)',
-                'url': 'https://en.wikipedia.org/wiki/IPTC_Information_Interchange_Model'
-            },
-            'xmp_metas': {
-                'field_type': QtCore.QMetaType.QString,
-                'mandatory': False,
-                'default_field_name': 'xmp_metas',
-                'description': 'XMP-metadata (Extensible Metadata, if available)',
-                'url': 'https://en.wikipedia.org/wiki/Extensible_Metadata_Platform'
-            },
-
-            'file_size': {
-                'field_type': QtCore.QMetaType.Int,
-                'mandatory': False,
-                'default_field_name': 'file_size',
-                'description': 'total size in bytes',
-            },
-
-            'image_width': {
-                'field_type': QtCore.QMetaType.Int,
-                'mandatory': False,
-                'default_field_name': 'image_width',
-                'description': 'for images: width in pixel',
-            },
-            'image_height': {
-                'field_type': QtCore.QMetaType.Int,
-                'mandatory': False,
-                'default_field_name': 'image_height',
-                'description': 'for images: height in pixel',
-            },
-            'gps_latitude': {
-                'field_type': QtCore.QMetaType.Double,
-                'mandatory': False,
-                'default_field_name': 'gps_latitude',
-                'description': 'for images with exif-header containing GPS-metas:\nlatitude of recording point',
-            },
-            'gps_longitude': {
-                'field_type': QtCore.QMetaType.Double,
-                'mandatory': False,
-                'default_field_name': 'gps_longitude',
-                'description': 'for images with exif-header containing GPS-metas:\nlongitude of recording point',
-
-            },
-            'gps_altitude': {
-                'field_type': QtCore.QMetaType.Double,
-                'mandatory': False,
-                'default_field_name': 'gps_altitude',
-                'description': 'for images with exif-header containing GPS-metas:\naltitude of recording point',
-            },
-            'gps_img_direction': {
-                'field_type': QtCore.QMetaType.Double,
-                'mandatory': False,
-                'default_field_name': 'gps_img_direction',
-                'description': 'for images with exif-header containing GPS-metas:\nrecording-direction counter-clockwise against north',
-            },
-            'm_time': {
-                'field_type': QtCore.QMetaType.QDateTime,
-                'mandatory': False,
-                'default_field_name': 'm_time',
-                'description': 'Modification time: time when the content of the file most recently changed\n(even if file was identically saved)',
-                'url': 'https://en.wikipedia.org/wiki/MAC_times'
-            },
-            'c_time': {
-                'field_type': QtCore.QMetaType.QDateTime,
-                'mandatory': False,
-                'default_field_name': 'c_time',
-                'description': 'Windows → creation time vs. Unix → change of metadata (owner, permission)',
-                'url': 'https://en.wikipedia.org/wiki/MAC_times'
-            },
-            'a_time': {
-                'field_type': QtCore.QMetaType.QDateTime,
-                'mandatory': False,
-                'default_field_name': 'a_time',
-                'description': 'Access time: time when the file was most recently opened for reading\n(Note: in Windows file access time updating is disabled by default)',
-                'url': 'https://en.wikipedia.org/wiki/MAC_times'
-            },
-            'date_time_original': {
-                'field_type': QtCore.QMetaType.QDateTime,
-                'mandatory': False,
-                'description': 'for images with exif-header: recording-time',
-                'default_field_name': 'date_time_original',
-            },
-
-        }
-
         # hash-algorithm to calculate hash-value for a file
-        self.hash_alg = hash_alg
+        # resolved once: the algorithm actually used is stored in the meta-cache, blake2b-hashes must not be served as blake3
+        self.hash_alg = MyTools.resolve_hash_alg(hash_alg)
 
         # widget for pre-scan-usage (create new layer), Table (QGridLayout), one row for each meta, QLineEdits for user-defined field-name
         self.pre_scan_widget = None
         # widget for special meta rel_path inside pre_scan_widget, root-directory for the relative-path-calculation
         self.qle_pre_scan_rel_root_dir = None
+        # widgets inside pre_scan_widget, collected at build-time, key: meta_name, value: QCheckBox/QLineEdit
+        self.pre_scan_qcbs = {}
+        self.pre_scan_qles = {}
+        # select-all-QCheckBox in the header-row of pre_scan_widget
+        self.qcb_pre_scan_select_all = None
 
         # widget for post-scan-usage (update values in existing layer), Table (QGridLayout), one row for each meta, QQomboBox to select meta-target-field from target-layer
         self.post_scan_widget = None
         # widget for special meta rel_path inside post_scan_widget, root-directory for the relative-path-calculation
         self.qle_post_scan_rel_root_dir = None
+        # widgets inside post_scan_widget, collected at build-time, key: meta_name, value: QComboBox
+        self.post_scan_qcbxs = {}
+        # reused widgets for each new post_scan_widget: header-row, rows key: meta_name value: list of widgets by column, rel_path: tuple(sub-widget, QLineEdit)
+        self.post_scan_header_wdgs = []
+        self.post_scan_row_wdgs = {}
+        self.post_scan_rel_root_dir_wdg = None
+        # structure-relevant inputs of the last build (layer, abs-path-field, layer-fields), unchanged => no rebuild, see get_post_scan_widget
+        self.post_scan_cache_key = None
+
+        # metas extracted together from one Image.open, cached together as 'exif' in the meta-cache
+        self.image_meta_names = ['image_width', 'image_height', 'exif_metas', 'date_time_original', 'gps_latitude', 'gps_longitude', 'gps_altitude', 'gps_img_direction']
+
+        # dispatch-table meta_name => function(meta_context) returning the value for the feature, see extract_file_metas
+        # LookupError/ValueError => meta not available for this file, feature unchanged
+        self.meta_handlers = {
+            'abs_path': lambda mc: mc['posix_path'].as_posix(),
+            'rel_path': self.get_rel_path_meta,
+            'file_name': lambda mc: mc['posix_path'].name,
+            'extension': lambda mc: str.lower(mc['posix_path'].suffix).lstrip('.'),
+            'file_size': lambda mc: mc['stat_metas'].st_size,
+            'file_hash': self.get_file_hash_meta,
+            # mtime => Time of most recent content modification
+            # Datei-auf-Datenträger-Zeit, *nicht* Aufnahmezeit
+            'm_time': lambda mc: QtCore.QDateTime.fromSecsSinceEpoch(int(mc['stat_metas'].st_mtime)),
+            # ctime => create/change-time
+            'c_time': lambda mc: QtCore.QDateTime.fromSecsSinceEpoch(int(mc['stat_metas'].st_ctime)),
+            # atime => access-time
+            'a_time': lambda mc: QtCore.QDateTime.fromSecsSinceEpoch(int(mc['stat_metas'].st_atime)),
+            'xmp_metas': lambda mc: mc['cached_metas']['xmp'],
+            'iptc_metas': self.get_iptc_meta,
+        }
+        # image_width, image_height, exif_metas, date_time_original, gps_*
+        # only available for images with (geo-)exif-header => KeyError
+        for meta_name in self.image_meta_names:
+            self.meta_handlers[meta_name] = lambda mc, meta_name=meta_name: mc['image_metas'][meta_name]
+
+
+        # SQLite-file inside QGis-user-profile-directory, lazy opened by get_meta_cache
+        self.meta_cache_file_name = 'FileSync_meta_cache.sqlite'
+        # stored as PRAGMA user_version, increment if the cached contents change, outdated caches are dropped
+        # 2: signed GPS-coordinates
+        self.meta_cache_version = 2
+        self._meta_cache = None
+
+    def get_meta_cache(self) -> sqlite3.Connection | None:
+        """lazy opened SQLite-cache for expensive file-metas (hash, exif, iptc, xmp), stored inside the QGis-user-profile-directory
+        key: abs_path, valid if file-size and modification-time are unchanged
+        :returns: connection or None, if the cache could not be opened
+        """
+        # Rev. 2025-06-11
+        if self._meta_cache is None:
+            try:
+                cache_path = Path(qgis._core.QgsApplication.qgisSettingsDirPath()) / self.meta_cache_file_name
+                # isolation_level None => autocommit, batches via meta_cache_batch
+                self._meta_cache = sqlite3.connect(str(cache_path), isolation_level=None)
+                self._meta_cache.execute('PRAGMA journal_mode=WAL')
+                if self._meta_cache.execute('PRAGMA user_version').fetchone()[0] != self.meta_cache_version:
+                    self._meta_cache.execute('DROP TABLE IF EXISTS cache')
+                    self._meta_cache.execute(f'PRAGMA user_version={self.meta_cache_version}')
+                self._meta_cache.execute('CREATE TABLE IF NOT EXISTS cache(path TEXT PRIMARY KEY, size INT, mtime_ns INT, hash_alg TEXT, file_hash TEXT, exif BLOB, iptc BLOB, xmp TEXT)')
+            except sqlite3.Error as e:
+                debug_log(f"meta-cache not available: {e}")
+                # False => don't try again
+                self._meta_cache = False
+
+        return self._meta_cache or None
+
+    def close_meta_cache(self):
+        """closes the SQLite-cache, called on plugin-unload"""
+        # Rev. 2025-06-11
+        if self._meta_cache:
+            self._meta_cache.close()
+        self._meta_cache = None
+
+    @contextlib.contextmanager
+    def meta_cache_batch(self):
+        """context-manager for scans of many files: all cache-writes inside one transaction instead of one autocommit per file"""
+        # Rev. 2025-06-11
+        meta_cache = self.get_meta_cache()
+        if meta_cache:
+            meta_cache.execute('BEGIN')
+        try:
+            yield
+        finally:
+            if meta_cache:
+                meta_cache.execute('COMMIT')
+
+    def read_meta_cache(self, posix_path: Path, stat_metas: os.stat_result) -> dict:
+        """restore previously extracted metas for an unchanged file
+        :param posix_path: absolute path to the file
+        :param stat_metas: current stat of the file, cache-entries with other size or mtime are outdated
+        :returns: dict key: 'file_hash', 'exif', 'iptc', 'xmp', value: cached value, only for the already calculated metas
+        """
+        # Rev. 2025-06-11
+        cached_metas = {}
+        meta_cache = self.get_meta_cache()
+        if meta_cache:
+            try:
+                row = meta_cache.execute('SELECT hash_alg, file_hash, exif, iptc, xmp FROM cache WHERE path=? AND size=? AND mtime_ns=?', (posix_path.as_posix(), stat_metas.st_size, stat_metas.st_mtime_ns)).fetchone()
+            except sqlite3.Error:
+                row = None
+
+            if row:
+                hash_alg, file_hash, exif, iptc, xmp = row
+                if file_hash is not None and hash_alg == self.hash_alg:
+                    cached_metas['file_hash'] = file_hash
+                if exif is not None:
+                    cached_metas['exif'] = json.loads(exif)
+                if iptc is not None:
+                    cached_metas['iptc'] = iptc.decode('utf-8')
+                if xmp is not None:
+                    cached_metas['xmp'] = xmp
+
+        return cached_metas
+
+    def write_meta_cache(self, posix_path: Path, stat_metas: os.stat_result, cached_metas: dict):
+        """store the extracted expensive metas, see read_meta_cache
+        :param posix_path: absolute path to the file
+        :param stat_metas: stat of the file
+        :param cached_metas: dict key: 'file_hash', 'exif', 'iptc', 'xmp'
+        """
+        # Rev. 2025-06-11
+        meta_cache = self.get_meta_cache()
+        if meta_cache:
+            exif = cached_metas.get('exif')
+            iptc = cached_metas.get('iptc')
+            # serialized before the DB-call: exif-values like bytes or IFDRational are not json-serializable
+            # no conversion f.e. with default=str, the cached values must have the same types as the extracted ones
+            try:
+                exif_json = json.dumps(exif) if exif is not None else None
+            except (TypeError, ValueError) as e:
+                debug_log(f"meta-cache-entry skipped, exif not serializable: {e}")
+                return
+            try:
+                meta_cache.execute(
+                    'INSERT OR REPLACE INTO cache(path, size, mtime_ns, hash_alg, file_hash, exif, iptc, xmp) VALUES (?,?,?,?,?,?,?,?)',
+                    (
+                        posix_path.as_posix(),
+                        stat_metas.st_size,
+                        stat_metas.st_mtime_ns,
+                        self.hash_alg,
+                        cached_metas.get('file_hash'),
+                        exif_json,
+                        iptc.encode('utf-8') if iptc is not None else None,
+                        cached_metas.get('xmp')
+                    )
+                )
+            except sqlite3.Error as e:
+                debug_log(f"meta-cache not writable: {e}")
+
+    @classmethod
+    def extract_image_metas(cls, img_source, iptc_required: bool, exif_metas_required: bool, extract_log: list) -> tuple:
+        """extract the image-specific metas (size, exif, GPS, iptc) from a file, which possibly is an image
+        :param img_source: path or file-like object (f.e. mmap of the file)
+        :param iptc_required: additionally parse iptc-header
+        :param exif_metas_required: additionally build the complete exif-listing for 'exif_metas', else only the needed tags are looked up
+        :param extract_log: list of log-messages, extended in place
+        :return: tuple(image_metas, iptc_metas), image_metas: dict key: meta_name value: extracted value, only the metas, which will be written to the feature
+        """
+        # Rev. 2025-06-11
+        # Pillow imported on first usage, not at plugin-start, see sys.modules
+        from PIL import Image, IptcImagePlugin
+        from PIL.ExifTags import TAGS, GPSTAGS
+
+        tab = '&nbsp;' * 3
+        image_metas = {}
+        iptc_metas = ''
+        try:
+            # try to open file as image:
+            with Image.open(img_source) as img:
+                extract_log.append(f"{tab}{tab}{tab}{tab}file is image")
+                image_metas['image_width'] = img.width
+                image_metas['image_height'] = img.height
+                # optionale exif-Daten
+                exif_raw = img.getexif()
+                if exif_raw:
+                    extract_log.append(f"{tab}{tab}{tab}{tab}file has exif-header")
+                    geo_exif_dict = {}
+                    lat = lon = alt = direction = None
+                    # targeted lookup of the needed tags by id, GPS and DateTimeOriginal are stored in sub-IFDs
+                    exif_ifd = exif_raw.get_ifd(cls.exif_offset_id)
+                    gps_ifd = exif_raw.get_ifd(cls.gps_info_id)
+                    if gps_ifd:
+                        geo_exif_dict = {GPSTAGS[k]: v for k, v in gps_ifd.items() if k in GPSTAGS}
+
+                        if geo_exif_dict.get('GPSLatitude'):
+                            # tuple with three floats: degree, minutes, seconds, signed by N/S
+                            lat = MyTools.dms_to_dd(geo_exif_dict['GPSLatitude'], geo_exif_dict.get('GPSLatitudeRef', 'N'))
+                            # extract_log.append(f"{tab}{tab}{tab}{tab}{tab}GPSLatitude {lat}")
+
+                        if geo_exif_dict.get('GPSLongitude'):
+                            # signed by E/W
+                            lon = MyTools.dms_to_dd(geo_exif_dict['GPSLongitude'], geo_exif_dict.get('GPSLongitudeRef', 'E'))
+                            # extract_log.append(f"{tab}{tab}{tab}{tab}{tab}GPSLongitude {lon}")
+
+                        if geo_exif_dict.get('GPSAltitude'):
+                            alt = float(geo_exif_dict.get('GPSAltitude'))
+                            # extract_log.append(f"{tab}{tab}{tab}{tab}{tab}GPSAltitude {alt}")
+
+                        if geo_exif_dict.get('GPSImgDirection'):
+                            direction = float(geo_exif_dict.get('GPSImgDirection'))
+                            # extract_log.append(f"{tab}{tab}{tab}{tab}{tab}GPSImgDirection {direction}")
+
+                        image_metas['gps_latitude'] = lat
+                        image_metas['gps_longitude'] = lon
+                        image_metas['gps_altitude'] = alt
+                        image_metas['gps_img_direction'] = direction
+
+                    if lat is not None and lon is not None:
+                        extract_log.append(f"{tab}{tab}{tab}{tab}file is exif-gps-georeferenced")
+                    else:
+                        extract_log.append(f"{tab}{tab}{tab}{tab}file not georeferenced")
+
+                    image_metas['date_time_original'] = exif_ifd.get(cls.date_time_original_id, exif_raw.get(cls.date_time_original_id))
 
-    def extract_file_metas(self, posix_path: Path, feature: qgis._core.QgsFeature, field_list: dict, pre_scan_rel_root_dir: str = None, preserve_existing: bool = False, extract_gps_geom: bool = False, tr_wgs_2_vl: qgis._core.QgsCoordinateTransform = None) -> tuple:
+                    if exif_metas_required:
+                        # complete listing only on demand: IFD0 and Exif-IFD, einige Inhalte binär
+                        exif_metas = "Exif-Tags:\n"
+                        for exif_id, exif_value in {**exif_raw, **exif_ifd}.items():
+                            if exif_id in TAGS and exif_id != cls.gps_info_id and type(exif_value) in [int, str]:
+                                exif_metas += f"   {TAGS[exif_id]}: {exif_value}\n"
+
+                        if geo_exif_dict:
+                            exif_metas += "Geo-Tags:\n"
+                            for exif_key, exif_value in geo_exif_dict.items():
+                                exif_metas += f"   {exif_key}: {exif_value}\n"
+
+                        image_metas['exif_metas'] = exif_metas
+                    else:
+                        # not built, see get_extract_requirements
+                        image_metas['exif_metas'] = None
+                else:
+                    extract_log.append(f"{tab}{tab}{tab}{tab}no exif-header")
+
+                if iptc_required:
+                    # optionale iptc-Metadaten
+                    iptc = IptcImagePlugin.getiptcinfo(img)
+                    if iptc:
+                        for iptc_key, iptc_value in iptc.items():
+                            iptc_metas += f"{iptc_key} {iptc_value.decode('utf-8')}\n"
+        except Exception:
+            extract_log.append(f"{tab}{tab}{tab}{tab}file is no image")
+
+        return image_metas, iptc_metas
+
+    @staticmethod
+    def extract_exif_metas_fast(file_buffer, extract_log: list) -> dict:
+        """extract date_time_original and GPS-metas with exifread, which only parses the EXIF-header without initializing an image-decoder
+        no image_width/image_height, no exif_metas, see extract_image_metas
+        :param file_buffer: file-like object (f.e. mmap of the file)
+        :param extract_log: list of log-messages, extended in place
+        :return: image_metas, dict key: meta_name value: extracted value
+        """
+        # Rev. 2025-06-11
+        tab = '&nbsp;' * 3
+        # image-dimensions and exif-listing not extracted, None => not yet built, see get_extract_requirements
+        image_metas = {'image_width': None, 'image_height': None}
+        try:
+            file_buffer.seek(0)
+            # details=False: no MakerNotes and thumbnails
+            exif_tags = exifread.process_file(file_buffer, details=False)
+        except Exception:
+            exif_tags = {}
+
+        if exif_tags:
+            extract_log.append(f"{tab}{tab}{tab}{tab}file has exif-header")
+            lat = lon = alt = direction = None
+
+            def ratio_to_float(ratio) -> float:
+                return float(ratio.num) / float(ratio.den) if ratio.den else 0.0
+
+            if exif_tags.get('GPS GPSLatitude'):
+                # three ratios: degree, minutes, seconds, signed by N/S
+                lat_ref = exif_tags.get('GPS GPSLatitudeRef')
+                lat = MyTools.dms_to_dd([ratio_to_float(ratio) for ratio in exif_tags['GPS GPSLatitude'].values], lat_ref.values if lat_ref else 'N')
+
+            if exif_tags.get('GPS GPSLongitude'):
+                # signed by E/W
+                lon_ref = exif_tags.get('GPS GPSLongitudeRef')
+                lon = MyTools.dms_to_dd([ratio_to_float(ratio) for ratio in exif_tags['GPS GPSLongitude'].values], lon_ref.values if lon_ref else 'E')
+
+            if exif_tags.get('GPS GPSAltitude'):
+                alt = ratio_to_float(exif_tags['GPS GPSAltitude'].values[0])
+
+            if exif_tags.get('GPS GPSImgDirection'):
+                direction = ratio_to_float(exif_tags['GPS GPSImgDirection'].values[0])
+
+            if any(tag_name.startswith('GPS ') for tag_name in exif_tags):
+                image_metas['gps_latitude'] = lat
+                image_metas['gps_longitude'] = lon
+                image_metas['gps_altitude'] = alt
+                image_metas['gps_img_direction'] = direction
+
+            if lat is not None and lon is not None:
+                extract_log.append(f"{tab}{tab}{tab}{tab}file is exif-gps-georeferenced")
+            else:
+                extract_log.append(f"{tab}{tab}{tab}{tab}file not georeferenced")
+
+            date_time_original = exif_tags.get('EXIF DateTimeOriginal', exif_tags.get('Image DateTimeOriginal'))
+            image_metas['date_time_original'] = str(date_time_original.values) if date_time_original else None
+            image_metas['exif_metas'] = None
+        else:
+            extract_log.append(f"{tab}{tab}{tab}{tab}no exif-header")
+
+        return image_metas
+
+    @classmethod
+    def scan_markers(cls, file_buffer: bytes | mmap.mmap, suffix: str) -> dict:
+        """one regex-pass over the file-contents for all markers instead of one find per marker
+        window as in extract_xmp_metas
+        :param file_buffer: file-contents, f.e. mmap of the file
+        :param suffix: lowercase file-extension with dot
+        :return: dict key: marker (xmp_marker/iptc_marker) value: offset of the first occurrence
+        """
+        # Rev. 2025-06-11
+        window_end = len(file_buffer)
+        if suffix in cls.xmp_window_extensions:
+            window_end = min(window_end, cls.xmp_window_size)
+
+        markers = {}
+        for match in cls.marker_pattern.finditer(file_buffer, 0, window_end):
+            markers.setdefault(match.group(), match.start())
+            if len(markers) == 2:
+                break
+
+        return markers
+
+    @classmethod
+    def extract_xmp_metas(cls, file_buffer: bytes | mmap.mmap, suffix: str, xmp_start: int = None) -> str:
+        """search the XMP-packet in the file-contents
+        images store XMP near the start of the file (JPEG APP1-segment, PNG iTXt-chunk...), so for these only the first cls.xmp_window_size bytes are scanned
+        :param file_buffer: file-contents, f.e. mmap of the file
+        :param suffix: lowercase file-extension with dot
+        :param xmp_start: optional offset of the start-tag inside the window, already found by scan_markers, -1 => not in window
+        :return: XMP-packet or empty string
+        """
+        # Rev. 2025-06-11
+        # xmp-Metadaten
+        # raw bytes-search, no str()-conversion of the whole file
+        # end-tag searched behind the start-tag, empty string if one of the tags is missing
+        window_end = len(file_buffer)
+        if suffix in cls.xmp_window_extensions:
+            window_end = min(window_end, cls.xmp_window_size)
+
+        if xmp_start is None:
+            xmp_start = file_buffer.find(cls.xmp_marker, 0, window_end)
+        xmp_end = file_buffer.find(b'</x:xmpmeta>', xmp_start) if xmp_start >= 0 else -1
+
+        if xmp_end < 0 and window_end < len(file_buffer) and suffix in cls.xmp_late_extensions:
+            # rare: XMP behind the image-data, full scan
+            xmp_start = file_buffer.find(cls.xmp_marker, window_end)
+            xmp_end = file_buffer.find(b'</x:xmpmeta>', xmp_start) if xmp_start >= 0 else -1
+
+        if xmp_end >= 0:
+            return file_buffer[xmp_start:xmp_end + 12].decode('utf-8', 'replace')
+
+        return ''
+
+    @staticmethod
+    def get_pillow_extensions() -> dict:
+        """file-extensions of all image-formats registered by Pillow, imports Pillow on first usage
+        :return: dict key: extension (lower-case with leading dot) value: format
+        """
+        # Rev. 2025-06-11
+        from PIL import Image
+        return Image.registered_extensions()
+
+    @classmethod
+    def read_expensive_metas(cls, path_str: str, file_size: int, hash_alg: str, hash_required: bool, xmp_required: bool, iptc_required: bool, image_required: bool, exif_metas_required: bool, dimensions_required: bool) -> tuple:
+        """read the file once and extract the expensive metas (hash, xmp, iptc, image-metas)
+        no Qt/QGis-objects, so usable in a worker-thread, see iter_expensive_metas_threaded
+        :param path_str: absolute path to the file
+        :param file_size: size in bytes, empty files can't be memory-mapped
+        :param hash_alg: see get_file_hash
+        :param hash_required...dimensions_required: metas to extract, see get_extract_requirements
+        :return: tuple(extracted_metas, extract_log), extracted_metas: dict key: 'file_hash', 'xmp', 'iptc', 'exif' as stored in the meta-cache
+        """
+        # Rev. 2025-06-11
+        tab = '&nbsp;' * 3
+        extracted_metas = {}
+        extract_log = []
+        suffix = os.path.splitext(path_str)[1].lower()
+        # read the file only once: one memory-map for hash, xmp and image-decode
+        # 'rb' => read binary, vermeidet "Ausnahme: 'utf-8' codec can't decode byte 0xff in position 0: invalid start byte"
+        # empty files can't be mapped
+        with open(path_str, 'rb') as fd, (mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) if file_size else contextlib.nullcontext(b'')) as file_buffer:
+            if hash_required:
+                extracted_metas['file_hash'] = MyTools.get_buffer_hash(file_buffer, hash_alg)
+
+            iptc_marker_check = iptc_required and suffix in cls.iptc_marker_extensions
+            if xmp_required or iptc_marker_check:
+                # XMP- and IPTC-marker in one pass
+                markers = cls.scan_markers(file_buffer, suffix)
+
+                if xmp_required:
+                    extracted_metas['xmp'] = cls.extract_xmp_metas(file_buffer, suffix, markers.get(cls.xmp_marker, -1))
+
+                if iptc_marker_check and cls.iptc_marker not in markers:
+                    # no APP13-segment => no IPTC, no Pillow-parse
+                    extracted_metas['iptc'] = ''
+                    iptc_required = False
+
+            if (iptc_required or image_required) and not (suffix in cls.image_extensions or suffix in cls.get_pillow_extensions()):
+                # no Image.open with exception for the common non-image-files
+                extract_log.append(f"{tab}{tab}{tab}{tab}file is no image")
+                if image_required:
+                    extracted_metas['exif'] = {}
+                if iptc_required:
+                    extracted_metas['iptc'] = ''
+            elif image_required and not (iptc_required or exif_metas_required or dimensions_required) and exifread and file_size:
+                # only exif/GPS required => no Pillow image-decoder
+                extracted_metas['exif'] = cls.extract_exif_metas_fast(file_buffer, extract_log)
+            elif iptc_required or image_required:
+                # mmap is file-like, no copy for Image.open
+                image_metas, iptc_metas = cls.extract_image_metas(file_buffer if file_size else io.BytesIO(), iptc_required, exif_metas_required, extract_log)
+                if image_required:
+                    extracted_metas['exif'] = image_metas
+                if iptc_required:
+                    extracted_metas['iptc'] = iptc_metas
+
+        return extracted_metas, extract_log
+
+    def get_extract_requirements(self, cached_metas: dict, required_metas: set, extract_gps_geom: bool) -> tuple:
+        """which expensive metas have to be read from file?
+        :param cached_metas: metas restored from meta-cache or already extracted
+        :param required_metas: meta_names, which will be written to the feature
+        :param extract_gps_geom: geometry from exif-GPS requires the image-metas
+        :return: tuple(hash_required, xmp_required, iptc_required, image_required, exif_metas_required, dimensions_required)
+        """
+        # Rev. 2025-06-11
+        # file_hash without reading a single byte of the file, if
+        # - the feature already has a value and preserve_existing (not in required_metas, see extract_file_metas)
+        # - the meta-cache contains a hash with the same hash_alg for unchanged path, size and mtime_ns
+        hash_required = 'file_hash' in required_metas and 'file_hash' not in cached_metas
+        xmp_required = 'xmp_metas' in required_metas and 'xmp' not in cached_metas
+        iptc_required = 'iptc_metas' in required_metas and 'iptc' not in cached_metas
+        # extract special metas for image-files and jpeg-exif
+        # the complete exif-listing and the image-dimensions are only extracted on demand, None in cache => not yet extracted
+        exif_metas_required = 'exif_metas' in required_metas
+        dimensions_required = not required_metas.isdisjoint(['image_width', 'image_height'])
+        image_required = (extract_gps_geom or not required_metas.isdisjoint(self.image_meta_names)) and (
+            'exif' not in cached_metas
+            or (exif_metas_required and cached_metas['exif'].get('exif_metas', '') is None)
+            or (dimensions_required and cached_metas['exif'].get('image_width', '') is None)
+        )
+        return hash_required, xmp_required, iptc_required, image_required, exif_metas_required, dimensions_required
+
+    def get_extract_job(self, posix_path: Path, required_metas: set, extract_gps_geom: bool, stat_metas: os.stat_result = None) -> tuple | None:
+        """arguments for read_expensive_metas, if the file has to be read (not or only partially in the meta-cache)
+        stat and meta-cache-read in the main-thread, the SQLite-connection is not shared with other threads/processes
+        :param posix_path: absolute path
+        :param required_metas: meta_names, which will be written to the feature
+        :param extract_gps_geom: geometry from exif-GPS requires the image-metas
+        :param stat_metas: optional already fetched stat, see MyTools.scan_files
+        :return: tuple of arguments for read_expensive_metas or None
+        """
+        # Rev. 2025-06-11
+        if stat_metas is None:
+            stat_metas = MyTools.get_file_stat(posix_path)
+
+        if stat_metas:
+            requirements = self.get_extract_requirements(self.read_meta_cache(posix_path, stat_metas), required_metas, extract_gps_geom)
+            if any(requirements[:4]):
+                return posix_path.as_posix(), stat_metas.st_size, self.hash_alg, *requirements
+
+    def iter_expensive_metas_threaded(self, posix_paths: typing.Iterable, field_list: dict, extract_gps_geom: bool = False, stat_results: dict = None) -> typing.Iterator:
+        """read the expensive metas (hash, xmp, iptc, image-metas) of many files in a thread-pool, pipelined with the feature-creation in the main-thread
+        file-reads (mmap page-faults) and hashing (blake3/hashlib) release the GIL, so disk-latency and hash-computation of several files overlap
+        at most threaded_queue_size files are in flight
+        :param posix_paths: absolute paths
+        :param field_list: dict key: meta-name value: field-name
+        :param extract_gps_geom: geometry from exif-GPS requires the image-metas
+        :param stat_results: optional dict key: posix_path value: already fetched stat, see MyTools.scan_files
+        :return: iterator of tuple(extracted_metas, extract_log) in order of posix_paths
+        """
+        # Rev. 2025-06-11
+        if stat_results is None:
+            stat_results = {}
+        required_metas = set(field_list)
+        pending = collections.deque()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.threaded_max_workers) as executor:
+            for posix_path in posix_paths:
+                extract_job = self.get_extract_job(posix_path, required_metas, extract_gps_geom, stat_results.get(posix_path))
+                pending.append(executor.submit(self.read_expensive_metas, *extract_job) if extract_job else None)
+
+                if len(pending) >= self.threaded_queue_size:
+                    yield self.get_threaded_result(pending.popleft())
+
+            while pending:
+                yield self.get_threaded_result(pending.popleft())
+
+    @staticmethod
+    def get_threaded_result(future: concurrent.futures.Future | None) -> tuple:
+        """result of a read_expensive_metas-job from iter_expensive_metas_threaded
+        :param future: None if nothing to read
+        :return: tuple(extracted_metas, extract_log), extracted_metas empty if the file could not be read => sequential in extract_file_metas
+        """
+        # Rev. 2025-06-11
+        tab = '&nbsp;' * 3
+        if future:
+            try:
+                return future.result()
+            except Exception as e:
+                # any error of one file (f.e. OSError, ValueError from mmap for a meanwhile emptied file, parser-errors) must not abort the scan
+                return {}, [f"<b>{tab}{tab}{tab}{tab}⭍ threaded extraction failed ({e}), retry sequential</b>"]
+
+        return {}, []
+
+    def get_rel_path_meta(self, meta_context: dict) -> str:
+        """meta_handler for 'rel_path': directory relative to pre_scan_rel_root_dir
+        :param meta_context: see extract_file_metas
+        :return: relative path of the parent-directory
+        :raises ValueError: no pre_scan_rel_root_dir or file outside
+        """
+        # Rev. 2025-06-11
+        if meta_context['rel_root_dir'] is None:
+            raise ValueError('no rel_root_dir')
+        # Compute a version of this path relative to the path represented by other. If it’s impossible, ValueError is raised
+        return meta_context['posix_path'].relative_to(meta_context['rel_root_dir']).parent.as_posix()
+
+    def get_file_hash_meta(self, meta_context: dict) -> str:
+        """meta_handler for 'file_hash'
+        :param meta_context: see extract_file_metas
+        :return: hash-value
+        """
+        # Rev. 2025-06-11
+        return meta_context['cached_metas']['file_hash']
+
+    def get_iptc_meta(self, meta_context: dict) -> str:
+        """meta_handler for 'iptc_metas'
+        :param meta_context: see extract_file_metas
+        :return: iptc-listing
+        :raises KeyError: file without iptc-metas
+        """
+        # Rev. 2025-06-11
+        iptc_metas = meta_context['cached_metas'].get('iptc')
+        if not iptc_metas:
+            raise KeyError('iptc')
+        return iptc_metas
+
+    @staticmethod
+    def get_field_indices(fields: qgis._core.QgsFields) -> dict:
+        """field-name to field-index, see extract_file_metas
+        :param fields: fields of the layer/feature
+        :return: dict key: field-name value: field-index
+        """
+        # Rev. 2025-06-11
+        return {field.name(): field_idx for field_idx, field in enumerate(fields)}
+
+    def extract_file_metas(self, posix_path: Path, feature: qgis._core.QgsFeature, field_list: dict, pre_scan_rel_root_dir: str = None, preserve_existing: bool = False, extract_gps_geom: bool = False, tr_wgs_2_vl: qgis._core.QgsCoordinateTransform = None, extracted_metas: dict = None, field_indices: dict = None, gps_points: list = None, stat_metas: os.stat_result = None) -> tuple:
         """
         extract metadata from file to feature
+        expensive metas (hash, exif, iptc, xmp) are restored from the meta-cache if the file is unchanged since the last extraction
         :param posix_path: absolute path to the extracted file
         :param feature: update or insert
         :param field_list: dict key: meta-name value: field-name
@@ -207,6 +830,10 @@ class FileMetaExtractor():
         :param preserve_existing: pre-check existing data/geometry in feature and update only if no existing values found
         :param extract_gps_geom: optional set/update feature-geometry from exif-gps-coords (only jpegs with exif-header containing gps-coords)
         :param tr_wgs_2_vl: transformation from wgs-gps-coords to layer-crs if extract_gps_geom is True
+        :param extracted_metas: optional expensive metas, already read by iter_expensive_metas_threaded
+        :param field_indices: optional dict key: field-name value: field-index, calculated once per scan for all features of the layer, see get_field_indices
+        :param gps_points: optional list, if given the exif-gps-coords are collected as tuple(feature, lon, lat, alt, posix_path) for a later batch-transformation via transform_gps_points instead of transforming each feature-geometry
+        :param stat_metas: optional already fetched stat of posix_path (f.e. from MyTools.scan_files), avoids the stat-syscall(s)
         :return: tuple(extract_ok,feature_altered,extract_log)
         """
         # Rev. 2025-06-11
@@ -217,175 +844,86 @@ class FileMetaExtractor():
         feature_altered = False
         extract_log = []
 
-        if posix_path.is_file():
-            # extract_log.append(f"{tab}extract_file_metas '{posix_path.as_posix()}'")
+        # statistical meta-data (file-size, mTime, cTime, aTime)
+        # os.stat_result(st_mode=33188, st_ino=3579220, st_dev=66306, st_nlink=1, st_uid=1000, st_gid=1000, st_size=5249572, st_atime=1749586047, st_mtime=1719916604, st_ctime=1744744426)
+        # one stat-syscall, None if no regular file
+        if stat_metas is None:
+            stat_metas = MyTools.get_file_stat(posix_path)
 
-            # statistical meta-data (file-size, mTime, cTime, aTime)
-            # os.stat_result(st_mode=33188, st_ino=3579220, st_dev=66306, st_nlink=1, st_uid=1000, st_gid=1000, st_size=5249572, st_atime=1749586047, st_mtime=1719916604, st_ctime=1744744426)
-            stat_metas = posix_path.stat()
+        if stat_metas:
+            # extract_log.append(f"{tab}extract_file_metas '{posix_path.as_posix()}'")
 
-            # extract special metas for image-files and jpeg-exif
-            img = None
-            exif_dict = {}
-            geo_exif_dict = {}
-            lat = lon = alt = direction = None
-            try:
-                # try to open file as image:
-                with Image.open(str(posix_path)) as img:
-                    extract_log.append(f"{tab}{tab}{tab}{tab}file is image")
-                    # optionale exif-Daten
-                    if img.getexif():
-                        extract_log.append(f"{tab}{tab}{tab}{tab}file has exif-header")
-                        geo_exif_dict = {}
-                        exif_dict = {TAGS[k]: v for k, v in img._getexif().items() if k in TAGS and (type(v) in [int, str] or TAGS[k] == 'GPSInfo')}
-                        gps_info_value = exif_dict.get('GPSInfo', None)
-                        if gps_info_value:
-                            geo_exif_dict = {GPSTAGS[k]: v for k, v in gps_info_value.items() if k in GPSTAGS}
-
-                            if geo_exif_dict.get('GPSLatitude'):
-                                lat_tuple = geo_exif_dict.get('GPSLatitude')
-                                if lat_tuple:
-                                    # tuple with three floats: degree, minutes, seconds
-                                    lat = float(lat_tuple[0]) + float(lat_tuple[1]) / 60 + float(lat_tuple[2]) / 3600
-                                    # extract_log.append(f"{tab}{tab}{tab}{tab}{tab}GPSLatitude {lat}")
-
-                            if geo_exif_dict.get('GPSLongitude'):
-                                lon_tuple = geo_exif_dict.get('GPSLongitude')
-                                if lon_tuple:
-                                    # tuple with three floats: degree, minutes, seconds
-                                    lon = float(lon_tuple[0]) + float(lon_tuple[1]) / 60 + float(lon_tuple[2]) / 3600
-                                    # extract_log.append(f"{tab}{tab}{tab}{tab}{tab}GPSLongitude {lon}")
-
-                            if geo_exif_dict.get('GPSAltitude'):
-                                alt = float(geo_exif_dict.get('GPSAltitude'))
-                                # extract_log.append(f"{tab}{tab}{tab}{tab}{tab}GPSAltitude {alt}")
-
-                            if geo_exif_dict.get('GPSImgDirection'):
-                                direction = float(geo_exif_dict.get('GPSImgDirection'))
-                                # extract_log.append(f"{tab}{tab}{tab}{tab}{tab}GPSImgDirection {direction}")
-
-                        if lat is not None and lon is not None:
-                            extract_log.append(f"{tab}{tab}{tab}{tab}file is exif-gps-georeferenced")
-                        else:
-                            extract_log.append(f"{tab}{tab}{tab}{tab}file not georeferenced")
-                    else:
-                        extract_log.append(f"{tab}{tab}{tab}{tab}no exif-header")
-            except:
-                extract_log.append(f"{tab}{tab}{tab}{tab}file is no image")
+            # expensive metas from previous scans of the unchanged file
+            cached_metas = self.read_meta_cache(posix_path, stat_metas)
+            cache_altered = False
+            if cached_metas:
+                extract_log.append(f"{tab}{tab}{tab}{tab}metas restored from cache")
+
+            if extracted_metas:
+                # already read in a worker-thread, see iter_expensive_metas_threaded
+                cached_metas.update(extracted_metas)
+                cache_altered = True
+
+            if field_indices is None:
+                field_indices = self.get_field_indices(feature.fields())
+
+            # values collected by field-index and set together via setAttributes, no name-lookup per assignment
+            attributes = feature.attributes()
+
+            if preserve_existing:
+                # skip the fields with existing values once per feature
+                field_list = {meta_name: field_name for meta_name, field_name in field_list.items() if attributes[field_indices[field_name]] in EMPTY_VALUES}
+
+            # metas, which will be written to the feature, used to decide which expensive metas have to be extracted
+            required_metas = set(field_list)
+
+            requirements = self.get_extract_requirements(cached_metas, required_metas, extract_gps_geom)
+            if any(requirements[:4]):
+                try:
+                    read_metas, read_log = self.read_expensive_metas(posix_path.as_posix(), stat_metas.st_size, self.hash_alg, *requirements)
+                    extract_log += read_log
+                    cached_metas.update(read_metas)
+                    cache_altered = True
+                except Exception as e:
+                    # f.e. file changed or removed since the stat, the expensive metas are not written
+                    extract_ok = False
+                    extract_log.append(f"<b>{tab}{tab}{tab}{tab}⭍ file not readable ({e})</b>")
+
+            image_metas = cached_metas.get('exif', {})
+            lat = image_metas.get('gps_latitude')
+            lon = image_metas.get('gps_longitude')
+            alt = image_metas.get('gps_altitude')
+
+            # context for the meta_handlers
+            meta_context = {
+                'posix_path': posix_path,
+                'stat_metas': stat_metas,
+                'cached_metas': cached_metas,
+                'image_metas': image_metas,
+                'rel_root_dir': pre_scan_rel_root_dir
+            }
 
             for meta_name, field_name in field_list.items():
-
-                if preserve_existing and feature[field_name] not in [qgis.core.NULL, None, '']:
-                    continue
-
-                if meta_name == 'abs_path':
-                    feature[field_name] = posix_path.as_posix()
-                    feature_altered = True
-                elif meta_name == 'rel_path' and pre_scan_rel_root_dir is not None:
+                field_idx = field_indices[field_name]
+                meta_handler = self.meta_handlers.get(meta_name)
+                if meta_handler:
                     try:
-                        # Compute a version of this path relative to the path represented by other. If it’s impossible, ValueError is raised
-                        rel_path = posix_path.relative_to(pre_scan_rel_root_dir)
-                        rel_path = rel_path.parent
-                        feature[field_name] = rel_path.as_posix()
+                        attributes[field_idx] = meta_handler(meta_context)
                         feature_altered = True
-                    except Exception as e:
+                    except (LookupError, ValueError):
+                        # meta not available for this file, f.e. rel_path outside pre_scan_rel_root_dir or image without (geo-)exif-header
                         pass
-                elif meta_name == 'file_name':
-                    feature[field_name] = posix_path.name
-                    feature_altered = True
-                elif meta_name == 'extension':
-                    feature[field_name] = str.lower(posix_path.suffix).lstrip('.')
-                    feature_altered = True
-                elif meta_name == 'file_size':
-                    feature[field_name] = stat_metas.st_size
-                    feature_altered = True
-                elif meta_name == 'file_hash':
-                    feature[field_name] = MyTools.get_file_hash(posix_path, self.hash_alg)
-                    feature_altered = True
-                elif meta_name == 'm_time':
-                    # mtime => Time of most recent content modification
-                    # Datei-auf-Datenträger-Zeit, *nicht* Aufnahmezeit
-                    feature[field_name] = QtCore.QDateTime.fromSecsSinceEpoch(int(stat_metas.st_mtime))
-                    feature_altered = True
-                elif meta_name == 'c_time':
-                    # ctime => create/change-time
-                    feature[field_name] = QtCore.QDateTime.fromSecsSinceEpoch(int(stat_metas.st_ctime))
-                    feature_altered = True
-                elif meta_name == 'a_time':
-                    # atime => access-time
-                    feature[field_name] = QtCore.QDateTime.fromSecsSinceEpoch(int(stat_metas.st_atime))
-                    feature_altered = True
-                elif meta_name == 'xmp_metas':
-                    # xmp-Metadaten
-                    # 'rb' => read binary, vermeidet "Ausnahme: 'utf-8' codec can't decode byte 0xff in position 0: invalid start byte"
-                    with open(str(posix_path), 'rb') as fd:
-                        d = str(fd.read())
-                        xmp_start = d.find('<x:xmpmeta')
-                        xmp_end = d.find('</x:xmpmeta')
-                        xmp_str = d[xmp_start:xmp_end + 12]
-                        # ersetzt die new-lines und tabs durch tatächliche Zeilenumrüche/Tabstops
-                        xmp_metas = xmp_str.replace('\\n', '\n').replace('\\t', '\t')
-
-                        feature[field_name] = xmp_metas
-                        feature_altered = True
-                elif meta_name == 'image_width':
-                    if img:
-                        feature[field_name] = img.width
-                        feature_altered = True
-                elif meta_name == 'image_height' and img:
-                    if img:
-                        feature[field_name] = img.height
-                        feature_altered = True
-                elif meta_name == 'iptc_metas':
-                    if img:
-                        # optionale iptc-Metadaten
-                        iptc = IptcImagePlugin.getiptcinfo(img)
-                        if iptc:
-                            iptc_metas = ''
-                            for iptc_key, iptc_value in iptc.items():
-                                iptc_metas += f"{iptc_key} {iptc_value.decode('utf-8')}\n"
-                            feature[field_name] = iptc_metas
-                            feature_altered = True
-                elif meta_name == 'exif_metas':
-                    if exif_dict:
-                        exif_metas = "Exif-Tags:\n"
-                        for exif_key, exif_value in exif_dict.items():
-                            # einige Inhalte binär
-                            if type(exif_value) in [int, str]:
-                                exif_metas += f"   {exif_key}: {exif_value}\n"
-
-                        if geo_exif_dict:
-                            exif_metas += "Geo-Tags:\n"
-                            for exif_key, exif_value in geo_exif_dict.items():
-                                exif_metas += f"   {exif_key}: {exif_value}\n"
-
-                        feature[field_name] = exif_metas
-                        feature_altered = True
-                elif meta_name == 'date_time_original':
-                    if exif_dict:
-                        feature[field_name] = exif_dict.get('DateTimeOriginal', None)
-                        feature_altered = True
-                elif meta_name == 'gps_latitude':
-                    if geo_exif_dict:
-                        feature[field_name] = lat
-                        feature_altered = True
-                elif meta_name == 'gps_longitude':
-                    if geo_exif_dict:
-                        feature[field_name] = lon
-                        feature_altered = True
-                elif meta_name == 'gps_altitude':
-                    if geo_exif_dict:
-                        feature[field_name] = alt
-                        feature_altered = True
-                elif meta_name == 'gps_img_direction':
-                    if geo_exif_dict:
-                        feature[field_name] = direction
-                        feature_altered = True
                 else:
                     extract_log.append(f"<b>{tab}{tab}{tab}{tab}⭍ meta '{meta_name}' not implemented and ignored</b>")
 
+            if feature_altered:
+                feature.setAttributes(attributes)
+
+            if cache_altered:
+                self.write_meta_cache(posix_path, stat_metas, cached_metas)
+
             # geometry-calculation from exif-GPS
-            if extract_gps_geom and lat is not None and lon is not None and tr_wgs_2_vl:
+            if extract_gps_geom and lat is not None and lon is not None and (tr_wgs_2_vl or gps_points is not None):
                 if feature.hasGeometry() and feature.geometry().isGeosValid() and preserve_existing:
                     # extract_log.append(f"{tab}{tab}{tab}{tab}feature has valid geometry ➞ no geometry-update")
                     pass
@@ -397,8 +935,14 @@ class FileMetaExtractor():
                         geom = qgis._core.QgsGeometry.fromPoint(qgis._core.QgsPoint(lon, lat))
 
                     if geom.isGeosValid():
-                        geom.transform(tr_wgs_2_vl)
-                        feature.setGeometry(geom)
+                        if gps_points is not None:
+                            # geometry set later in transform_gps_points
+                            gps_points.append((feature, lon, lat, alt, posix_path))
+                        else:
+                            # layer-crs EPSG:4326 => no transformation
+                            if not tr_wgs_2_vl.isShortCircuited():
+                                geom.transform(tr_wgs_2_vl)
+                            feature.setGeometry(geom)
                         feature_altered = True
 
                         extract_log.append(f"{tab}{tab}{tab}{tab}geometry updated from exif-gps-metas")
@@ -409,6 +953,51 @@ class FileMetaExtractor():
 
         return extract_ok, feature_altered, extract_log
 
+    @staticmethod
+    def transform_gps_points(gps_points: list, tr_wgs_2_vl: qgis._core.QgsCoordinateTransform) -> list:
+        """batch-transformation of exif-gps-coords collected by extract_file_metas, one transform-call for all points instead of one per feature
+        only x/y are transformed, the altitude is kept, as with the transformation of single QgsPoints
+        if the batch fails (f.e. one bogus out-of-domain exif-coordinate), the points are transformed singly, failing points get no geometry
+        :param gps_points: list of tuple(feature, lon, lat, alt, posix_path), the features get the transformed point-geometries
+        :param tr_wgs_2_vl: transformation from wgs-gps-coords to layer-crs
+        :return: transform_log, problem-lines for the not transformable points
+        """
+        # Rev. 2025-06-11
+        tab = '&nbsp;' * 3
+        transform_log = []
+        if gps_points and tr_wgs_2_vl.isShortCircuited():
+            # layer-crs EPSG:4326 => no transformation
+            tr_points = [qgis._core.QgsPoint(lon, lat) for feature, lon, lat, alt, posix_path in gps_points]
+        elif gps_points:
+            multi_point = qgis._core.QgsMultiPoint()
+            for feature, lon, lat, alt, posix_path in gps_points:
+                multi_point.addGeometry(qgis._core.QgsPoint(lon, lat))
+
+            try:
+                multi_point.transform(tr_wgs_2_vl)
+                tr_points = [multi_point.geometryN(point_idx) for point_idx in range(len(gps_points))]
+            except qgis._core.QgsCsException:
+                tr_points = []
+                for feature, lon, lat, alt, posix_path in gps_points:
+                    tr_point = qgis._core.QgsPoint(lon, lat)
+                    try:
+                        tr_point.transform(tr_wgs_2_vl)
+                        tr_points.append(tr_point)
+                    except qgis._core.QgsCsException as e:
+                        transform_log.append(f"<b>{tab}{tab}'{posix_path.as_posix()}': exif-gps-coords ({lon}, {lat}) not transformable ({e}), no geometry</b>")
+                        tr_points.append(None)
+        else:
+            tr_points = []
+
+        for (feature, lon, lat, alt, posix_path), tr_point in zip(gps_points, tr_points):
+            if tr_point is not None:
+                if alt is not None:
+                    feature.setGeometry(qgis._core.QgsGeometry.fromPoint(qgis._core.QgsPoint(tr_point.x(), tr_point.y(), alt)))
+                else:
+                    feature.setGeometry(qgis._core.QgsGeometry.fromPoint(qgis._core.QgsPoint(tr_point.x(), tr_point.y())))
+
+        return transform_log
+
     def get_extract_field(self, meta_name, field_name: str) -> qgis._core.QgsField:
         """wrapper to create a QgsField for specific meta, used to create table for pre-scan-layer
         :param meta_name: references self.extractable_file_metas
@@ -428,16 +1017,13 @@ class FileMetaExtractor():
         """
         # Rev. 2025-06-11
         if self.pre_scan_widget:
-            qcbs = self.pre_scan_widget.findChildren(QtWidgets.QCheckBox, options=QtCore.Qt.FindChildrenRecursively)
-            for qcb in qcbs:
-                meta_name = qcb.property('meta_name')
-                if meta_name:
-                    extract_meta = self.extractable_file_metas.get(meta_name)
-                    # mandatory fields (abs_path) can't be unchecked
-                    if extract_meta.get('mandatory'):
-                        qcb.setChecked(True)
-                    else:
-                        qcb.setChecked(checked)
+            for meta_name, qcb in self.pre_scan_qcbs.items():
+                extract_meta = self.extractable_file_metas.get(meta_name)
+                # mandatory fields (abs_path) can't be unchecked
+                if extract_meta.get('mandatory'):
+                    qcb.setChecked(True)
+                else:
+                    qcb.setChecked(checked)
 
     def select_pre_scan_rel_root_dir(self, *arg, **kwargs):
         """shows directory-dialog for pre_scan_rel_root_dir, used for rel_path-calculation"""
@@ -471,18 +1057,15 @@ class FileMetaExtractor():
         post_scan_fields = {}
         post_scan_rel_root_dir = ''
         if self.post_scan_widget:
-            for qcb in self.post_scan_widget.findChildren(QtWidgets.QComboBox, options=QtCore.Qt.FindChildrenRecursively):
-                meta_name = qcb.property('meta_name')
-                if meta_name:
-                    field_name = qcb.currentText()
-                    # no check for double-assign
-                    if field_name:
-                        post_scan_fields[meta_name] = field_name
+            for meta_name, qcbx in self.post_scan_qcbxs.items():
+                field_name = qcbx.currentText()
+                # no check for double-assign
+                if field_name:
+                    post_scan_fields[meta_name] = field_name
 
             # relative-root-dir for rel_path-meta from QLineEdit
-            for qle in self.post_scan_widget.findChildren(QtWidgets.QLineEdit, options=QtCore.Qt.FindChildrenRecursively):
-                if qle.property('purpose') == 'post_scan_rel_root_dir':
-                    post_scan_rel_root_dir = qle.text()
+            if self.qle_post_scan_rel_root_dir:
+                post_scan_rel_root_dir = self.qle_post_scan_rel_root_dir.text()
         return post_scan_fields, post_scan_rel_root_dir
 
     def parse_pre_scan_widget(self) -> tuple:
@@ -496,27 +1079,12 @@ class FileMetaExtractor():
         pre_scan_fields = {}
         pre_scan_rel_root_dir = None
         if self.pre_scan_widget:
-            qcbs = self.pre_scan_widget.findChildren(QtWidgets.QCheckBox, options=QtCore.Qt.FindChildrenRecursively)
-            qles = self.pre_scan_widget.findChildren(QtWidgets.QLineEdit, options=QtCore.Qt.FindChildrenRecursively)
-            qcb_dict = {}
-            qle_dict = {}
-
-            for qcb in qcbs:
-                meta_name = qcb.property('meta_name')
-                if meta_name:
-                    qcb_dict[meta_name] = qcb
-
-            for qle in qles:
-                meta_name = qle.property('meta_name')
-                if meta_name:
-                    qle_dict[meta_name] = qle
-
-                if qle.property('purpose') == 'pre_scan_rel_root_dir':
-                    pre_scan_rel_root_dir = qle.text()
+            if self.qle_pre_scan_rel_root_dir:
+                pre_scan_rel_root_dir = self.qle_pre_scan_rel_root_dir.text()
 
-            for meta_name, qcb in qcb_dict.items():
+            for meta_name, qcb in self.pre_scan_qcbs.items():
                 if qcb.isChecked():
-                    field_name = qle_dict[meta_name].text()
+                    field_name = self.pre_scan_qles[meta_name].text()
                     if field_name:
                         pre_scan_fields[meta_name] = field_name
 
@@ -524,6 +1092,7 @@ class FileMetaExtractor():
 
     def get_post_scan_widget(self, post_scan_fields=None, post_scan_layer_id='', post_scan_abs_path_field='', post_scan_rel_root_dir='') -> QtWidgets.QWidget:
         """creates and returns self.post_scan_widget, a table-like widget with Grid-Layout that can be used as selector for extracted meta-data-fields in an existing layer
+        the row-widgets are created once and reused for each new post_scan_widget, only the field-QComboBoxes are refilled
         :param post_scan_fields: current stored post_scan_fields, dictionary meta_name->field_name
         :param post_scan_layer_id: id of post_scan_layer
         :param post_scan_abs_path_field: field containing absolute-path, used to exclude this field as post-scan-target
@@ -534,24 +1103,44 @@ class FileMetaExtractor():
         if post_scan_fields is None:
             post_scan_fields = {}
 
-        int_types = [
-            QtCore.QVariant.Int,
-            QtCore.QVariant.LongLong,
-            QtCore.QVariant.UInt,
-            QtCore.QVariant.ULongLong,
-        ]
+        post_scan_layer = qgis._core.QgsProject.instance().mapLayer(post_scan_layer_id) if post_scan_layer_id else None
+
+        # the field-QComboBoxes depend on the fields of the layer
+        layer_fields_key = tuple((field.name(), field.type()) for field in post_scan_layer.fields()) if post_scan_layer else None
+        cache_key = (post_scan_layer_id, post_scan_abs_path_field, layer_fields_key)
+        if self.post_scan_widget is not None and cache_key == self.post_scan_cache_key:
+            # unchanged inputs: no rebuild, only reset possible user-edits
+            self.reset_post_scan_widget(post_scan_fields, post_scan_rel_root_dir)
+            return self.post_scan_widget
+
+        self.post_scan_cache_key = cache_key
+
+        # detach the reused widgets, the previous post_scan_widget is deleted by setWidget
+        self.detach_widgets(self.post_scan_header_wdgs, self.post_scan_row_wdgs, self.post_scan_rel_root_dir_wdg)
 
         self.post_scan_widget = QtWidgets.QWidget()
-        self.post_scan_widget.setLayout(QtWidgets.QGridLayout())
+        grid = QtWidgets.QGridLayout()
+        self.post_scan_widget.setLayout(grid)
+        # only the rows of the current post_scan_widget
+        self.post_scan_qcbxs = {}
+        self.qle_post_scan_rel_root_dir = None
 
         if post_scan_layer_id:
-            post_scan_layer = qgis._core.QgsProject.instance().mapLayer(post_scan_layer_id)
             if post_scan_layer:
                 sub_row = 0
-                self.post_scan_widget.layout().addWidget(QtWidgets.QLabel('<b>Meta</b>'), sub_row, 1)
-                self.post_scan_widget.layout().addWidget(QtWidgets.QLabel('<b>Fieldname</b>'), sub_row, 2)
-                self.post_scan_widget.layout().addWidget(QtWidgets.QLabel('<b>Type</b>'), sub_row, 3)
-                self.post_scan_widget.layout().addWidget(QtWidgets.QLabel('<b>Description</b>'), sub_row, 4)
+                if not self.post_scan_header_wdgs:
+                    self.post_scan_header_wdgs = [None, QtWidgets.QLabel('<b>Meta</b>'), QtWidgets.QLabel('<b>Fieldname</b>'), QtWidgets.QLabel('<b>Type</b>'), QtWidgets.QLabel('<b>Description</b>')]
+
+                for col, header_wdg in enumerate(self.post_scan_header_wdgs):
+                    if header_wdg:
+                        grid.addWidget(header_wdg, sub_row, col)
+
+                # selectable field-names by field-type, all integer-like types collected under QVariant.Int
+                fields_by_type = {}
+                for field in post_scan_layer.dataProvider().fields():
+                    if field.name() != post_scan_abs_path_field:
+                        type_key = QtCore.QVariant.Int if field.type() in INT_TYPES else field.type()
+                        fields_by_type.setdefault(type_key, []).append(field.name())
 
                 for meta_name, extract_meta in self.extractable_file_metas.items():
                     # not extractable
@@ -560,67 +1149,71 @@ class FileMetaExtractor():
 
                     sub_row += 1
 
-                    self.post_scan_widget.layout().addWidget(QtWidgets.QLabel(meta_name), sub_row, 1)
-
-                    qcbx = QtWidgets.QComboBox()
-                    qcbx.setProperty('meta_name', meta_name)
-                    qcbx.setToolTip('select field for this meta-data')
-
-                    qcbx.addItem('')
-                    for field in post_scan_layer.dataProvider().fields():
-                        if field.name() != post_scan_abs_path_field:
-                            if field.type() == extract_meta.get('field_type') or (field.type() in int_types and extract_meta.get('field_type') in int_types):
-                                qcbx.addItem(field.name())
-
-                    MyTools.qcbx_select_by_value(qcbx, post_scan_fields.get(meta_name))
-
-                    self.post_scan_widget.layout().addWidget(qcbx, sub_row, 2)
+                    if meta_name not in self.post_scan_row_wdgs:
+                        qcbx = QtWidgets.QComboBox()
+                        qcbx.setProperty('meta_name', meta_name)
+                        qcbx.setToolTip('select field for this meta-data')
+                        self.post_scan_row_wdgs[meta_name] = [None, QtWidgets.QLabel(meta_name), qcbx, QtWidgets.QLabel(self.meta_type_names[meta_name]), self.create_description_label(meta_name)]
 
+                    qcbx = self.post_scan_row_wdgs[meta_name][2]
                     field_type = extract_meta.get('field_type')
-                    self.post_scan_widget.layout().addWidget(QtWidgets.QLabel(QtCore.QMetaType.typeName(field_type)), sub_row, 3)
-
-                    description = extract_meta.get('description')
-                    ql = QtWidgets.QLabel()
-                    ql.setOpenExternalLinks(True)
-                    ql.setTextFormat(QtCore.Qt.RichText)
-                    url = extract_meta.get('url')
-                    if url:
-                        description += f" <a href='{url}'>link</a>"
-                        ql.setToolTip(url)
+                    qcbx.clear()
+                    qcbx.addItem('')
+                    qcbx.addItems(fields_by_type.get(QtCore.QVariant.Int if field_type in INT_TYPES else field_type, []))
+                    self.post_scan_qcbxs[meta_name] = qcbx
 
-                    ql.setText(description)
-                    self.post_scan_widget.layout().addWidget(ql, sub_row, 4)
+                    for col, row_wdg in enumerate(self.post_scan_row_wdgs[meta_name]):
+                        if row_wdg:
+                            grid.addWidget(row_wdg, sub_row, col)
 
                     # special meta rel_path, which requires an additional information (root-directory) and gets some extra widgets
                     if meta_name == 'rel_path':
                         sub_row += 1
 
-                        sub_wdg = QtWidgets.QWidget()
-                        sub_wdg.setLayout(QtWidgets.QHBoxLayout())
-                        sub_wdg.setMaximumWidth(400)
-                        sub_wdg.layout().addWidget(QtWidgets.QLabel('relative to: '))
-                        self.qle_post_scan_rel_root_dir = QtWidgets.QLineEdit(self.post_scan_widget)
-                        self.qle_post_scan_rel_root_dir.setText(post_scan_rel_root_dir)
-                        self.qle_post_scan_rel_root_dir.setProperty('purpose', 'post_scan_rel_root_dir')
-                        self.qle_post_scan_rel_root_dir.setReadOnly(True)
-                        self.qle_post_scan_rel_root_dir.setToolTip('root-directory for relative-path')
+                        if not self.post_scan_rel_root_dir_wdg:
+                            sub_wdg = QtWidgets.QWidget()
+                            hbox = QtWidgets.QHBoxLayout()
+                            sub_wdg.setLayout(hbox)
+                            sub_wdg.setMaximumWidth(400)
+                            hbox.addWidget(QtWidgets.QLabel('relative to: '))
+                            qle_post_scan_rel_root_dir = QtWidgets.QLineEdit(sub_wdg)
+                            qle_post_scan_rel_root_dir.setProperty('purpose', 'post_scan_rel_root_dir')
+                            qle_post_scan_rel_root_dir.setReadOnly(True)
+                            qle_post_scan_rel_root_dir.setToolTip('root-directory for relative-path')
+
+                            hbox.addWidget(qle_post_scan_rel_root_dir)
 
-                        sub_wdg.layout().addWidget(self.qle_post_scan_rel_root_dir)
+                            qpb_select_post_scan_rel_root_dir = QtWidgets.QPushButton('...', sub_wdg)
+                            qpb_select_post_scan_rel_root_dir.setToolTip('click to specify root-directory')
+                            qpb_select_post_scan_rel_root_dir.setMaximumWidth(50)
+                            qpb_select_post_scan_rel_root_dir.setCursor(QtCore.Qt.PointingHandCursor)
+                            qpb_select_post_scan_rel_root_dir.pressed.connect(self.select_post_scan_rel_root_dir)
 
-                        qpb_select_post_scan_rel_root_dir = QtWidgets.QPushButton('...', self.post_scan_widget)
-                        qpb_select_post_scan_rel_root_dir.setToolTip('click to specify root-directory')
-                        qpb_select_post_scan_rel_root_dir.setMaximumWidth(50)
-                        qpb_select_post_scan_rel_root_dir.setCursor(QtCore.Qt.PointingHandCursor)
-                        qpb_select_post_scan_rel_root_dir.pressed.connect(self.select_post_scan_rel_root_dir)
+                            hbox.addWidget(qpb_select_post_scan_rel_root_dir)
+                            self.post_scan_rel_root_dir_wdg = (sub_wdg, qle_post_scan_rel_root_dir)
 
-                        sub_wdg.layout().addWidget(qpb_select_post_scan_rel_root_dir)
+                        sub_wdg, self.qle_post_scan_rel_root_dir = self.post_scan_rel_root_dir_wdg
+                        grid.addWidget(sub_wdg, sub_row, 2, 1, 3)
 
-                        self.post_scan_widget.layout().addWidget(sub_wdg, sub_row, 2, 1, 3)
+        self.reset_post_scan_widget(post_scan_fields, post_scan_rel_root_dir)
 
         return self.post_scan_widget
 
+    def reset_post_scan_widget(self, post_scan_fields: dict, post_scan_rel_root_dir: str):
+        """sets the selected fields and texts of the (reused) widgets in self.post_scan_widget
+        :param post_scan_fields: current stored post_scan_fields, dictionary meta_name->field_name
+        :param post_scan_rel_root_dir: root-directory for relative-path-calculation
+        """
+        # Rev. 2025-06-11
+        for meta_name, qcbx in self.post_scan_qcbxs.items():
+            MyTools.qcbx_select_by_value(qcbx, post_scan_fields.get(meta_name))
+
+        if self.qle_post_scan_rel_root_dir:
+            self.qle_post_scan_rel_root_dir.setText(post_scan_rel_root_dir)
+
     def get_pre_scan_widget(self, checked_extract_fields=None, pre_scan_rel_root_dir='') -> QtWidgets.QWidget:
         """creates and returns self.pre_scan_widget, a table-like widget with Grid-Layout that can be used as selector for extracted meta-data-fields in a new layer
+        the widget is created once, each further call only resets check-states and texts
         :param checked_extract_fields: current stored extract_fields, dictionary meta_name->field_name
         :param pre_scan_rel_root_dir: scanned directory
         :returns: QWidget, which will be inserted/replaced in dialog
@@ -629,99 +1222,131 @@ class FileMetaExtractor():
         if checked_extract_fields is None:
             checked_extract_fields = {}
 
+        if self.pre_scan_widget is not None:
+            # the structure of the pre_scan_widget depends only on extractable_file_metas: no rebuild, only reset possible user-edits
+            self.reset_pre_scan_widget(checked_extract_fields, pre_scan_rel_root_dir)
+            return self.pre_scan_widget
+
         self.pre_scan_widget = QtWidgets.QWidget()
-        self.pre_scan_widget.setLayout(QtWidgets.QGridLayout())
+        grid = QtWidgets.QGridLayout()
+        self.pre_scan_widget.setLayout(grid)
 
         sub_row = 0
-        qcb_select_all_metas = QtWidgets.QCheckBox()
-        qcb_select_all_metas.toggled.connect(self.toggle_check_boxes)
-        qcb_select_all_metas.setToolTip('Select all Fields')
-        self.pre_scan_widget.layout().addWidget(qcb_select_all_metas, sub_row, 0)
-        self.pre_scan_widget.layout().addWidget(QtWidgets.QLabel('<b>Meta</b>'), sub_row, 1)
-        self.pre_scan_widget.layout().addWidget(QtWidgets.QLabel('<b>Fieldname</b>'), sub_row, 2)
-        self.pre_scan_widget.layout().addWidget(QtWidgets.QLabel('<b>Type</b>'), sub_row, 3)
-        self.pre_scan_widget.layout().addWidget(QtWidgets.QLabel('<b>Description</b>'), sub_row, 4)
+        self.qcb_pre_scan_select_all = QtWidgets.QCheckBox()
+        self.qcb_pre_scan_select_all.toggled.connect(self.toggle_check_boxes)
+        self.qcb_pre_scan_select_all.setToolTip('Select all Fields')
+
+        for col, header_wdg in enumerate([self.qcb_pre_scan_select_all, QtWidgets.QLabel('<b>Meta</b>'), QtWidgets.QLabel('<b>Fieldname</b>'), QtWidgets.QLabel('<b>Type</b>'), QtWidgets.QLabel('<b>Description</b>')]):
+            grid.addWidget(header_wdg, sub_row, col)
 
         for meta_name, extract_meta in self.extractable_file_metas.items():
             sub_row += 1
+
             qcb = QtWidgets.QCheckBox()
             qcb.setProperty('meta_name', meta_name)
             if extract_meta.get('mandatory'):
-                qcb.setChecked(True)
                 qcb.setDisabled(True)
 
-            if meta_name in checked_extract_fields:
-                qcb.setChecked(True)
-
-            self.pre_scan_widget.layout().addWidget(qcb, sub_row, 0)
-            self.pre_scan_widget.layout().addWidget(QtWidgets.QLabel(meta_name), sub_row, 1)
-
             qle = QtWidgets.QLineEdit()
             qle.setProperty('meta_name', meta_name)
-
-            if meta_name in checked_extract_fields:
-                qle.setText(checked_extract_fields.get(meta_name))
-            else:
-                qle.setText(extract_meta.get('default_field_name'))
-
             qle.setMinimumWidth(100)
             qle.setToolTip('unique field-name for this meta-data')
-            self.pre_scan_widget.layout().addWidget(qle, sub_row, 2)
-
-            field_type = extract_meta.get('field_type')
-            self.pre_scan_widget.layout().addWidget(QtWidgets.QLabel(QtCore.QMetaType.typeName(field_type)), sub_row, 3)
 
-            description = extract_meta.get('description')
-            ql = QtWidgets.QLabel()
-            ql.setOpenExternalLinks(True)
-            ql.setTextFormat(QtCore.Qt.RichText)
-            url = extract_meta.get('url')
-            if url:
-                description += f" <a href='{url}'>link</a>"
-                ql.setToolTip(url)
+            self.pre_scan_qcbs[meta_name] = qcb
+            self.pre_scan_qles[meta_name] = qle
 
-            ql.setText(description)
-            self.pre_scan_widget.layout().addWidget(ql, sub_row, 4)
+            for col, row_wdg in enumerate([qcb, QtWidgets.QLabel(meta_name), qle, QtWidgets.QLabel(self.meta_type_names[meta_name]), self.create_description_label(meta_name)]):
+                grid.addWidget(row_wdg, sub_row, col)
 
             # special meta rel_path, which requires an additional information (root-directory) and gets some extra widgets
             if meta_name == 'rel_path':
                 sub_row += 1
 
                 sub_wdg = QtWidgets.QWidget()
-                sub_wdg.setLayout(QtWidgets.QHBoxLayout())
+                hbox = QtWidgets.QHBoxLayout()
+                sub_wdg.setLayout(hbox)
                 sub_wdg.setMaximumWidth(400)
-                sub_wdg.layout().addWidget(QtWidgets.QLabel('relative to: '))
-                self.qle_pre_scan_rel_root_dir = QtWidgets.QLineEdit(self.pre_scan_widget)
-                self.qle_pre_scan_rel_root_dir.setText(pre_scan_rel_root_dir)
+                hbox.addWidget(QtWidgets.QLabel('relative to: '))
+                self.qle_pre_scan_rel_root_dir = QtWidgets.QLineEdit(sub_wdg)
                 self.qle_pre_scan_rel_root_dir.setProperty('purpose', 'pre_scan_rel_root_dir')
                 self.qle_pre_scan_rel_root_dir.setReadOnly(True)
                 self.qle_pre_scan_rel_root_dir.setToolTip('root-directory for relative-path')
 
-                sub_wdg.layout().addWidget(self.qle_pre_scan_rel_root_dir)
+                hbox.addWidget(self.qle_pre_scan_rel_root_dir)
 
-                qpb_select_pre_scan_rel_root_dir = QtWidgets.QPushButton('...', self.pre_scan_widget)
+                qpb_select_pre_scan_rel_root_dir = QtWidgets.QPushButton('...', sub_wdg)
                 qpb_select_pre_scan_rel_root_dir.setToolTip('click to specify root-directory')
                 qpb_select_pre_scan_rel_root_dir.setMaximumWidth(50)
                 qpb_select_pre_scan_rel_root_dir.setCursor(QtCore.Qt.PointingHandCursor)
                 qpb_select_pre_scan_rel_root_dir.pressed.connect(self.select_pre_scan_rel_root_dir)
 
-                sub_wdg.layout().addWidget(qpb_select_pre_scan_rel_root_dir)
+                hbox.addWidget(qpb_select_pre_scan_rel_root_dir)
 
-                self.pre_scan_widget.layout().addWidget(sub_wdg, sub_row, 2, 1, 3)
+                grid.addWidget(sub_wdg, sub_row, 2, 1, 3)
+
+        self.reset_pre_scan_widget(checked_extract_fields, pre_scan_rel_root_dir)
 
         return self.pre_scan_widget
 
+    def reset_pre_scan_widget(self, checked_extract_fields: dict, pre_scan_rel_root_dir: str):
+        """sets check-states and texts of the (reused) widgets in self.pre_scan_widget
+        :param checked_extract_fields: current stored extract_fields, dictionary meta_name->field_name
+        :param pre_scan_rel_root_dir: scanned directory
+        """
+        # Rev. 2025-06-11
+        # reset without toggle_check_boxes
+        self.qcb_pre_scan_select_all.blockSignals(True)
+        self.qcb_pre_scan_select_all.setChecked(False)
+        self.qcb_pre_scan_select_all.blockSignals(False)
+
+        for meta_name, extract_meta in self.extractable_file_metas.items():
+            self.pre_scan_qcbs[meta_name].setChecked(bool(extract_meta.get('mandatory')) or meta_name in checked_extract_fields)
+
+            if meta_name in checked_extract_fields:
+                self.pre_scan_qles[meta_name].setText(checked_extract_fields.get(meta_name))
+            else:
+                self.pre_scan_qles[meta_name].setText(extract_meta.get('default_field_name'))
+
+        if self.qle_pre_scan_rel_root_dir:
+            self.qle_pre_scan_rel_root_dir.setText(pre_scan_rel_root_dir)
+
+    def create_description_label(self, meta_name: str) -> QtWidgets.QLabel:
+        """QLabel with description and optional link for a meta, used in pre- and post-scan-widget
+        :param meta_name: key in extractable_file_metas
+        :returns: QLabel
+        """
+        # Rev. 2025-06-11
+        ql = QtWidgets.QLabel()
+        ql.setOpenExternalLinks(True)
+        ql.setTextFormat(QtCore.Qt.RichText)
+        url = self.extractable_file_metas[meta_name].get('url')
+        if url:
+            ql.setToolTip(url)
+
+        ql.setText(self.meta_description_htmls[meta_name])
+        return ql
+
+    @staticmethod
+    def detach_widgets(header_wdgs: list, row_wdgs: dict, rel_root_dir_wdg):
+        """detach reused widgets from their parent before this parent-widget is deleted, see get_post_scan_widget
+        :param header_wdgs: list of widgets (or None)
+        :param row_wdgs: dict key: meta_name value: list of widgets (or None)
+        :param rel_root_dir_wdg: widget, tuple(widget, ...) or None
+        """
+        # Rev. 2025-06-11
+        if isinstance(rel_root_dir_wdg, tuple):
+            rel_root_dir_wdg = rel_root_dir_wdg[0]
+
+        for wdg in header_wdgs + [row_wdg for row in row_wdgs.values() for row_wdg in row] + [rel_root_dir_wdg]:
+            if wdg:
+                wdg.setParent(None)
+
 
 class StoredSettings:
     """Python-Class with properties used to store the user-defined FileSync-settings
-    properties must be converted to strings when stored in ini-File"""
+    properties must be json-serializable, they are stored in json-File"""
 
     # Rev. 2025-06-11
-    _str_props = [
-        'pre_scan_dir',
-        'pre_scan_epsg',
-        'pre_scan_patterns'
-    ]
 
     def __init__(self):
         """constructor"""
@@ -732,8 +1357,10 @@ class StoredSettings:
         self.pre_scan_epsg = ''
         self.pre_scan_patterns = ''
         self.pre_scan_sub_dirs = True
+        # extract the expensive metas parallel: '' => sequential, 'threads' => thread-pipeline
+        self.pre_scan_parallel = ''
         self.pre_scan_rel_root_dir = ''
-        # dictionary meta_name -> field_name for pre-scan-table, will be stored in ini
+        # dictionary meta_name -> field_name for pre-scan-table, will be stored in json-file
         self.pre_scan_fields = {}
 
         # Sync-Settings
@@ -756,22 +1383,24 @@ class StoredSettings:
         self.post_scan_rel_root_dir = ''
         self.post_scan_preserve_existing = False
         self.post_scan_update_geometry_from_exif = False
-        # dictionary meta_name -> field_name for post-scan-table, will be joined and stored in ini
+        # see pre_scan_parallel
+        self.post_scan_parallel = ''
+        # dictionary meta_name -> field_name for post-scan-table, will be stored in json-file
         self.post_scan_fields = {}
 
+        # Log-Settings
+        # log each file/feature, else only problems and summaries
+        self.verbose_log = False
+
+        # property-names for __str__, once per class, all properties are set above
+        if '_prop_names' not in type(self).__dict__:
+            type(self)._prop_names = tuple(sorted(prop for prop in self.__dict__ if not prop.startswith('_')))
+            type(self)._prop_len = max(len(prop) for prop in type(self)._prop_names)
+
     def __str__(self):
         """stringify, implemented for debug-purpose"""
         # Rev. 2025-06-11
-        result_str = ''
-        property_list = [prop for prop in dir(self) if not prop.startswith('_') and not callable(getattr(self, prop))]
-
-        longest_prop = max(property_list, key=len)
-        max_len = len(longest_prop)
-
-        for prop in property_list:
-            result_str += f"{prop:<{max_len}}    {getattr(self, prop)}\n"
-
-        return result_str
+        return ''.join(f"{prop:<{self._prop_len}}    {getattr(self, prop)}\n" for prop in self._prop_names)
 
 
 class FileSync(object):
@@ -786,6 +1415,12 @@ class FileSync(object):
     # sys_* => system functions
     # tool_* => auxiliary functions
 
+    # threads for the file-copies in s_start_sync, I/O-bound, more than a few only compete for the same disk
+    sync_copy_max_workers = min(8, (os.cpu_count() or 1) + 4)
+
+    # s_start_sync: duplicate target-features deleted with one deleteFeatures-call per batch, new features without duplicate-check inserted with one addFeatures-call per batch
+    sync_edit_batch_size = 500
+
     def __init__(self, iface: qgis.gui.QgisInterface):
         """standard-to-implement-function for plugins, Constructor for the Plugin.
         Triggered
@@ -799,11 +1434,14 @@ class FileSync(object):
         self.file_sync_toolbar = None
         self.qact_open_dialog = None
         self.qact_show_help = None
+        # see tool_get_help_url
+        self.help_url = None
+        # tuple(layer_id, field_idx) with attribute-index created by s_start_sync, once per session
+        self.attribute_indexed_fields = set()
 
+        self.json_storage_file_name = '.QGis_FileSync_Plugin.json'
+        # settings-file of previous versions, read once for migration
         self.ini_storage_file_name = '.QGis_FileSync_Plugin.ini'
-        # delimiter-string for key-value-contents in ini-file, special character-combination, that should not be used in layer- or field-names
-        # note: avoid '%', which raises configparser "invalid interpolation syntax"
-        self.ini_delimiter = '|◁=▷|'
 
         # filled on sys_restore_settings, appended to log_history and shown with first dlg_init
         self.restore_settings_log = []
@@ -811,33 +1449,60 @@ class FileSync(object):
         # all necessary settings
         self.stored_settings = StoredSettings()
 
-        # restore settings from last usage (ini-file)
+        # restore settings from last usage (json-file, migrated from ini-file of previous versions)
         self.sys_restore_settings()
 
         # store signal-slot-connections for later remove
         self.project_connections = []
 
-        # history of log-messages
+        # history of log-messages, each entry the list of log-lines of one process
         self.log_history = []
 
         # index of current show log for scroll-functionality
         self.crt_log_idx = 0
 
+        # index of the log currently rendered in qte_log, None => qte_log outdated, see dlg_show_log
+        self.shown_log_idx = None
+
+        # key: setting-name of the layer-id value: tuple(layer_id, layer), see tool_get_checked_layer
+        self.checked_layers = {}
+
         # connect some signals in project to register TOC-changes (especially layersRemoved)
         # Note: legendLayersAdded instead of layersAdded because "Emitted, when a layer was added to the registry and the legend"
         # and legend-refresh uses QgsProject.instance().layerTreeRoot and not QgsProject.instance().mapLayers
         self.project_connections.append(qgis._core.QgsProject.instance().legendLayersAdded.connect(self.sys_project_legendLayersAdded, QtCore.Qt.UniqueConnection))
         self.project_connections.append(qgis._core.QgsProject.instance().layersRemoved.connect(self.sys_project_layersRemoved, QtCore.Qt.UniqueConnection))
+        # before the layers are deleted, the cached layer-objects must not be used afterwards
+        self.project_connections.append(qgis._core.QgsProject.instance().layersWillBeRemoved.connect(self.sys_project_layersWillBeRemoved, QtCore.Qt.UniqueConnection))
 
         # identifier for two QgsAction
         self.georef_act_id = QtCore.QUuid('{fa3440e3-0464-431b-9c41-945d46433153}')
         self.show_file_act_id = QtCore.QUuid('{fa3440e3-0464-431b-9c41-945d46433154}')
 
-        self.hash_alg = 'sha1'
+        # 'blake3' or 'blake2b' if the optional package blake3 is not installed
+        self.hash_alg = MyTools.resolve_hash_alg('blake3')
+
+        # lazy, created on first usage, see properties file_meta_extractor and digitize_map_tool
+        # => no costs for QGis-start, if the plugin is not used in the session
+        self._file_meta_extractor = None
+        self._digitize_map_tool = None
 
-        self.file_meta_extractor = FileMetaExtractor(self.hash_alg)
+    @property
+    def file_meta_extractor(self) -> FileMetaExtractor:
+        """FileMetaExtractor, created on first usage (dialog or scan)"""
+        # Rev. 2025-06-11
+        if self._file_meta_extractor is None:
+            self._file_meta_extractor = FileMetaExtractor(self.hash_alg)
+        return self._file_meta_extractor
 
-        self.digitize_map_tool = FeatureDigitizeMapTool(iface)
+    @property
+    def digitize_map_tool(self) -> FeatureDigitizeMapTool:
+        """FeatureDigitizeMapTool, created on first usage
+        Note: used by the QgsActions via qgis.utils.plugins['FileSync'], so possibly without opened dialog"""
+        # Rev. 2025-06-11
+        if self._digitize_map_tool is None:
+            self._digitize_map_tool = FeatureDigitizeMapTool(self.iface)
+        return self._digitize_map_tool
 
     def initGui(self):
         """"standard-to-implement-function: adapt/extend GUI
@@ -867,38 +1532,58 @@ class FileSync(object):
         self.iface.addPluginToMenu('FileSync', self.qact_show_help)
         self.qact_show_help.setToolTip('Show help (requires internet-connection)')
 
-    def tool_show_help(self):
-        """display help
-        previous version used local documentation included in Plugin
-        since version 2.0.1 no local helpfiles but use htmlpreview.github.io
+    def tool_get_help_url(self) -> str:
+        """language-dependend help-url, resolved on first call
+        Note: QGis applies a changed locale only after restart, so constant for the session
+        :returns: url of the english or german documentation
         """
-        # Rev. 2024-11-02
-        if QtCore.QSettings().value('locale/overrideFlag', type=bool):
-            lcid = QtCore.QSettings().value('locale/userLocale', 'en_US')
-        else:
-            # take settings from system-locale, independent from current app
-            lcid = QtCore.QLocale.system().name()
+        # Rev. 2025-06-11
+        if self.help_url is None:
+            if QtCore.QSettings().value('locale/overrideFlag', type=bool):
+                lcid = QtCore.QSettings().value('locale/userLocale', 'en_US')
+            else:
+                # take settings from system-locale, independent from current app
+                lcid = QtCore.QLocale.system().name()
+
+            # lcid is a string composed of language, underscore and country
+            # for the translation the language is sufficient:
+            # 'de_DE', 'de_AT', 'de_CH', 'de_BE', 'de_LI'... -> 'de'
+            # 'en_US', 'en_GB'... -> 'en'
+            lcid_language = lcid[0:2]
 
-        # lcid is a string composed of language, underscore and country
-        # for the translation the language is sufficient:
-        # 'de_DE', 'de_AT', 'de_CH', 'de_BE', 'de_LI'... -> 'de'
-        # 'en_US', 'en_GB'... -> 'en'
-        lcid_language = lcid[0:2]
+            self.help_url = 'https://htmlpreview.github.io/?https://github.com/Ludwig-K/QGisFileSync/blob/main/docs/index.en.html'
 
-        help_url = 'https://htmlpreview.github.io/?https://github.com/Ludwig-K/QGisFileSync/blob/main/docs/index.en.html'
+            if lcid_language == 'de':
+                self.help_url = 'https://htmlpreview.github.io/?https://github.com/Ludwig-K/QGisFileSync/blob/main/docs/index.de.html'
 
-        if lcid_language == 'de':
-            help_url = 'https://htmlpreview.github.io/?https://github.com/Ludwig-K/QGisFileSync/blob/main/docs/index.de.html'
+        return self.help_url
 
-        webbrowser.open(help_url, new=2)
+    def tool_show_help(self):
+        """display help
+        previous version used local documentation included in Plugin
+        since version 2.0.1 no local helpfiles but use htmlpreview.github.io
+        """
+        # Rev. 2025-06-11
+        webbrowser.open(self.tool_get_help_url(), new=2)
 
     def sys_project_legendLayersAdded(self):
         """triggered by qgis._core.QgsProject.instance().legendLayersAdded
-        nearly the same as layersAdded"""
+        nearly the same as layersAdded
+        refresh delayed, several signals in the same event-loop-cycle (f.e. multiple layers added one-by-one) result in one refresh"""
         # Rev. 2025-06-11
-        self.dlg_refresh_sync_layers()
-        self.dlg_refresh_post_scan_layers()
-        self.dlg_refresh_layer_action_layers()
+        if self.my_dialog:
+            self.tmr_refresh_layers.start(0)
+
+    def sys_project_layersWillBeRemoved(self, removed_layer_ids: typing.Iterable[str]):
+        """triggered by qgis._core.QgsProject.instance().layersWillBeRemoved
+        removes the layers from the cache of tool_get_checked_layer
+        :param removed_layer_ids: List of layer-IDs
+        """
+        # Rev. 2025-06-11
+        removed_layer_ids = set(removed_layer_ids)
+        for setting_name, (layer_id, layer) in list(self.checked_layers.items()):
+            if layer_id in removed_layer_ids:
+                del self.checked_layers[setting_name]
 
     def sys_project_layersRemoved(self, removed_layer_ids: typing.Iterable[str]):
         """triggered by qgis._core.QgsProject.instance().layersRemoved
@@ -908,22 +1593,26 @@ class FileSync(object):
         """
         # Rev. 2025-06-11
 
-        for layer_id in removed_layer_ids:
-            # a check against derived layer after delete raises
-            # => RuntimeError: wrapped C/C++ object of type QgsVectorLayer has been deleted.
-
-            if layer_id == self.stored_settings.sync_source_layer_id:
-                self.stored_settings.sync_source_layer_id = ''
-
-            if layer_id == self.stored_settings.sync_target_layer_id:
-                self.stored_settings.sync_target_layer_id = ''
+        # a check against derived layer after delete raises
+        # => RuntimeError: wrapped C/C++ object of type QgsVectorLayer has been deleted.
+        # so only the stored ids are checked, three set-lookups instead of a loop over all removed layers (project-close)
+        removed_layer_ids = set(removed_layer_ids)
+        for setting_name in ('sync_source_layer_id', 'sync_target_layer_id', 'post_scan_layer_id'):
+            if getattr(self.stored_settings, setting_name) in removed_layer_ids:
+                setattr(self.stored_settings, setting_name, '')
 
-            if layer_id == self.stored_settings.post_scan_layer_id:
-                self.stored_settings.post_scan_layer_id = ''
+        # immediately, the layer-selectors must not show deleted layers
+        self.dlg_refresh_layers()
 
-        self.dlg_refresh_post_scan_layers()
-        self.dlg_refresh_sync_layers()
-        self.dlg_refresh_layer_action_layers()
+    def dlg_refresh_layers(self):
+        """refreshes all layer-selectors in dialog, see sys_project_legendLayersAdded and sys_project_layersRemoved"""
+        # Rev. 2025-06-11
+        if self.my_dialog:
+            # pending delayed refresh is obsolete
+            self.tmr_refresh_layers.stop()
+            self.dlg_refresh_post_scan_layers()
+            self.dlg_refresh_sync_layers()
+            self.dlg_refresh_layer_action_layers()
 
     def dlg_init(self):
         """initializes on first call or opens previously closed dialog"""
@@ -944,7 +1633,7 @@ class FileSync(object):
             self.my_dialog.setFloating(True)
 
             # signal/slot-connections
-            # self.my_dialog.tbw_central.currentChanged.connect(self.dlg_tbw_central_changed)
+            self.my_dialog.tbw_central.currentChanged.connect(self.dlg_show_log)
 
             # PreScan
             self.my_dialog.qpb_select_pre_scan_dir.pressed.connect(self.scc_select_pre_scan_dir)
@@ -972,9 +1661,9 @@ class FileSync(object):
             self.my_dialog.qcb_sync_target_abs_path_field.currentIndexChanged.connect(self.scc_select_sync_target_abs_path_field)
             self.my_dialog.qcb_sync_existing_file_mode.currentIndexChanged.connect(self.scc_select_sync_existing_file_mode)
             self.my_dialog.qcb_sync_existing_feature_mode.currentIndexChanged.connect(self.scc_select_sync_existing_feature_mode)
-            self.my_dialog.qrb_sync_file_mode_keep.toggled.connect(self.scc_qrb_sync_file_mode_keep_toggled)
-            self.my_dialog.qrb_sync_file_mode_copy.toggled.connect(self.scc_qrb_sync_file_mode_copy_toggled)
-            self.my_dialog.qcb_sync_update_geometries.toggled.connect(self.scc_qcb_sync_update_geometries_toggled)
+            self.my_dialog.qrb_sync_file_mode_keep.toggled.connect(self.scc_get_mode_setter('sync_file_mode', 'keep', self.dlg_show_sync_mode))
+            self.my_dialog.qrb_sync_file_mode_copy.toggled.connect(self.scc_get_mode_setter('sync_file_mode', 'copy', self.dlg_show_sync_mode))
+            self.my_dialog.qcb_sync_update_geometries.toggled.connect(self.scc_get_bool_setter('sync_update_geometries'))
             self.my_dialog.qpb_start_sync.clicked.connect(self.s_start_sync)
 
             # PostScan
@@ -982,14 +1671,16 @@ class FileSync(object):
             self.my_dialog.qpb_refresh_post_scan_layer.clicked.connect(self.dlg_refresh_post_scan_layers)
             self.my_dialog.qcbn_post_scan_layer.currentIndexChanged.connect(self.scc_select_post_scan_layer)
             self.my_dialog.qcb_post_scan_abs_path_field.currentIndexChanged.connect(self.scc_select_post_scan_abs_path_field)
-            self.my_dialog.qcb_post_scan_preserve_existing.toggled.connect(self.scc_qcb_post_scan_preserve_existing_toggled)
-            self.my_dialog.qcb_post_scan_update_geometry_from_exif.toggled.connect(self.scc_qcb_post_scan_update_geometry_from_exif)
+            self.my_dialog.qcb_post_scan_preserve_existing.toggled.connect(self.scc_get_bool_setter('post_scan_preserve_existing'))
+            self.my_dialog.qcb_post_scan_update_geometry_from_exif.toggled.connect(self.scc_get_bool_setter('post_scan_update_geometry_from_exif'))
 
             # Log
             self.my_dialog.qpb_start_post_scan.clicked.connect(self.s_start_post_scan)
             self.my_dialog.qpb_skip_log_back.clicked.connect(self.dlg_skip_log_back)
             self.my_dialog.qpb_skip_log_for.clicked.connect(self.dlg_skip_log_for)
             self.my_dialog.qpb_clear_log.clicked.connect(self.dlg_clear_log)
+            self.my_dialog.qcb_verbose_log.setChecked(self.stored_settings.verbose_log)
+            self.my_dialog.qcb_verbose_log.toggled.connect(self.scc_get_bool_setter('verbose_log'))
 
             # LayerActions
             self.my_dialog.qcbn_layer_action_layer.currentIndexChanged.connect(self.dlg_refresh_layer_action_fields)
@@ -997,6 +1688,17 @@ class FileSync(object):
             self.my_dialog.qpb_add_layer_actions.clicked.connect(self.s_add_layer_actions)
             self.my_dialog.qpb_remove_layer_actions.clicked.connect(self.s_remove_layer_actions)
 
+            # delayed column-resize after the dialog-layout is done, one reused single-shot-timer
+            # => repeated start() while pending only restarts the timer, one resize
+            self.tmr_resize_sync_cols = QtCore.QTimer(self.my_dialog)
+            self.tmr_resize_sync_cols.setSingleShot(True)
+            self.tmr_resize_sync_cols.timeout.connect(self.dlg_resize_sync_cols)
+
+            # coalesced refresh of the layer-selectors, see sys_project_legendLayersAdded
+            self.tmr_refresh_layers = QtCore.QTimer(self.my_dialog)
+            self.tmr_refresh_layers.setSingleShot(True)
+            self.tmr_refresh_layers.timeout.connect(self.dlg_refresh_layers)
+
             # restore-settings is called *before* dialog is initialized, so delayed show of restore_settings_log
             self.tool_append_to_log_history(self.restore_settings_log, False)
 
@@ -1018,20 +1720,19 @@ class FileSync(object):
             self.my_dialog.qle_pre_scan_epsg.setText(self.stored_settings.pre_scan_epsg)
             self.my_dialog.qle_pre_scan_patterns.setText(self.stored_settings.pre_scan_patterns)
             self.my_dialog.qcb_pre_scan_sub_dirs.setChecked(self.stored_settings.pre_scan_sub_dirs)
+            MyTools.qcbx_select_by_value(self.my_dialog.qcb_pre_scan_parallel, self.stored_settings.pre_scan_parallel, QtCore.Qt.UserRole)
             self.file_meta_extractor.get_pre_scan_widget(self.stored_settings.pre_scan_fields, self.stored_settings.pre_scan_rel_root_dir)
             self.my_dialog.qsa_pre_scan.setWidget(self.file_meta_extractor.pre_scan_widget)
 
         if 'SYNC_SETTINGS' in use_cases:
+            # includes dlg_refresh_sync_source_fields and dlg_refresh_sync_target_fields
             self.dlg_refresh_sync_layers()
             self.dlg_refresh_qtw_sync_mappings()
-            self.dlg_refresh_sync_source_fields()
-            self.dlg_refresh_sync_target_fields()
             self.my_dialog.qle_sync_target_dir.setText(self.stored_settings.sync_target_dir)
             self.dlg_show_sync_mode()
-            self.my_dialog.qcb_sync_update_geometries.setChecked(self.stored_settings.sync_update_geometries)
-            self.tmr_resize_sync_cols = QtCore.QTimer()
-            self.tmr_resize_sync_cols.timeout.connect(self.dlg_resize_sync_cols)
-            self.tmr_resize_sync_cols.setSingleShot(True)
+            # signals blocked: the toggled-slots would only write back the just restored values
+            with QtCore.QSignalBlocker(self.my_dialog.qcb_sync_update_geometries):
+                self.my_dialog.qcb_sync_update_geometries.setChecked(self.stored_settings.sync_update_geometries)
             self.tmr_resize_sync_cols.start(200)
             MyTools.qcbx_select_by_value(self.my_dialog.qcb_sync_existing_file_mode, self.stored_settings.sync_existing_file_mode, QtCore.Qt.UserRole)
             MyTools.qcbx_select_by_value(self.my_dialog.qcb_sync_existing_feature_mode, self.stored_settings.sync_existing_feature_mode, QtCore.Qt.UserRole)
@@ -1041,8 +1742,10 @@ class FileSync(object):
         if 'POST_SCAN_SETTINGS' in use_cases:
             self.dlg_refresh_post_scan_layers()
             self.dlg_refresh_post_scan_layer_fields()
-            self.my_dialog.qcb_post_scan_preserve_existing.setChecked(self.stored_settings.post_scan_preserve_existing)
-            self.my_dialog.qcb_post_scan_update_geometry_from_exif.setChecked(self.stored_settings.post_scan_update_geometry_from_exif)
+            with QtCore.QSignalBlocker(self.my_dialog.qcb_post_scan_preserve_existing), QtCore.QSignalBlocker(self.my_dialog.qcb_post_scan_update_geometry_from_exif):
+                self.my_dialog.qcb_post_scan_preserve_existing.setChecked(self.stored_settings.post_scan_preserve_existing)
+                self.my_dialog.qcb_post_scan_update_geometry_from_exif.setChecked(self.stored_settings.post_scan_update_geometry_from_exif)
+            MyTools.qcbx_select_by_value(self.my_dialog.qcb_post_scan_parallel, self.stored_settings.post_scan_parallel, QtCore.Qt.UserRole)
             self.file_meta_extractor.get_post_scan_widget(self.stored_settings.post_scan_fields, self.stored_settings.post_scan_layer_id, self.stored_settings.post_scan_abs_path_field, self.stored_settings.post_scan_rel_root_dir)
             self.my_dialog.qsa_post_scan.setWidget(self.file_meta_extractor.post_scan_widget)
 
@@ -1050,65 +1753,60 @@ class FileSync(object):
         """tricky: QGridLayout-align the qlw_sync_source_layer_fields and qlw_sync_target_layer_fields (no columnSpan) of the with the contents of qtw_sync_mappings (columnSpan 4)"""
         # Rev. 2025-06-11
         # the two widgets in grid_container_wdg above qtw_sync_mappings:
-        col_width_0 = self.my_dialog.qlw_sync_source_layer_fields.geometry().width()
-        col_width_1 = self.my_dialog.qlw_sync_target_layer_fields.geometry().width()
+        col_width_0 = self.my_dialog.qlw_sync_source_layer_fields.width()
+        col_width_1 = self.my_dialog.qlw_sync_target_layer_fields.width()
+        col_width_sum = col_width_0 + col_width_1
+        if not col_width_sum:
+            # not yet layouted
+            return
 
-        # relative width:
-        col_width_0_rel = col_width_0 / (col_width_0 + col_width_1)
-        col_width_1_rel = col_width_1 / (col_width_0 + col_width_1)
+        qtw_sync_mappings = self.my_dialog.qtw_sync_mappings
 
         # qtw_sync_mappings-width - 20px row-header -15 px arrow - 30 px delete
-        qtw_available_width = self.my_dialog.qtw_sync_mappings.geometry().width() - 65
+        # relative to col_width_sum
+        qtw_available_factor = (qtw_sync_mappings.width() - 65) / col_width_sum
 
         # proportionally distibuted:
-        self.my_dialog.qtw_sync_mappings.setColumnWidth(0, int(col_width_0_rel * qtw_available_width))
+        qtw_sync_mappings.setColumnWidth(0, int(col_width_0 * qtw_available_factor))
         # arrow:
         # self.my_dialog.qtw_sync_mappings.setColumnWidth(1, 15)
-        self.my_dialog.qtw_sync_mappings.setColumnWidth(2, int(col_width_1_rel * qtw_available_width))
+        qtw_sync_mappings.setColumnWidth(2, int(col_width_1 * qtw_available_factor))
         # delete:
         # self.my_dialog.qtw_sync_mappings.setColumnWidth(2, 30)
 
-    def scc_qrb_sync_file_mode_keep_toggled(self, checked):
-        """sync_file_mode is symbolized in dialog with two radio-buttons
-        dependend on sync_file_mode some areas of the dialog will get disabled
-        additionally parsed by dlg_parse_settings"""
-        # Rev. 2025-06-11
-        if checked:
-            self.stored_settings.sync_file_mode = 'keep'
-        self.dlg_show_sync_mode()
-
-    def scc_qrb_sync_file_mode_copy_toggled(self, checked):
-        """sync_file_mode is symbolized in dialog with two radio-buttons
-        dependend on sync_file_mode some areas of the dialog will get disabled
-        additionally parsed by dlg_parse_settings"""
-        # Rev. 2025-06-11
-        if checked:
-            self.stored_settings.sync_file_mode = 'copy'
-        self.dlg_show_sync_mode()
-
-    def scc_qcb_sync_update_geometries_toggled(self, checked):
-        """sets sync_update_geometries from QCheckBox
-        additionally parsed by dlg_parse_settings"""
+    def scc_get_bool_setter(self, setting_name: str) -> typing.Callable:
+        """slot for QCheckBox.toggled, sets the boolean setting directly
+        additionally parsed by dlg_parse_settings
+        :param setting_name: property of self.stored_settings, f.e. 'sync_update_geometries'
+        :returns: function(checked)
+        """
         # Rev. 2025-06-11
-        self.stored_settings.sync_update_geometries = checked
+        def bool_setter(checked):
+            setattr(self.stored_settings, setting_name, checked)
 
-    def scc_qcb_post_scan_preserve_existing_toggled(self, checked):
-        """sets post_scan_preserve_existing from QCheckBox
-        additionally parsed by dlg_parse_settings"""
-        # Rev. 2025-06-11
-        self.stored_settings.post_scan_preserve_existing = checked
+        return bool_setter
 
-    def scc_qcb_post_scan_update_geometry_from_exif(self, checked):
-        """sets post_scan_update_geometry_from_exif from QCheckBox
-        additionally parsed by dlg_parse_settings"""
+    def scc_get_mode_setter(self, setting_name: str, setting_value: str, after_set: typing.Callable = None) -> typing.Callable:
+        """slot for QRadioButton.toggled, modes symbolized in dialog with several radio-buttons, f.e. sync_file_mode
+        additionally parsed by dlg_parse_settings
+        :param setting_name: property of self.stored_settings
+        :param setting_value: value set if the radio-button gets checked
+        :param after_set: optional function called after each toggle, f.e. dlg_show_sync_mode, which disables some areas of the dialog dependend on sync_file_mode
+        :returns: function(checked)
+        """
         # Rev. 2025-06-11
+        def mode_setter(checked):
+            if checked:
+                setattr(self.stored_settings, setting_name, setting_value)
+            if after_set:
+                after_set()
 
-        self.stored_settings.post_scan_update_geometry_from_exif = checked
+        return mode_setter
 
     def dlg_show_sync_mode(self):
         """shows self.stored_settings.sync_file_mode in dialog
         dependend on sync_file_mode some areas of the dialog will get disabled"""
-        # Rev. 2025-05-30
+        # Rev. 2025-06-11
         with QtCore.QSignalBlocker(self.my_dialog.qrb_sync_file_mode_keep):
             self.my_dialog.qrb_sync_file_mode_keep.setChecked(self.stored_settings.sync_file_mode == 'keep')
 
@@ -1118,11 +1816,13 @@ class FileSync(object):
         # convenience: enable/disable dialog-area for sync_file_mode 'copy'
         toggle_rows = [7, 8, 9]
         toggle_cols = [0, 1, 2, 3, 4, 5, 6]
+        grid = self.my_dialog.grid_container_wdg.layout()
+        copy_enabled = self.stored_settings.sync_file_mode == 'copy'
         for sub_row in toggle_rows:
             for sub_col in toggle_cols:
-                qli = self.my_dialog.grid_container_wdg.layout().itemAtPosition(sub_row, sub_col)
+                qli = grid.itemAtPosition(sub_row, sub_col)
                 if qli:
-                    qli.widget().setEnabled(self.stored_settings.sync_file_mode == 'copy')
+                    qli.widget().setEnabled(copy_enabled)
 
     def scc_select_sync_source_abs_path_field(self, idx):
         """parses sync_source_abs_path_field from qcb_sync_source_abs_path_field"""
@@ -1175,20 +1875,18 @@ class FileSync(object):
         process_log.append(f"{time.strftime('%H:%M:%S', time.localtime())} removeLayerActions")
         vl = self.my_dialog.qcbn_layer_action_layer.currentData(Qt_Roles.RETURN_VALUE)
         if vl and isinstance(vl, qgis._core.QgsVectorLayer):
-            action_list = [action for action in vl.actions().actions() if action.id() == FeatureDigitizeMapTool.show_form_act_id]
-            for action in action_list:
-                vl.actions().removeAction(action.id())
-                process_log.append(f"{tab}✔ ShowForm-Action for layer '{vl.name()}' removed")
-
-            action_list = [action for action in vl.actions().actions() if action.id() == FeatureDigitizeMapTool.show_file_act_id]
-            for action in action_list:
-                vl.actions().removeAction(action.id())
-                process_log.append(f"{tab}✔ ShowFile-action for layer '{vl.name()}' removed")
-
-            action_list = [action for action in vl.actions().actions() if action.id() == FeatureDigitizeMapTool.georef_act_id]
-            for action in action_list:
-                vl.actions().removeAction(action.id())
-                process_log.append(f"{tab}✔ ShowFeature-Action '{action.id()}' for layer '{vl.name()}' removed")
+            # one pass over the layer-actions, key: action-id as string
+            remove_labels = {
+                FeatureDigitizeMapTool.show_form_act_id.toString(): 'ShowForm-Action',
+                FeatureDigitizeMapTool.show_file_act_id.toString(): 'ShowFile-action',
+                FeatureDigitizeMapTool.georef_act_id.toString(): 'ShowFeature-Action',
+            }
+            action_manager = vl.actions()
+            for action in action_manager.actions():
+                remove_label = remove_labels.get(action.id().toString())
+                if remove_label:
+                    action_manager.removeAction(action.id())
+                    process_log.append(f"{tab}✔ {remove_label} '{action.id().toString()}' for layer '{vl.name()}' removed")
 
             #MyTools.re_open_attribute_tables(self.iface, vl, True)
             vl.reload()
@@ -1203,21 +1901,6 @@ class FileSync(object):
         process_log = []
         process_log.append(f"{time.strftime('%H:%M:%S', time.localtime())} addLayerActions")
 
-        string_types = [
-            QtCore.QVariant.String,
-            QtCore.QMetaType.QString,
-        ]
-
-        double_types = [
-            QtCore.QVariant.Double,
-            QtCore.QMetaType.Double
-        ]
-
-        date_time_types = [
-            QtCore.QVariant.DateTime,
-            QtCore.QMetaType.QDateTime
-        ]
-
         vl = self.my_dialog.qcbn_layer_action_layer.currentData(Qt_Roles.RETURN_VALUE)
         if vl and isinstance(vl, qgis._core.QgsVectorLayer):
 
@@ -1231,7 +1914,7 @@ class FileSync(object):
                 fnx = vl.fields().indexOf(abs_path_field_name)
                 if fnx >= 0:
                     abs_path_field = vl.fields()[fnx]
-                    if abs_path_field.type() in string_types:
+                    if abs_path_field.type() in STRING_TYPES:
                         checked_abs_path_field_name = abs_path_field_name
                         FeatureDigitizeMapTool.add_show_file_action(vl, checked_abs_path_field_name)
                         process_log.append(f"{tab}✔ ShowFile-action for layer '{vl.name()}' added")
@@ -1239,10 +1922,10 @@ class FileSync(object):
                         show_file_action_added = True
 
             if not show_file_action_added:
-                action_list = [action for action in vl.actions().actions() if action.id() == FeatureDigitizeMapTool.show_file_act_id]
-                if action_list:
-                    for action in action_list:
-                        vl.actions().removeAction(action.id())
+                action_manager = vl.actions()
+                for action in action_manager.actions():
+                    if action.id() == FeatureDigitizeMapTool.show_file_act_id:
+                        action_manager.removeAction(action.id())
 
                 process_log.append(f"{tab}⯑ abs-path-field missing/not found/wrong type ➞ ShowFile-action for layer '{vl.name()}' removed")
 
@@ -1256,7 +1939,7 @@ class FileSync(object):
                     fnx = vl.fields().indexOf(direction_field_name)
                     if fnx >= 0:
                         direction_field = vl.fields()[fnx]
-                        if direction_field.type() in double_types:
+                        if direction_field.type() in DOUBLE_TYPES:
                             checked_direction_field_name = direction_field_name
 
                 last_edit_date_time_field_name = self.my_dialog.qcbx_layer_action_last_edit_date_time_field.currentData()
@@ -1264,7 +1947,7 @@ class FileSync(object):
                     fnx = vl.fields().indexOf(last_edit_date_time_field_name)
                     if fnx >= 0:
                         last_edit_date_time_field = vl.fields()[fnx]
-                        if last_edit_date_time_field.type() in date_time_types:
+                        if last_edit_date_time_field.type() in DATE_TIME_TYPES:
                             checked_last_edit_date_time_field_name = last_edit_date_time_field_name
 
                 FeatureDigitizeMapTool.add_show_feature_action(vl, checked_direction_field_name, checked_last_edit_date_time_field_name)
@@ -1276,10 +1959,10 @@ class FileSync(object):
                     process_log.append(f"{tab}{tab}last-edit-date-time-field '{checked_last_edit_date_time_field_name}'")
 
             if not show_feature_action_added:
-                action_list = [action for action in vl.actions().actions() if action.id() == FeatureDigitizeMapTool.georef_act_id]
-                if action_list:
-                    for action in action_list:
-                        vl.actions().removeAction(action.id())
+                action_manager = vl.actions()
+                for action in action_manager.actions():
+                    if action.id() == FeatureDigitizeMapTool.georef_act_id:
+                        action_manager.removeAction(action.id())
 
                 process_log.append(f"{tab}⯑ wrong geometry type ➞ ShowFeature-action for layer '{vl.name()}' removed")
 
@@ -1307,57 +1990,48 @@ class FileSync(object):
         self.my_dialog.qcbx_layer_action_last_edit_date_time_field.addItem('')
 
         if vl:
-            string_types = [
-                QtCore.QVariant.String,
-                QtCore.QMetaType.QString,
-            ]
-
-            double_types = [
-                QtCore.QVariant.Double,
-                QtCore.QMetaType.Double
-            ]
-            date_time_types = [
-                QtCore.QVariant.DateTime,
-                QtCore.QMetaType.QDateTime
-            ]
-
             # tricky for convenience:
             # scan layer-actions and find current assigned fields,
             # pre-select the QComboBox'es and
             # show current configuration for the selected layer
-            # @TothinkAbout: scan command with regex
-            action_list_show_feature = [action for action in vl.actions().actions() if action.id() in [FeatureDigitizeMapTool.georef_act_id]]
-            action_list_show_file = [action for action in vl.actions().actions() if action.id() in [FeatureDigitizeMapTool.show_file_act_id]]
+            last_action_show_feature_command = ''
+            last_action_show_file_command = ''
+            # the last action per id, if several
+            for action in vl.actions().actions():
+                if action.id() == FeatureDigitizeMapTool.georef_act_id:
+                    last_action_show_feature_command = action.command()
+                elif action.id() == FeatureDigitizeMapTool.show_file_act_id:
+                    last_action_show_file_command = action.command()
+
+            # field-names parsed once from the commands, compared with the field-names below
+            abs_path_match = FeatureDigitizeMapTool.abs_path_field_pattern.search(last_action_show_file_command)
+            direction_match = FeatureDigitizeMapTool.direction_field_pattern.search(last_action_show_feature_command)
+            last_edit_date_time_match = FeatureDigitizeMapTool.last_edit_date_time_field_pattern.search(last_action_show_feature_command)
+            assigned_abs_path_field = abs_path_match.group(1) if abs_path_match else None
+            assigned_direction_field = direction_match.group(1) if direction_match else None
+            assigned_last_edit_date_time_field = last_edit_date_time_match.group(1) if last_edit_date_time_match else None
 
             current_abs_path_field = None
             current_direction_field = None
             current_last_edit_date_time_field = None
 
-            last_action_show_feature_command = ''
-            if action_list_show_feature:
-                last_action_show_feature = action_list_show_feature.pop()
-                last_action_show_feature_command = last_action_show_feature.command()
-
-            last_action_show_file_command = ''
-            if action_list_show_file:
-                last_action_show_file = action_list_show_file.pop()
-                last_action_show_file_command = last_action_show_file.command()
-
             for field in vl.dataProvider().fields():
-                if field.type() in string_types:
-                    self.my_dialog.qcbx_layer_action_abs_path_field.addItem(field.name(), field.name())
-                    if f"abs_path_field_name='{field.name()}'" in last_action_show_file_command:
-                        current_abs_path_field = field.name()
-
-                elif field.type() in double_types:
-                    self.my_dialog.qcbx_layer_action_direction_field.addItem(field.name(), field.name())
-                    if f"direction_field_name='{field.name()}'" in last_action_show_feature_command:
-                        current_direction_field = field.name()
-
-                elif field.type() in date_time_types:
-                    self.my_dialog.qcbx_layer_action_last_edit_date_time_field.addItem(field.name(), field.name())
-                    if f"last_edit_date_time_field_name='{field.name()}'" in last_action_show_feature_command:
-                        current_last_edit_date_time_field = field.name()
+                field_name = field.name()
+                field_type = field.type()
+                if field_type in STRING_TYPES:
+                    self.my_dialog.qcbx_layer_action_abs_path_field.addItem(field_name, field_name)
+                    if field_name == assigned_abs_path_field:
+                        current_abs_path_field = field_name
+
+                elif field_type in DOUBLE_TYPES:
+                    self.my_dialog.qcbx_layer_action_direction_field.addItem(field_name, field_name)
+                    if field_name == assigned_direction_field:
+                        current_direction_field = field_name
+
+                elif field_type in DATE_TIME_TYPES:
+                    self.my_dialog.qcbx_layer_action_last_edit_date_time_field.addItem(field_name, field_name)
+                    if field_name == assigned_last_edit_date_time_field:
+                        current_last_edit_date_time_field = field_name
 
             MyTools.qcbx_select_by_value(self.my_dialog.qcbx_layer_action_abs_path_field, current_abs_path_field)
             MyTools.qcbx_select_by_value(self.my_dialog.qcbx_layer_action_direction_field, current_direction_field)
@@ -1367,27 +2041,39 @@ class FileSync(object):
         self.my_dialog.qcbx_layer_action_direction_field.blockSignals(False)
         self.my_dialog.qcbx_layer_action_last_edit_date_time_field.blockSignals(False)
 
+    def dlg_show_log(self):
+        """renders the current log of self.log_history in self.my_dialog.qte_log
+        on demand, only if the Log-tab is shown and the log is not already rendered
+        line by line via QTextCursor, no join of all lines and no re-parse of one huge html-string
+        triggered by tbw_central.currentChanged, dlg_skip_log_back/dlg_skip_log_for and tool_append_to_log_history"""
+        # Rev. 2025-06-11
+        if self.my_dialog.tbw_central.currentIndex() == 4 and self.shown_log_idx != self.crt_log_idx:
+            self.my_dialog.qte_log.clear()
+            if self.log_history:
+                cursor = self.my_dialog.qte_log.textCursor()
+                # one layout-update for the whole log
+                cursor.beginEditBlock()
+                for line_idx, log_line in enumerate(self.log_history[self.crt_log_idx]):
+                    if line_idx:
+                        # new line with default formats, no bold-format taken over from the previous line
+                        cursor.insertBlock(QtGui.QTextBlockFormat(), QtGui.QTextCharFormat())
+                    cursor.insertHtml(log_line)
+                cursor.endEditBlock()
+                self.shown_log_idx = self.crt_log_idx
+
     def dlg_skip_log_back(self):
         """shows previous log in self.my_dialog.qte_log"""
         # Rev. 2025-06-11
-        self.my_dialog.qte_log.clear()
         if self.log_history:
-            self.crt_log_idx -= 1
-            max_idx = len(self.log_history) - 1
-            self.crt_log_idx = max(0, min(max_idx, self.crt_log_idx))
-            log_string = self.log_history[self.crt_log_idx]
-            self.my_dialog.qte_log.insertHtml(log_string)
+            self.crt_log_idx = max(0, min(len(self.log_history) - 1, self.crt_log_idx - 1))
+            self.dlg_show_log()
 
     def dlg_skip_log_for(self):
         """shows next log in self.my_dialog.qte_log"""
         # Rev. 2025-06-11
-        self.my_dialog.qte_log.clear()
         if self.log_history:
-            self.crt_log_idx += 1
-            max_idx = len(self.log_history) - 1
-            self.crt_log_idx = max(0, min(max_idx, self.crt_log_idx))
-            log_string = self.log_history[self.crt_log_idx]
-            self.my_dialog.qte_log.insertHtml(log_string)
+            self.crt_log_idx = max(0, min(len(self.log_history) - 1, self.crt_log_idx + 1))
+            self.dlg_show_log()
 
     def dlg_clear_log(self):
         """clears self.my_dialog.qte_log and resets log_history"""
@@ -1395,19 +2081,29 @@ class FileSync(object):
         self.my_dialog.qte_log.clear()
         self.log_history = []
         self.crt_log_idx = 0
+        self.shown_log_idx = None
 
     def tool_append_to_log_history(self, log_list, show_log_tab=True):
         """some long running processes generate log-messages with user-infos, errors... in form of lists
-        theses are concatenated to html-strings, appended to self.log_history and shown in self.my_dialog.qte_log"""
+        theses are appended unchanged to self.log_history and rendered in self.my_dialog.qte_log on demand, see dlg_show_log"""
         # Rev. 2025-06-11
-        log_string = '<br/>'.join(log_list)
-        self.log_history.append(log_string)
+        self.log_history.append(log_list)
         self.crt_log_idx = len(self.log_history) - 1
         if self.my_dialog:
-            self.my_dialog.qte_log.clear()
-            self.my_dialog.qte_log.insertHtml(log_string)
             if show_log_tab:
+                # currentChanged => dlg_show_log, if the Log-tab was not shown before
                 self.my_dialog.tbw_central.setCurrentIndex(4)
+            self.dlg_show_log()
+
+    @staticmethod
+    def tool_drop_empty_log_header(process_log: list, header_idx: int | None):
+        """not verbose log: removes the header-line of the previous feature, if no problems were logged for it
+        :param process_log: list of log-lines
+        :param header_idx: index of the header-line in process_log or None
+        """
+        # Rev. 2025-06-11
+        if header_idx is not None and header_idx == len(process_log) - 1:
+            process_log.pop()
 
     def s_start_post_scan(self):
         """starts PostScan-Process"""
@@ -1441,32 +2137,118 @@ class FileSync(object):
                 wgs_84_crs = qgis._core.QgsCoordinateReferenceSystem("EPSG:4326")
                 tr_wgs_2_vl = qgis._core.QgsCoordinateTransform(wgs_84_crs, post_scan_layer.crs(), qgis._core.QgsProject.instance())
 
-                for post_scan_feature in post_scan_layer.getFeatures():
-                    fc += 1
-                    self.my_dialog.qprb_post_scan.setValue(fc)
-                    self.my_dialog.qlbl_post_scan_progress.setText(f"Feature {fc} from {num_features}")
-                    abs_path_str = post_scan_feature[self.stored_settings.post_scan_abs_path_field]
-                    abs_path_posix = Path(abs_path_str)
-                    process_log.append(f"{tab}{tab} #{post_scan_feature.id()} '{abs_path_posix.as_posix()}'")
-
-                    if abs_path_posix.is_file():
-                        process_log.append(f"{tab}{tab}{tab}✔ file exists")
-                        extract_ok, feature_altered, extract_log = self.file_meta_extractor.extract_file_metas(abs_path_posix, post_scan_feature, self.stored_settings.post_scan_fields, self.stored_settings.post_scan_rel_root_dir, self.stored_settings.post_scan_preserve_existing, self.stored_settings.post_scan_update_geometry_from_exif, tr_wgs_2_vl)
-                        process_log += extract_log
-                        if extract_ok:
-                            if feature_altered:
-                                post_scan_layer.updateFeature(post_scan_feature)
-                                process_log.append(f"{tab}{tab}{tab}✔ feature updated")
-                                success_fids.append(post_scan_feature.id())
+                field_indices = self.file_meta_extractor.get_field_indices(post_scan_layer.fields())
+                # the only attributes written by extract_file_metas
+                post_scan_field_indices = [field_indices[field_name] for field_name in self.stored_settings.post_scan_fields.values()]
+
+                # fetch only the abs-path- and the post-scan-attributes, geometry only if updated
+                # note: the not fetched attributes are NULL, but they are not written back, see changed_values
+                post_scan_request = qgis._core.QgsFeatureRequest()
+                post_scan_request.setSubsetOfAttributes([field_indices[self.stored_settings.post_scan_abs_path_field]] + post_scan_field_indices)
+                if not self.stored_settings.post_scan_update_geometry_from_exif:
+                    post_scan_request.setFlags(qgis._core.QgsFeatureRequest.NoGeometry)
+
+                # all changes as one command in the edit-buffer, one undo-step
+                post_scan_layer.beginEditCommand('FileSync PostScan')
+                # progress-display max. 200 times, each setValue repaints the QProgressBar
+                progress_step = max(1, num_features // 200)
+
+                verbose_log = self.stored_settings.verbose_log
+                # settings used per feature, bound once
+                post_scan_fields = self.stored_settings.post_scan_fields
+                post_scan_rel_root_dir = self.stored_settings.post_scan_rel_root_dir
+                post_scan_preserve_existing = self.stored_settings.post_scan_preserve_existing
+                post_scan_parallel = self.stored_settings.post_scan_parallel
+                update_geometry = self.stored_settings.post_scan_update_geometry_from_exif
+                abs_path_idx = field_indices[self.stored_settings.post_scan_abs_path_field]
+                header_idx = None
+
+                with contextlib.ExitStack() as post_scan_stack:
+                    post_scan_stack.callback(post_scan_layer.endEditCommand)
+                    post_scan_stack.enter_context(self.file_meta_extractor.meta_cache_batch())
+
+                    # features streamed from the layer, one stat-syscall per feature for the exists-check and the extraction
+                    def iter_post_scan_jobs():
+                        for job_feature in post_scan_layer.getFeatures(post_scan_request):
+                            job_path_posix = Path(job_feature[abs_path_idx])
+                            yield job_feature, job_path_posix, MyTools.get_file_stat(job_path_posix)
+
+                    post_scan_jobs = iter_post_scan_jobs()
+
+                    # expensive metas of the existing files, see s_start_pre_scan
+                    # with post_scan_preserve_existing possibly read for fields, which will be preserved
+                    if post_scan_parallel == 'threads':
+                        # the thread-pool reads ahead of the feature-loop, tee buffers only the jobs in between (at most threaded_queue_size files in flight)
+                        post_scan_jobs, read_ahead_jobs = itertools.tee(post_scan_jobs)
+                        # stats of the read-ahead files, removed again in the feature-loop
+                        read_ahead_stats = {}
+
+                        def iter_existing_paths():
+                            for job_feature, job_path_posix, job_stat in read_ahead_jobs:
+                                if job_stat:
+                                    read_ahead_stats[job_path_posix] = job_stat
+                                    yield job_path_posix
+
+                        parallel_results = self.file_meta_extractor.iter_expensive_metas_threaded(iter_existing_paths(), post_scan_fields, update_geometry, read_ahead_stats)
+                    else:
+                        read_ahead_stats = {}
+                        # sequential: nothing read ahead, extract_file_metas reads the file
+                        parallel_results = (({}, []) for job_count in itertools.count())
+
+                    # extract and update the features in the main-thread, parallel_results in order of the existing files
+                    for post_scan_feature, abs_path_posix, abs_path_stat in post_scan_jobs:
+                        if not verbose_log:
+                            self.tool_drop_empty_log_header(process_log, header_idx)
+                        fc += 1
+                        if not fc % progress_step or fc == num_features:
+                            self.my_dialog.qprb_post_scan.setValue(fc)
+                            self.my_dialog.qlbl_post_scan_progress.setText(f"Feature {fc} from {num_features}")
+                        header_idx = len(process_log)
+                        process_log.append(f"{tab}{tab} #{post_scan_feature.id()} '{abs_path_posix.as_posix()}'")
+
+                        if abs_path_stat:
+                            if verbose_log:
+                                process_log.append(f"{tab}{tab}{tab}✔ file exists")
+                            extracted_metas, parallel_log = next(parallel_results)
+                            read_ahead_stats.pop(abs_path_posix, None)
+                            old_attributes = post_scan_feature.attributes()
+                            old_geometry = post_scan_feature.geometry() if update_geometry else None
+                            extract_ok, feature_altered, extract_log = self.file_meta_extractor.extract_file_metas(abs_path_posix, post_scan_feature, post_scan_fields, post_scan_rel_root_dir, post_scan_preserve_existing, update_geometry, tr_wgs_2_vl, extracted_metas, field_indices, None, abs_path_stat)
+                            extract_log = parallel_log + extract_log
+                            process_log += extract_log if verbose_log else [log_line for log_line in extract_log if log_line.startswith('<b>')]
+                            if extract_ok:
+                                feature_changed = False
+                                if feature_altered:
+                                    # only the changed values, with old values given the edit-buffer does not re-fetch the feature like updateFeature
+                                    new_attributes = post_scan_feature.attributes()
+                                    changed_values = {field_idx: new_attributes[field_idx] for field_idx in post_scan_field_indices if new_attributes[field_idx] != old_attributes[field_idx]}
+                                    if changed_values:
+                                        post_scan_layer.changeAttributeValues(post_scan_feature.id(), changed_values, {field_idx: old_attributes[field_idx] for field_idx in changed_values})
+                                        feature_changed = True
+                                    if update_geometry:
+                                        new_geometry = post_scan_feature.geometry()
+                                        # equals() is False for two null-geometries => explicit check, no changeGeometry without real difference
+                                        if not (new_geometry.isNull() and old_geometry.isNull()) and not new_geometry.equals(old_geometry):
+                                            post_scan_layer.changeGeometry(post_scan_feature.id(), new_geometry)
+                                            feature_changed = True
+
+                                if feature_changed:
+                                    if verbose_log:
+                                        process_log.append(f"{tab}{tab}{tab}✔ feature updated")
+                                    success_fids.append(post_scan_feature.id())
+                                else:
+                                    if verbose_log:
+                                        process_log.append(f"{tab}{tab}{tab}✔ feature not altered, no update")
+                                    unchanged_fids.append(post_scan_feature.id())
                             else:
-                                process_log.append(f"{tab}{tab}{tab}✔ feature not altered, no update")
-                                unchanged_fids.append(post_scan_feature.id())
+                                process_log.append(f"<b>{tab}{tab}{tab}⭍ extract-metas failed, no update</b>")
+                                skip_fids.append(post_scan_feature.id())
                         else:
-                            process_log.append(f"<b>{tab}{tab}{tab}⭍ extract-metas failed, no update</b>")
-                            skip_fids.append(post_scan_feature.id())
-                    else:
-                        process_log.append(f"<b>{tab}{tab}{tab}⭍ file not found, check path</b>")
-                        missing_file_fids.append(post_scan_feature.id())
+                            process_log.append(f"<b>{tab}{tab}{tab}⭍ file not found, check path</b>")
+                            missing_file_fids.append(post_scan_feature.id())
+
+                if not verbose_log:
+                    self.tool_drop_empty_log_header(process_log, header_idx)
 
                 process_log.append(f"{tab}...Feature-Iteration-End")
 
@@ -1521,8 +2303,10 @@ class FileSync(object):
                         sync_target_dir_posix = Path(self.stored_settings.sync_target_dir)
                         process_log.append(f"{tab}✓ sync_target_dir '{sync_target_dir_posix.as_posix()}'")
                         process_log.append(f"{tab}✓ sync_file_mode '{self.stored_settings.sync_file_mode}'")
-                        process_log.append(f"{tab}✓ {sync_source_layer.featureCount()} num features")
+                        process_log.append(f"{tab}✓ {num_features} num features")
                         tr_source_2_target = qgis._core.QgsCoordinateTransform(sync_source_layer.crs(), sync_target_layer.crs(), qgis._core.QgsProject.instance())
+                        # identical crs => geometries taken over without transformation
+                        transform_source_geoms = not tr_source_2_target.isShortCircuited()
 
                         self.my_dialog.sub_wdg_file_sync_progress.setVisible(True)
                         self.my_dialog.qprb_file_sync.setMinimum(0)
@@ -1531,7 +2315,6 @@ class FileSync(object):
                         self.my_dialog.qlbl_file_sync_progress.setText('')
 
                         process_log.append(f"{tab}Feature-Iteration-Start")
-                        fc = 0
                         success_fids = []
                         insert_fids = []
                         update_fids = []
@@ -1545,216 +2328,407 @@ class FileSync(object):
                         existing_files_skipped = []
                         existing_files_replaced = []
                         existing_files_renamed = []
-                        for sync_source_feature in sync_source_layer.getFeatures():
-                            fc += 1
-                            self.my_dialog.qprb_file_sync.setValue(fc)
-                            self.my_dialog.qlbl_file_sync_progress.setText(f"Feature {fc} from {num_features}")
-
-                            sync_source_path_str = sync_source_feature[self.stored_settings.sync_source_abs_path_field]
-
-                            sync_source_path_posix = Path(sync_source_path_str)
-
-                            process_log.append(f"{tab}{tab} #{sync_source_feature.id()} '{sync_source_path_posix}'")
-
-                            if sync_source_path_posix.is_file():
-
-                                process_log.append(f"{tab}{tab}{tab}✔ source-file exists")
-
-                                sync_target_path_posix = None
-
-                                if self.stored_settings.sync_file_mode == 'keep':
-                                    sync_target_path_posix = sync_source_path_posix
-                                # keep or copy file?
-                                if self.stored_settings.sync_file_mode == 'copy':
-
-                                    # sync_target_dir_posix checked before
-                                    composed_target_dir_posix = sync_target_dir_posix
-
-                                    # optionally use sub-directory from source-layer-field
-                                    if self.stored_settings.sync_source_rel_path_field:
-                                        sync_source_rel_path_str = sync_source_feature[self.stored_settings.sync_source_rel_path_field]
-                                        if sync_source_rel_path_str:
-                                            composed_target_dir_posix = sync_target_dir_posix / sync_source_rel_path_str
-
-                                    # sync_target_dir check, exists, isdir/isfile, or create
-                                    if composed_target_dir_posix.is_dir():
-                                        # idealfall: Verzeichnis ist bereits vorhanden
-                                        pass
-                                    elif composed_target_dir_posix.is_file():
-                                        # bereits vorhanden, aber ist eine Datei => geht nicht!
-                                        process_log.append(f"<b>{tab}{tab}{tab}⭍ Target-directory '{composed_target_dir_posix}' is a file, file skipped</b>")
-                                        error_fids.append(sync_source_feature.id())
-                                        error_files.append(sync_source_path_posix)
-                                        continue
-                                    else:
-                                        # noch nicht vorhanden => anlegen, makedirs => rekursiv
+                        # progress-display max. 200 times, each setValue repaints the QProgressBar
+                        # shown in phase 1, phase 2 and 3 of a batch follow directly
+                        progress_step = max(1, num_features // 200)
+                        verbose_log = self.stored_settings.verbose_log
+                        # settings used per feature, bound once
+                        sync_file_mode = self.stored_settings.sync_file_mode
+                        sync_existing_file_mode = self.stored_settings.sync_existing_file_mode
+                        sync_existing_feature_mode = self.stored_settings.sync_existing_feature_mode
+                        sync_update_geometries = self.stored_settings.sync_update_geometries
+
+                        # fields and field-indices resolved once, features accessed by index instead of name
+                        # target: layer-fields, the indices are used for layer-features and the edit-buffer (changeAttributeValues, addFeature)
+                        # and for the fields of the inserted features, provider-indices are only valid for provider-calls
+                        target_fields = sync_target_layer.fields()
+                        target_abs_path_idx = target_fields.indexOf(self.stored_settings.sync_target_abs_path_field)
+                        # provider-side attribute-index for the path-field (f.e. OGR: shapefile .idx, GeoPackage/Spatialite: SQL-Index), created once
+                        # speeds up path-queries of the provider, f.e. filter-expressions from the layer-actions or the attribute-table
+                        # createAttributeIndex expects the provider-field-index
+                        target_provider = sync_target_layer.dataProvider()
+                        target_provider_abs_path_idx = target_provider.fields().indexOf(self.stored_settings.sync_target_abs_path_field)
+                        if target_provider_abs_path_idx >= 0 and (sync_target_layer.id(), target_provider_abs_path_idx) not in self.attribute_indexed_fields and target_provider.capabilities() & qgis._core.QgsVectorDataProvider.CreateAttributeIndex:
+                            if target_provider.createAttributeIndex(target_provider_abs_path_idx):
+                                self.attribute_indexed_fields.add((sync_target_layer.id(), target_provider_abs_path_idx))
+                                if verbose_log:
+                                    process_log.append(f"{tab}✓ attribute-index for '{self.stored_settings.sync_target_abs_path_field}' created")
+                        # source: layer-fields, includes calculated fields
+                        source_fields = sync_source_layer.fields()
+                        source_abs_path_idx = source_fields.indexOf(self.stored_settings.sync_source_abs_path_field)
+                        source_rel_path_idx = source_fields.indexOf(self.stored_settings.sync_source_rel_path_field) if self.stored_settings.sync_source_rel_path_field else -1
+                        # list of tuple(target_field_idx, source_field_idx)
+                        sync_field_idcs = [(target_fields.indexOf(sync_target_field_name), source_fields.indexOf(sync_source_field_name)) for sync_target_field_name, sync_source_field_name in self.stored_settings.sync_fields.items()]
+                        # source-features with the path-fields and the mapped source-fields only, geometry required for insert/update
+                        source_request = qgis._core.QgsFeatureRequest()
+                        source_request.setSubsetOfAttributes([source_abs_path_idx] + ([source_rel_path_idx] if source_rel_path_idx >= 0 else []) + [source_field_idx for target_field_idx, source_field_idx in sync_field_idcs])
+
+                        # index target-path => fids of the target-layer, built once instead of one query per source-feature
+                        # includes the edit-buffer, maintained below for inserted and deleted features
+                        # 'insert' => new features regardless of duplicates, neither index nor duplicate-lookup required
+                        duplicate_check = sync_existing_feature_mode != 'insert'
+                        target_fids_by_path = {}
+                        if duplicate_check:
+                            target_path_request = qgis._core.QgsFeatureRequest()
+                            target_path_request.setSubsetOfAttributes([target_abs_path_idx])
+                            target_path_request.setFlags(qgis._core.QgsFeatureRequest.NoGeometry)
+                            for sync_target_feature in sync_target_layer.getFeatures(target_path_request):
+                                target_path_value = sync_target_feature[target_abs_path_idx]
+                                # empty path-fields can't be duplicates, NULL-QVariants are not hashable as dict-key
+                                if target_path_value not in EMPTY_VALUES:
+                                    target_fids_by_path.setdefault(target_path_value, []).append(sync_target_feature.id())
+
+                        # 'update_*' => duplicates fetched with the compared attributes only, geometry only if it could be updated
+                        duplicate_request = qgis._core.QgsFeatureRequest()
+                        duplicate_request.setSubsetOfAttributes([target_abs_path_idx] + [target_field_idx for target_field_idx, source_field_idx in sync_field_idcs])
+                        if not sync_update_geometries:
+                            duplicate_request.setFlags(qgis._core.QgsFeatureRequest.NoGeometry)
+
+                        # already checked or created target-directories, one check per directory instead of per feature
+                        known_target_dirs = set()
+
+                        # phase 1: check source-files and target-paths, collect the copy-jobs
+                        # in batches of sync_edit_batch_size, each batch copied and synced (phase 2 and 3) before the next one is collected
+                        # => memory bounded by the batch-size, not by the number of source-features
+                        def iter_sync_batches():
+                            """yields tuple(sync_jobs, copy_sources_by_target) per batch
+                            sync_jobs: list of tuple(sync_source_feature, sync_source_path_posix, sync_target_path_posix, copy_target_path_posix, copy_idx)
+                            copy_sources_by_target: pending copies, key: target-path, value: list of source-paths, in order of the features
+                            """
+                            fc = 0
+                            header_idx = None
+                            sync_jobs = []
+                            copy_sources_by_target = {}
+                            for sync_source_feature in sync_source_layer.getFeatures(source_request):
+                                if not verbose_log:
+                                    self.tool_drop_empty_log_header(process_log, header_idx)
+                                if len(sync_jobs) >= self.sync_edit_batch_size:
+                                    # header-index invalid after the log-lines of phase 3
+                                    header_idx = None
+                                    yield sync_jobs, copy_sources_by_target
+                                    # copies of the previous batch are done, their target-files are checked as existing files
+                                    sync_jobs = []
+                                    copy_sources_by_target = {}
+                                fc += 1
+                                if not fc % progress_step or fc == num_features:
+                                    self.my_dialog.qprb_file_sync.setValue(fc)
+                                    self.my_dialog.qlbl_file_sync_progress.setText(f"Feature {fc} from {num_features}")
+
+                                sync_source_path_str = sync_source_feature[source_abs_path_idx]
+
+                                sync_source_path_posix = Path(sync_source_path_str)
+
+                                header_idx = len(process_log)
+                                process_log.append(f"{tab}{tab} #{sync_source_feature.id()} '{sync_source_path_posix}'")
+
+                                if MyTools.get_file_stat(sync_source_path_posix):
+
+                                    if verbose_log:
+                                        process_log.append(f"{tab}{tab}{tab}✔ source-file exists")
+
+                                    sync_target_path_posix = None
+                                    copy_target_path_posix = None
+
+                                    if sync_file_mode == 'keep':
+                                        sync_target_path_posix = sync_source_path_posix
+                                    # keep or copy file?
+                                    if sync_file_mode == 'copy':
+
+                                        # sync_target_dir_posix checked before
+                                        composed_target_dir_posix = sync_target_dir_posix
+
+                                        # optionally use sub-directory from source-layer-field
+                                        if source_rel_path_idx >= 0:
+                                            sync_source_rel_path_str = sync_source_feature[source_rel_path_idx]
+                                            if sync_source_rel_path_str:
+                                                composed_target_dir_posix = sync_target_dir_posix / sync_source_rel_path_str
+
+                                        # sync_target_dir check or create, once per directory
+                                        if composed_target_dir_posix not in known_target_dirs:
+                                            try:
+                                                # makedirs => rekursiv, exist_ok => idealfall: Verzeichnis ist bereits vorhanden
+                                                composed_target_dir_posix.mkdir(parents=True, exist_ok=True)
+                                                known_target_dirs.add(composed_target_dir_posix)
+                                            except FileExistsError:
+                                                # bereits vorhanden, aber ist eine Datei => geht nicht!
+                                                process_log.append(f"<b>{tab}{tab}{tab}⭍ Target-directory '{composed_target_dir_posix}' is a file, file skipped</b>")
+                                                error_fids.append(sync_source_feature.id())
+                                                error_files.append(sync_source_path_posix)
+                                                continue
+                                            except OSError as e:
+                                                process_log.append(f"<b>{tab}{tab}{tab}⭍ Target-directory '{composed_target_dir_posix}' could not be created ({e}), file skipped</b>")
+                                                error_fids.append(sync_source_feature.id())
+                                                error_files.append(sync_source_path_posix)
+                                                continue
+
+                                        prelim_target_path_posix = composed_target_dir_posix / sync_source_path_posix.name
+
+                                        # check, one stat-syscall for directory and file
                                         try:
-                                            composed_target_dir_posix.mkdir(parents=True)
-                                        except:
-                                            process_log.append(f"<b>{tab}{tab}{tab}⭍ Target-directory '{composed_target_dir_posix}' could not be created, file skipped</b>")
+                                            prelim_target_mode = os.stat(prelim_target_path_posix).st_mode
+                                        except OSError:
+                                            prelim_target_mode = 0
+
+                                        if stat.S_ISDIR(prelim_target_mode):
+                                            # bereits vorhanden, aber ist ein Verzeichnis => geht nicht!
+                                            process_log.append(f"<b>{tab}{tab}{tab}⭍ Target-path '{prelim_target_path_posix}' is a directory, file skipped</b>")
                                             error_fids.append(sync_source_feature.id())
                                             error_files.append(sync_source_path_posix)
                                             continue
 
-                                    prelim_target_path_posix = composed_target_dir_posix / sync_source_path_posix.name
-
-                                    # check
 
-                                    if prelim_target_path_posix.is_dir():
-                                        # bereits vorhanden, aber ist ein Verzeichnis => geht nicht!
-                                        process_log.append(f"<b>{tab}{tab}{tab}⭍ Target-path '{prelim_target_path_posix}' is a directory, file skipped</b>")
-                                        error_fids.append(sync_source_feature.id())
-                                        error_files.append(sync_source_path_posix)
-                                        continue
+                                        # pending copy to this path from a previous feature => handled like an existing file
+                                        elif stat.S_ISREG(prelim_target_mode) or prelim_target_path_posix in copy_sources_by_target:
+                                            if sync_existing_file_mode == 'skip':
+                                                if verbose_log:
+                                                    process_log.append(f"{tab}{tab}{tab}existing target-file kept")
+                                                sync_target_path_posix = prelim_target_path_posix
+                                                existing_files_kept.append(sync_source_path_posix)
+                                            elif sync_existing_file_mode == 'replace':
+                                                if verbose_log:
+                                                    process_log.append(f"{tab}{tab}{tab}existing target-file replaced")
+                                                copy_target_path_posix = prelim_target_path_posix
+                                                existing_files_replaced.append(sync_source_path_posix)
+                                            elif sync_existing_file_mode == 'rename':
+                                                renamed_path_posix = MyTools.create_unique_file_path(prelim_target_path_posix, reserved_paths=copy_sources_by_target)
+                                                if verbose_log:
+                                                    process_log.append(f"{tab}{tab}{tab}existing target-file, source-file renamed")
+                                                copy_target_path_posix = renamed_path_posix
+                                                existing_files_renamed.append(sync_source_path_posix)
+                                            else:
+                                                # sollte eigentlich nicht vorkommen
+                                                if verbose_log:
+                                                    process_log.append(f"{tab}{tab}{tab}target-file already exists, skip file and sync...")
+                                                existing_files_skipped.append(sync_source_path_posix)
+                                                continue
+                                        else:
+                                            # file with this path not found
+                                            copy_target_path_posix = prelim_target_path_posix
+                                            if verbose_log:
+                                                process_log.append(f"{tab}{tab}{tab}no target-file found, copy source-file")
+                                            copied_files.append(sync_source_path_posix)
 
+                                    copy_idx = None
+                                    if copy_target_path_posix:
+                                        # copied in phase 2, several copies to the same target-path successively in one job
+                                        copy_sources = copy_sources_by_target.setdefault(copy_target_path_posix, [])
+                                        copy_idx = len(copy_sources)
+                                        copy_sources.append(sync_source_path_posix)
+                                        sync_target_path_posix = copy_target_path_posix
+
+                                    if sync_target_path_posix:
+                                        sync_jobs.append((sync_source_feature, sync_source_path_posix, sync_target_path_posix, copy_target_path_posix, copy_idx))
+
+                                else:
+                                    error_fids.append(sync_source_feature.id())
+                                    process_log.append(f"<b>{tab}{tab}{tab}⭍ file not found, skip...</b>")
+                                    missing_files.append(sync_source_path_posix)
+                                    continue
+
+                            if not verbose_log:
+                                self.tool_drop_empty_log_header(process_log, header_idx)
+                            if sync_jobs:
+                                yield sync_jobs, copy_sources_by_target
+
+                        # phase 2: copy the files in a thread-pool, the copies (disk-I/O, GIL released) overlap each other
+                        # pipelined with phase 3 in the main-thread: layer-edits in order of the features, each one as soon as its copy is done
+                        # fids of duplicate target-features to delete and new features to insert, see sync_edit_batch_size
+                        pending_delete_fids = []
+                        pending_insert_features = []
+                        # source-geometries only for jobs with insert or geometry-update, f.e. not for duplicates in 'skip'-mode or re-syncs without sync_update_geometries
+                        # 'skip'/'update_*' never remove duplicates from target_fids_by_path, so the duplicate-check before phase 3 stays valid
+                        geoms_for_duplicates = sync_existing_feature_mode in ['insert', 'replace'] or (sync_update_geometries and sync_existing_feature_mode in ['update_overwrite', 'update_preserve'])
+                        # all edits in one undo-step
+                        sync_target_layer.beginEditCommand('FileSync Sync')
+                        with contextlib.ExitStack() as sync_stack:
+                            sync_stack.callback(sync_target_layer.endEditCommand)
+                            # LIFO: remaining deletes after the last copy and before endEditCommand
+                            sync_stack.callback(lambda: sync_target_layer.deleteFeatures(pending_delete_fids))
+                            sync_stack.callback(lambda: sync_target_layer.addFeatures(pending_insert_features))
+                            executor = sync_stack.enter_context(concurrent.futures.ThreadPoolExecutor(max_workers=self.sync_copy_max_workers))
+                            for sync_jobs, copy_sources_by_target in iter_sync_batches():
+                                # https://docs.python.org/3/library/shutil.html
+                                # Copy/rename the file
+                                # copy2 => permissions and metadata are preserved
+                                # MyTools.copy_file: same result, but kernel-side copy_file_range (reflink) if available
+                                copy_futures = {copy_target_path_posix: executor.submit(MyTools.copy_files, copy_sources, copy_target_path_posix) for copy_target_path_posix, copy_sources in copy_sources_by_target.items()}
+
+                                # source-geometries of the batch, transformed per feature in phase 3
+                                job_source_geoms = [sync_job[0].geometry() if sync_job[0].hasGeometry() and (geoms_for_duplicates or sync_job[2].as_posix() not in target_fids_by_path) else None for sync_job in sync_jobs]
+
+                                # phase 3: insert/update the target-features of the batch, serial in the main-thread
+                                header_idx = None
+                                for (sync_source_feature, sync_source_path_posix, sync_target_path_posix, copy_target_path_posix, copy_idx), source_geom in zip(sync_jobs, job_source_geoms):
+                                    if not verbose_log:
+                                        self.tool_drop_empty_log_header(process_log, header_idx)
+                                    header_idx = len(process_log)
+                                    process_log.append(f"{tab}{tab} #{sync_source_feature.id()} '{sync_source_path_posix}'")
 
-                                    elif prelim_target_path_posix.is_file():
-                                        copy_target_path_posix = None
-                                        if self.stored_settings.sync_existing_file_mode == 'skip':
-                                            process_log.append(f"{tab}{tab}{tab}existing target-file kept")
-                                            sync_target_path_posix = prelim_target_path_posix
-                                            existing_files_kept.append(sync_source_path_posix)
-                                        elif self.stored_settings.sync_existing_file_mode == 'replace':
-                                            process_log.append(f"{tab}{tab}{tab}existing target-file replaced")
-                                            copy_target_path_posix = prelim_target_path_posix
-                                            existing_files_replaced.append(sync_source_path_posix)
-                                        elif self.stored_settings.sync_existing_file_mode == 'rename':
-                                            renamed_path_posix = MyTools.create_unique_file_path(prelim_target_path_posix)
-                                            process_log.append(f"{tab}{tab}{tab}existing target-file, source-file renamed")
-                                            copy_target_path_posix = renamed_path_posix
-                                            existing_files_renamed.append(sync_source_path_posix)
+                                    if copy_target_path_posix:
+                                        copy_error = copy_futures[copy_target_path_posix].result()[copy_idx]
+                                        if copy_error is None:
+                                            if verbose_log:
+                                                process_log.append(f"{tab}{tab}{tab}✔ target-file stored as '{copy_target_path_posix}'...")
                                         else:
-                                            # sollte eigentlich nicht vorkommen
-                                            process_log.append(f"{tab}{tab}{tab}target-file already exists, skip file and sync...")
-                                            existing_files_skipped.append(sync_source_path_posix)
+                                            process_log.append(f"<b>{tab}{tab}{tab}⭍ target-file storage as '{copy_target_path_posix}' failed ({copy_error}), skip file and sync...</b>")
+                                            error_fids.append(sync_source_feature.id())
+                                            error_files.append(sync_source_path_posix)
                                             continue
-                                    else:
-                                        # file with this path not found
-                                        copy_target_path_posix = prelim_target_path_posix
-                                        process_log.append(f"{tab}{tab}{tab}no target-file found, copy source-file")
-                                        copied_files.append(sync_source_path_posix)
 
-                                    if copy_target_path_posix:
-                                        # https://docs.python.org/3/library/shutil.html
-                                        # Copy/rename the file
-                                        # copy2 => permissions and metadata are preserved
+                                    if source_geom and transform_source_geoms:
                                         try:
-                                            shutil.copy2(sync_source_path_posix, copy_target_path_posix)
-                                            process_log.append(f"{tab}{tab}{tab}✔ target-file stored as '{copy_target_path_posix}'...")
-                                            sync_target_path_posix = copy_target_path_posix
-                                        except:
-                                            process_log.append(f"<b>{tab}{tab}{tab}⭍ target-file storage as '{copy_target_path_posix}' failed, skip file and sync.../b>")
+                                            source_geom.transform(tr_source_2_target)
+                                        except qgis._core.QgsCsException as e:
+                                            # one not transformable geometry must not abort the sync with already copied files
+                                            process_log.append(f"<b>{tab}{tab}{tab}⭍ geometry not transformable to target-crs ({e}), skip sync...</b>")
                                             error_fids.append(sync_source_feature.id())
-                                            error_files.append(sync_source_path_posix)
                                             continue
 
-                                if sync_target_path_posix:
                                     insert_features = []
                                     update_overwrite_features = []
                                     update_preserve_features = []
 
-                                    duplicate_features = list(MyTools.get_features_by_value(sync_target_layer, self.stored_settings.sync_target_abs_path_field, sync_target_path_posix.as_posix()))
+                                    sync_target_path_str = sync_target_path_posix.as_posix()
+                                    duplicate_fids_by_path = target_fids_by_path.get(sync_target_path_str)
 
-                                    if duplicate_features:
-                                        if self.stored_settings.sync_existing_feature_mode == 'skip':
-                                            process_log.append(f"{tab}{tab}{tab}{len(duplicate_features)} feature(s) with duplicate path found, feature skipped")
+                                    # 'skip', 'replace' and 'insert' need the fids only, features fetched for 'update_*'
+                                    if duplicate_fids_by_path:
+                                        num_duplicates = len(duplicate_fids_by_path)
+                                        if sync_existing_feature_mode == 'skip':
+                                            if verbose_log:
+                                                process_log.append(f"{tab}{tab}{tab}{num_duplicates} feature(s) with duplicate path found, feature skipped")
                                             duplicate_fids.append(sync_source_feature.id())
-                                        elif self.stored_settings.sync_existing_feature_mode == 'replace':
-                                            process_log.append(f"{tab}{tab}{tab}{len(duplicate_features)} feature(s) with duplicate path found, features deleted and new feature inserted")
-                                            for duplicate_feature in duplicate_features:
-                                                sync_target_layer.deleteFeature(duplicate_feature.id())
-                                            sync_target_feature = qgis._core.QgsFeature(sync_target_layer.dataProvider().fields())
+                                        elif sync_existing_feature_mode == 'replace':
+                                            if verbose_log:
+                                                process_log.append(f"{tab}{tab}{tab}{num_duplicates} feature(s) with duplicate path found, features deleted and new feature inserted")
+                                            # deleted later in batches, already removed from the index
+                                            pending_delete_fids.extend(target_fids_by_path.pop(sync_target_path_str))
+                                            if len(pending_delete_fids) >= self.sync_edit_batch_size:
+                                                sync_target_layer.deleteFeatures(pending_delete_fids)
+                                                pending_delete_fids.clear()
+                                            sync_target_feature = qgis._core.QgsFeature(target_fields)
                                             insert_features.append(sync_target_feature)
-                                        elif self.stored_settings.sync_existing_feature_mode == 'insert':
-                                            process_log.append(f"{tab}{tab}{tab}{len(duplicate_features)} feature(s) with duplicate path found, insert new duplicate")
-                                            sync_target_feature = qgis._core.QgsFeature(sync_target_layer.dataProvider().fields())
+                                        elif sync_existing_feature_mode == 'insert':
+                                            if verbose_log:
+                                                process_log.append(f"{tab}{tab}{tab}{num_duplicates} feature(s) with duplicate path found, insert new duplicate")
+                                            sync_target_feature = qgis._core.QgsFeature(target_fields)
                                             insert_features.append(sync_target_feature)
-                                        elif self.stored_settings.sync_existing_feature_mode == 'update_overwrite':
-                                            process_log.append(f"{tab}{tab}{tab}{len(duplicate_features)} feature(s) with duplicate path found, update duplicate(s) replacing existing attributes")
-                                            update_overwrite_features = duplicate_features
-                                        elif self.stored_settings.sync_existing_feature_mode == 'update_preserve':
-                                            process_log.append(f"{tab}{tab}{tab}{len(duplicate_features)} feature(s) with duplicate path found, update duplicate(s) keeping existing attributes")
-                                            update_preserve_features = duplicate_features
+                                        elif sync_existing_feature_mode == 'update_overwrite':
+                                            if verbose_log:
+                                                process_log.append(f"{tab}{tab}{tab}{num_duplicates} feature(s) with duplicate path found, update duplicate(s) replacing existing attributes")
+                                            duplicate_request.setFilterFids(duplicate_fids_by_path)
+                                            update_overwrite_features = list(sync_target_layer.getFeatures(duplicate_request))
+                                        elif sync_existing_feature_mode == 'update_preserve':
+                                            if verbose_log:
+                                                process_log.append(f"{tab}{tab}{tab}{num_duplicates} feature(s) with duplicate path found, update duplicate(s) keeping existing attributes")
+                                            duplicate_request.setFilterFids(duplicate_fids_by_path)
+                                            update_preserve_features = list(sync_target_layer.getFeatures(duplicate_request))
                                     else:
-                                        sync_target_feature = qgis._core.QgsFeature(sync_target_layer.dataProvider().fields())
+                                        sync_target_feature = qgis._core.QgsFeature(target_fields)
                                         insert_features.append(sync_target_feature)
 
-                                    source_geom = None
-                                    if sync_source_feature.hasGeometry():
-                                        source_geom = sync_source_feature.geometry()
-                                        source_geom.transform(tr_source_2_target)
+                                    # source-values read once per feature, no attribute-access per mapped field
+                                    source_attributes = sync_source_feature.attributes()
 
                                     for insert_feature in insert_features:
 
                                         if source_geom:
                                             insert_feature.setGeometry(source_geom)
 
-                                        insert_feature[self.stored_settings.sync_target_abs_path_field] = sync_target_path_posix.as_posix()
-
-                                        for sync_target_field_name, sync_source_field_name in self.stored_settings.sync_fields.items():
-                                            insert_feature[sync_target_field_name] = sync_source_feature[sync_source_field_name]
-
-                                        sync_target_layer.addFeature(insert_feature)
-
-                                        process_log.append(f"{tab}{tab}{tab}{tab}✔ insert successful")
+                                        # values collected by field-index and set together via setAttributes
+                                        insert_attributes = insert_feature.attributes()
+                                        insert_attributes[target_abs_path_idx] = sync_target_path_str
+                                        for target_field_idx, source_field_idx in sync_field_idcs:
+                                            insert_attributes[target_field_idx] = source_attributes[source_field_idx]
+                                        insert_feature.setAttributes(insert_attributes)
+
+                                        if duplicate_check:
+                                            sync_target_layer.addFeature(insert_feature)
+                                            # addFeature sets the (temporary) fid
+                                            target_fids_by_path.setdefault(sync_target_path_str, []).append(insert_feature.id())
+                                        else:
+                                            # fid not required => inserted in batches
+                                            pending_insert_features.append(insert_feature)
+                                            if len(pending_insert_features) >= self.sync_edit_batch_size:
+                                                sync_target_layer.addFeatures(pending_insert_features)
+                                                pending_insert_features.clear()
+
+                                        if verbose_log:
+                                            process_log.append(f"{tab}{tab}{tab}{tab}✔ insert successful")
                                         insert_fids.append(sync_source_feature.id())
 
+                                    # changeAttributeValues/changeGeometry with old values: only the changed attributes, no re-fetch and compare of the whole feature like updateFeature
                                     for update_overwrite_feature in update_overwrite_features:
-                                        if source_geom and self.stored_settings.sync_update_geometries:
-                                            update_overwrite_feature.setGeometry(source_geom)
-                                            process_log.append(f"{tab}{tab}{tab}{tab}✔ setGeometry successful")
-
-                                        update_overwrite_feature[self.stored_settings.sync_target_abs_path_field] = sync_target_path_posix.as_posix()
+                                        feature_changed = False
+                                        if source_geom and sync_update_geometries and not update_overwrite_feature.geometry().equals(source_geom):
+                                            sync_target_layer.changeGeometry(update_overwrite_feature.id(), source_geom)
+                                            if verbose_log:
+                                                process_log.append(f"{tab}{tab}{tab}{tab}✔ setGeometry successful")
+                                            feature_changed = True
 
-                                        for sync_target_field_name, sync_source_field_name in self.stored_settings.sync_fields.items():
-                                            update_overwrite_feature[sync_target_field_name] = sync_source_feature[sync_source_field_name]
+                                        old_attributes = update_overwrite_feature.attributes()
+                                        new_values = {target_abs_path_idx: sync_target_path_str}
+                                        for target_field_idx, source_field_idx in sync_field_idcs:
+                                            new_values[target_field_idx] = source_attributes[source_field_idx]
 
-                                        sync_target_layer.updateFeature(update_overwrite_feature)
+                                        changed_values = {field_idx: value for field_idx, value in new_values.items() if value != old_attributes[field_idx]}
+                                        if changed_values:
+                                            sync_target_layer.changeAttributeValues(update_overwrite_feature.id(), changed_values, {field_idx: old_attributes[field_idx] for field_idx in changed_values})
+                                            feature_changed = True
 
-                                        process_log.append(f"{tab}{tab}{tab}{tab}✔ update_overwrite successful")
-                                        update_fids.append(sync_source_feature.id())
+                                        if feature_changed:
+                                            if verbose_log:
+                                                process_log.append(f"{tab}{tab}{tab}{tab}✔ update_overwrite successful")
+                                            update_fids.append(sync_source_feature.id())
+                                        else:
+                                            duplicate_fids.append(sync_source_feature.id())
 
                                     for update_preserve_feature in update_preserve_features:
                                         feature_changed = False
-                                        if source_geom and self.stored_settings.sync_update_geometries and not update_preserve_feature.hasGeometry():
-                                            update_preserve_feature.setGeometry(source_geom)
-                                            process_log.append(f"{tab}{tab}{tab}{tab}✔ setGeometry successful")
+                                        if source_geom and sync_update_geometries and not update_preserve_feature.hasGeometry():
+                                            sync_target_layer.changeGeometry(update_preserve_feature.id(), source_geom)
+                                            if verbose_log:
+                                                process_log.append(f"{tab}{tab}{tab}{tab}✔ setGeometry successful")
                                             feature_changed = True
 
-                                        if update_preserve_feature[self.stored_settings.sync_target_abs_path_field] != sync_target_path_posix.as_posix():
-                                            update_preserve_feature[self.stored_settings.sync_target_abs_path_field] = sync_target_path_posix.as_posix()
-                                            feature_changed = True
+                                        old_attributes = update_preserve_feature.attributes()
+                                        changed_values = {}
+                                        if old_attributes[target_abs_path_idx] != sync_target_path_str:
+                                            changed_values[target_abs_path_idx] = sync_target_path_str
 
-                                        for sync_target_field_name, sync_source_field_name in self.stored_settings.sync_fields.items():
+                                        for target_field_idx, source_field_idx in sync_field_idcs:
+                                            target_value = old_attributes[target_field_idx]
+                                            source_value = source_attributes[source_field_idx]
+                                            # target empty and source not empty => different values
+                                            if target_value in EMPTY_VALUES and source_value not in EMPTY_VALUES:
+                                                changed_values[target_field_idx] = source_value
 
-                                            if update_preserve_feature[sync_target_field_name] in [qgis.core.NULL, None, ''] and sync_source_feature[sync_source_field_name] not in [qgis.core.NULL, None, ''] and update_preserve_feature[sync_target_field_name] != sync_source_feature[sync_source_field_name]:
-                                                update_preserve_feature[sync_target_field_name] = sync_source_feature[sync_source_field_name]
-                                                feature_changed = True
+                                        if changed_values:
+                                            sync_target_layer.changeAttributeValues(update_preserve_feature.id(), changed_values, {field_idx: old_attributes[field_idx] for field_idx in changed_values})
+                                            feature_changed = True
 
                                         if feature_changed:
-                                            sync_target_layer.updateFeature(update_preserve_feature)
-                                            process_log.append(f"{tab}{tab}{tab}{tab}✔ update_preserve successful")
+                                            if verbose_log:
+                                                process_log.append(f"{tab}{tab}{tab}{tab}✔ update_preserve successful")
                                             update_fids.append(sync_source_feature.id())
                                         else:
                                             duplicate_fids.append(sync_source_feature.id())
 
-
-
-                            else:
-                                error_fids.append(sync_source_feature.id())
-                                process_log.append(f"<b>{tab}{tab}{tab}⭍ file not found, skip...</b>")
-                                missing_files.append(sync_source_path_posix)
-                                continue
-
-                        process_log.append(f"{tab}...Feature-Iteration-End")
-                        process_log.append(f"{tab}{len(copied_files)} files copied")
-                        process_log.append(f"{tab}{len(existing_files_kept)} files kept in place")
-                        process_log.append(f"{tab}{len(existing_files_skipped)} existing files skipped")
-                        process_log.append(f"{tab}{len(existing_files_replaced)} existing files replaced")
-                        process_log.append(f"{tab}{len(insert_fids)} features inserted")
-                        process_log.append(f"{tab}{len(update_fids)} features updated")
-                        process_log.append(f"{tab}{len(duplicate_fids)} duplicate features skipped")
-                        process_log.append(f"{tab}{len(error_fids)} features with errors skipped and selected")
+                                if not verbose_log:
+                                    self.tool_drop_empty_log_header(process_log, header_idx)
+
+                        # summary: one line per log-entry, rendered line by line in dlg_show_log
+                        process_log.extend([
+                            f"{tab}...Feature-Iteration-End",
+                            f"{tab}{len(copied_files)} files copied",
+                            f"{tab}{len(existing_files_kept)} files kept in place",
+                            f"{tab}{len(existing_files_skipped)} existing files skipped",
+                            f"{tab}{len(existing_files_replaced)} existing files replaced",
+                            f"{tab}{len(insert_fids)} features inserted",
+                            f"{tab}{len(update_fids)} features updated",
+                            f"{tab}{len(duplicate_fids)} duplicate features skipped",
+                            f"{tab}{len(error_fids)} features with errors skipped and selected",
+                        ])
 
                         sync_source_layer.selectByIds(error_fids)
                     else:
@@ -1769,14 +2743,19 @@ class FileSync(object):
         process_log.append(f"{time.strftime('%H:%M:%S', time.localtime())} end synchronize, runtime {(time.perf_counter_ns() - t_1) * 1e-9:.5f} s")
         self.tool_append_to_log_history(process_log)
 
-    def tool_get_sync_source_field(self, sync_source_field_name):
-        """wrapper to get field by name from sync_source_layer"""
+    def tool_get_sync_source_field(self, sync_source_field_name, sync_source_layer=None):
+        """wrapper to get field by name from sync_source_layer
+        :param sync_source_field_name:
+        :param sync_source_layer: optional already resolved sync_source_layer, avoids the layer-lookup in loops over many fields
+        """
         # Rev. 2025-06-11
-        sync_source_layer = self.tool_get_sync_source_layer()
+        if sync_source_layer is None:
+            sync_source_layer = self.tool_get_sync_source_layer()
         if sync_source_layer:
-            fnx = sync_source_layer.fields().indexOf(sync_source_field_name)
+            sync_source_fields = sync_source_layer.fields()
+            fnx = sync_source_fields.indexOf(sync_source_field_name)
             if fnx >= 0:
-                return sync_source_layer.fields()[fnx]
+                return sync_source_fields[fnx]
 
         return None
 
@@ -1793,33 +2772,15 @@ class FileSync(object):
     def tool_get_sync_source_layer(self) -> qgis._core.QgsVectorLayer:
         """wrapper to get and check sync_source_layer by self.stored_settings.sync_source_layer_id"""
         # Rev. 2025-06-11
-        point_wkb_types = [
-            qgis._core.QgsWkbTypes.Point,
-            qgis._core.QgsWkbTypes.PointZ,
-            qgis._core.QgsWkbTypes.PointM,
-            qgis._core.QgsWkbTypes.PointZM,
-        ]
         #  and sync_source_layer.dataProvider().wkbType() in point_wkb_types
-        if self.stored_settings.sync_source_layer_id:
-            sync_source_layer = qgis._core.QgsProject.instance().mapLayer(self.stored_settings.sync_source_layer_id)
-            if (sync_source_layer and sync_source_layer.isValid() and sync_source_layer.type() == qgis._core.Qgis.LayerType.VectorLayer):
-                return sync_source_layer
+        return self.tool_get_checked_layer('sync_source_layer_id', True)
 
     def tool_get_sync_target_layer(self) -> qgis._core.QgsVectorLayer:
         """wrapper to get and check sync_target_layer by self.stored_settings.sync_target_layer_id"""
         # Rev. 2025-06-11
-        point_wkb_types = [
-            qgis._core.QgsWkbTypes.Point,
-            qgis._core.QgsWkbTypes.PointZ,
-            qgis._core.QgsWkbTypes.PointM,
-            qgis._core.QgsWkbTypes.PointZM,
-        ]
 
         # and sync_target_layer.dataProvider().wkbType() in point_wkb_types
-        if self.stored_settings.sync_target_layer_id:
-            sync_target_layer = qgis._core.QgsProject.instance().mapLayer(self.stored_settings.sync_target_layer_id)
-            if (sync_target_layer and sync_target_layer.isValid() and sync_target_layer.type() == qgis._core.Qgis.LayerType.VectorLayer and sync_target_layer.dataProvider().name() != 'virtual'):
-                return sync_target_layer
+        return self.tool_get_checked_layer('sync_target_layer_id', False)
 
     def tool_get_post_scan_layer(self) -> qgis._core.QgsVectorLayer:
         """wrapper to get and check post_scan_layer by self.stored_settings.post_scan_layer_id"""
@@ -1832,20 +2793,46 @@ class FileSync(object):
         #     qgis._core.QgsWkbTypes.PointZM,
         # ]
         # sync_target_layer.dataProvider().wkbType() in point_wkb_types and
-        if self.stored_settings.post_scan_layer_id:
-            post_scan_layer = qgis._core.QgsProject.instance().mapLayer(self.stored_settings.post_scan_layer_id)
-            # new: any vectorlayer with absolute_path-field independend from GeometryType
-            if (post_scan_layer and post_scan_layer.isValid() and post_scan_layer.type() == qgis._core.Qgis.LayerType.VectorLayer and post_scan_layer.dataProvider().name() != 'virtual'):
-                return post_scan_layer
+        # new: any vectorlayer with absolute_path-field independend from GeometryType
+        return self.tool_get_checked_layer('post_scan_layer_id', False)
+
+    def tool_get_checked_layer(self, setting_name: str, allow_virtual: bool) -> qgis._core.QgsVectorLayer | None:
+        """get and check a vector-layer by the layer-id stored in self.stored_settings
+        project-lookup and type-checks once, cached until the layer-id changes or the layer is removed from the project, see sys_project_layersWillBeRemoved
+        :param setting_name: 'sync_source_layer_id', 'sync_target_layer_id' or 'post_scan_layer_id'
+        :param allow_virtual: False => no layers with virtual data-provider
+        :return: layer or None
+        """
+        # Rev. 2025-06-11
+        layer_id = getattr(self.stored_settings, setting_name)
+        if layer_id:
+            cached_layer = self.checked_layers.get(setting_name)
+            if cached_layer and cached_layer[0] == layer_id:
+                layer = cached_layer[1]
+            else:
+                layer = qgis._core.QgsProject.instance().mapLayer(layer_id)
+                if layer and layer.type() == qgis._core.Qgis.LayerType.VectorLayer and (allow_virtual or layer.dataProvider().name() != 'virtual'):
+                    self.checked_layers[setting_name] = (layer_id, layer)
+                else:
+                    return None
 
-    def tool_get_sync_target_field(self, sync_target_field_name):
-        """wrapper to get field by name from sync_target_layer"""
+            # validity checked each time, f.e. data-source not available
+            if layer.isValid():
+                return layer
+
+    def tool_get_sync_target_field(self, sync_target_field_name, sync_target_layer=None):
+        """wrapper to get field by name from sync_target_layer
+        :param sync_target_field_name:
+        :param sync_target_layer: optional already resolved sync_target_layer, avoids the layer-lookup in loops over many fields
+        """
         # Rev. 2025-06-11
-        sync_target_layer = self.tool_get_sync_target_layer()
+        if sync_target_layer is None:
+            sync_target_layer = self.tool_get_sync_target_layer()
         if sync_target_layer:
-            fnx = sync_target_layer.fields().indexOf(sync_target_field_name)
+            sync_target_fields = sync_target_layer.fields()
+            fnx = sync_target_fields.indexOf(sync_target_field_name)
             if fnx >= 0:
-                return sync_target_layer.fields()[fnx]
+                return sync_target_fields[fnx]
             # else:
             # self.iface.messageBar().pushMessage("FileSync", f"sync-target-field '{sync_target_field_name}' not found in '{sync_target_layer.name()}'", level=qgis._core.Qgis.Info, duration=5)
             # pass
@@ -1857,12 +2844,6 @@ class FileSync(object):
     def dlg_add_sync_mapping(self):
         """checks and adds a source-field to target-field mapping to self.stored_settings.sync_fields"""
         # Rev. 2025-06-11
-        int_types = [
-            QtCore.QVariant.Int,
-            QtCore.QVariant.LongLong,
-            QtCore.QVariant.UInt,
-            QtCore.QVariant.ULongLong,
-        ]
         if self.my_dialog.qlw_sync_source_layer_fields.selectedItems():
             source_qlwi = self.my_dialog.qlw_sync_source_layer_fields.selectedItems()[0]
             sync_source_field_name = source_qlwi.data(QtCore.Qt.DisplayRole)
@@ -1876,7 +2857,7 @@ class FileSync(object):
                     sync_target_field = self.tool_get_sync_target_field(sync_target_field_name)
 
                     if sync_target_field:
-                        if sync_source_field.type() == sync_target_field.type() or (sync_source_field.type() in int_types and sync_target_field.type() in int_types):
+                        if sync_source_field.type() == sync_target_field.type() or (sync_source_field.type() in INT_TYPES and sync_target_field.type() in INT_TYPES):
                             # check for duplicates
                             if sync_target_field_name in [self.stored_settings.sync_target_abs_path_field]:
                                 self.iface.messageBar().pushMessage("FileSync", f"Target-Field '{sync_target_field_name}' already registered as sync_target_abs_path_field", level=qgis._core.Qgis.Info, duration=5)
@@ -1915,13 +2896,6 @@ class FileSync(object):
         """source-field in qlw_sync_source_layer_fields selected => show mappable target fields in qlw_sync_target_layer_fields"""
         # Rev. 2025-06-11
 
-        int_types = [
-            QtCore.QVariant.Int,
-            QtCore.QVariant.LongLong,
-            QtCore.QVariant.UInt,
-            QtCore.QVariant.ULongLong,
-        ]
-
         # selectedItems will be empty, if selection was cleared with mit strg + click
         if self.my_dialog.qlw_sync_source_layer_fields.selectedItems():
             source_qlwi = self.my_dialog.qlw_sync_source_layer_fields.selectedItems()[0]
@@ -1929,26 +2903,24 @@ class FileSync(object):
             sync_source_field = self.tool_get_sync_source_field(sync_source_field_name)
 
             if sync_source_field:
-                default_flag = QtCore.Qt.ItemFlags(53)
-                not_selectable_flag = QtCore.Qt.ItemFlags(21)
+                sync_target_layer = self.tool_get_sync_target_layer()
                 for rc in range(self.my_dialog.qlw_sync_target_layer_fields.model().rowCount()):
                     target_qlwi = self.my_dialog.qlw_sync_target_layer_fields.item(rc)
                     sync_target_field_name = target_qlwi.data(QtCore.Qt.DisplayRole)
-                    sync_target_field = self.tool_get_sync_target_field(sync_target_field_name)
+                    sync_target_field = self.tool_get_sync_target_field(sync_target_field_name, sync_target_layer)
                     if sync_target_field:
                         # disable already assigned fields
                         if sync_target_field.name() in [self.stored_settings.sync_target_abs_path_field] or sync_target_field.name() in self.stored_settings.sync_fields:
-                            # not_selectable_flag
-                            target_qlwi.setFlags(not_selectable_flag)
+                            target_qlwi.setFlags(ITEM_FLAGS_NOT_SELECTABLE)
                             target_qlwi.setSelected(False)
 
                         # disable not matching field-types
-                        elif not (sync_source_field.type() == sync_target_field.type() or (sync_source_field.type() in int_types and sync_target_field.type() in int_types)):
-                            target_qlwi.setFlags(not_selectable_flag)
+                        elif not (sync_source_field.type() == sync_target_field.type() or (sync_source_field.type() in INT_TYPES and sync_target_field.type() in INT_TYPES)):
+                            target_qlwi.setFlags(ITEM_FLAGS_NOT_SELECTABLE)
                             target_qlwi.setSelected(False)
                         else:
                             # enable the rest and conveniently select if the field-names match
-                            target_qlwi.setFlags(default_flag)
+                            target_qlwi.setFlags(ITEM_FLAGS_DEFAULT)
                             if sync_source_field_name == sync_target_field_name:
                                 target_qlwi.setSelected(True)
 
@@ -2000,16 +2972,6 @@ class FileSync(object):
         populate self.my_dialog.qlw_sync_source_layer_fields, self.my_dialog.qcb_sync_source_abs_path_field and self.my_dialog.qcb_sync_source_rel_path_field"""
         # Rev. 2025-06-11
         if self.my_dialog:
-            string_types = [
-                QtCore.QVariant.String,
-                QtCore.QMetaType.QString,
-            ]
-
-            double_types = [
-                QtCore.QVariant.Double,
-                QtCore.QMetaType.Double
-            ]
-
             self.my_dialog.qlw_sync_source_layer_fields.blockSignals(True)
             self.my_dialog.qcb_sync_source_abs_path_field.blockSignals(True)
             self.my_dialog.qcb_sync_source_rel_path_field.blockSignals(True)
@@ -2033,7 +2995,7 @@ class FileSync(object):
                     # restriction only necessary for target-layer
                     self.my_dialog.qlw_sync_source_layer_fields.addItem(qlwi)
 
-                    if field.type() in string_types:
+                    if field.type() in STRING_TYPES:
                         self.my_dialog.qcb_sync_source_abs_path_field.addItem(field.name(), field)
                         self.my_dialog.qcb_sync_source_rel_path_field.addItem(field.name(), field)
 
@@ -2050,13 +3012,6 @@ class FileSync(object):
         """shows self.stored_settings.sync_fields in self.my_dialog.qtw_sync_mappings"""
         # Rev. 2025-06-11
         if self.my_dialog:
-            int_types = [
-                QtCore.QVariant.Int,
-                QtCore.QVariant.LongLong,
-                QtCore.QVariant.UInt,
-                QtCore.QVariant.ULongLong,
-            ]
-            is_enabled_flag = QtCore.Qt.ItemFlags(32)
             sync_source_layer = self.tool_get_sync_source_layer()
             sync_target_layer = self.tool_get_sync_target_layer()
 
@@ -2066,31 +3021,31 @@ class FileSync(object):
 
             if sync_source_layer and sync_target_layer:
                 for sync_target_field_name, sync_source_field_name in self.stored_settings.sync_fields.items():
-                    sync_target_field = self.tool_get_sync_target_field(sync_target_field_name)
-                    sync_source_field = self.tool_get_sync_source_field(sync_source_field_name)
-                    if sync_target_field and sync_source_field and (sync_target_field.type() == sync_source_field.type() or (sync_source_field.type() in int_types and sync_target_field.type() in int_types)):
+                    sync_target_field = self.tool_get_sync_target_field(sync_target_field_name, sync_target_layer)
+                    sync_source_field = self.tool_get_sync_source_field(sync_source_field_name, sync_source_layer)
+                    if sync_target_field and sync_source_field and (sync_target_field.type() == sync_source_field.type() or (sync_source_field.type() in INT_TYPES and sync_target_field.type() in INT_TYPES)):
                         rc = self.my_dialog.qtw_sync_mappings.rowCount()
                         self.my_dialog.qtw_sync_mappings.insertRow(rc)
 
                         source_qtwi = QtWidgets.QTableWidgetItem(sync_source_field_name)
-                        source_qtwi.setFlags(is_enabled_flag)
+                        source_qtwi.setFlags(ITEM_FLAGS_ENABLED)
                         ttp = f"Source-Field\nName: {sync_source_field_name}\nType: '{sync_source_field.friendlyTypeString()}'"
                         source_qtwi.setData(QtCore.Qt.ToolTipRole, ttp)
                         self.my_dialog.qtw_sync_mappings.setItem(rc, 0, source_qtwi)
 
                         arrow_qtwi = QtWidgets.QTableWidgetItem("➜")
-                        arrow_qtwi.setFlags(is_enabled_flag)
+                        arrow_qtwi.setFlags(ITEM_FLAGS_ENABLED)
                         self.my_dialog.qtw_sync_mappings.setItem(rc, 1, arrow_qtwi)
 
                         target_qtwi = QtWidgets.QTableWidgetItem(sync_target_field_name)
-                        target_qtwi.setFlags(is_enabled_flag)
+                        target_qtwi.setFlags(ITEM_FLAGS_ENABLED)
                         ttp = f"Target-Field\nName: {sync_target_field_name}\nType: '{sync_target_field.friendlyTypeString()}'"
                         target_qtwi.setData(QtCore.Qt.ToolTipRole, ttp)
                         self.my_dialog.qtw_sync_mappings.setItem(rc, 2, target_qtwi)
 
                         delete_qtwi = QtWidgets.QTableWidgetItem("✖")
                         delete_qtwi.setToolTip("remove mapping")
-                        delete_qtwi.setFlags(is_enabled_flag)
+                        delete_qtwi.setFlags(ITEM_FLAGS_ENABLED)
                         self.my_dialog.qtw_sync_mappings.setItem(rc, 3, delete_qtwi)
                     else:
                         # fields do not match anymore, field-type must have changed somehow
@@ -2100,10 +3055,6 @@ class FileSync(object):
         """refreshes self.my_dialog.qcb_post_scan_abs_path_field after change of post_scan_layer"""
         # Rev. 2025-06-11
 
-        string_types = [
-            QtCore.QVariant.String,
-            QtCore.QMetaType.QString,
-        ]
         self.my_dialog.qcb_post_scan_abs_path_field.blockSignals(True)
 
         self.my_dialog.qcb_post_scan_abs_path_field.clear()
@@ -2112,7 +3063,7 @@ class FileSync(object):
         post_scan_layer = self.tool_get_post_scan_layer()
         if post_scan_layer:
             for field in post_scan_layer.dataProvider().fields():
-                if field.type() in string_types:
+                if field.type() in STRING_TYPES:
                     self.my_dialog.qcb_post_scan_abs_path_field.addItem(field.name(), field)
 
             MyTools.qcbx_select_by_value(self.my_dialog.qcb_post_scan_abs_path_field, self.stored_settings.post_scan_abs_path_field)
@@ -2123,15 +3074,6 @@ class FileSync(object):
         """refreshes qlw_sync_target_layer_fields and qcb_sync_target_abs_path_field after change of sync_target_layer"""
         # Rev. 2025-06-11
         if self.my_dialog:
-            string_types = [
-                QtCore.QVariant.String,
-                QtCore.QMetaType.QString,
-            ]
-
-            double_types = [
-                QtCore.QVariant.Double,
-                QtCore.QMetaType.Double
-            ]
             self.my_dialog.qlw_sync_target_layer_fields.blockSignals(True)
             self.my_dialog.qcb_sync_target_abs_path_field.blockSignals(True)
 
@@ -2139,7 +3081,6 @@ class FileSync(object):
             self.my_dialog.qcb_sync_target_abs_path_field.clear()
             self.my_dialog.qcb_sync_target_abs_path_field.addItem('')
             sync_target_layer = self.tool_get_sync_target_layer()
-            not_selectable_flag = QtCore.Qt.ItemFlags(21)
             if sync_target_layer:
                 f_idx = 0
                 pk_idcs = sync_target_layer.primaryKeyAttributes()
@@ -2152,11 +3093,11 @@ class FileSync(object):
 
                     # restriction for already assigned "special"-fields
                     if field.name() == self.stored_settings.sync_target_abs_path_field:
-                        qlwi.setFlags(not_selectable_flag)
+                        qlwi.setFlags(ITEM_FLAGS_NOT_SELECTABLE)
                         qlwi.setSelected(False)
                         ttp += "\nalready registered as Path-Field"
                     elif field.name() in self.stored_settings.sync_fields:
-                        qlwi.setFlags(not_selectable_flag)
+                        qlwi.setFlags(ITEM_FLAGS_NOT_SELECTABLE)
                         qlwi.setSelected(False)
                         ttp += "\nalready registered as Sync-Field"
 
@@ -2164,7 +3105,7 @@ class FileSync(object):
 
                     self.my_dialog.qlw_sync_target_layer_fields.addItem(qlwi)
 
-                    if field.type() in string_types:
+                    if field.type() in STRING_TYPES:
                         self.my_dialog.qcb_sync_target_abs_path_field.addItem(field.name(), field)
 
                     f_idx += 1
@@ -2202,7 +3143,8 @@ class FileSync(object):
             sync_source_layer = self.tool_get_sync_source_layer()
             if sync_source_layer:
                 self.my_dialog.qcbn_sync_source_layer.select_by_value([[0, Qt_Roles.RETURN_VALUE, QtCore.Qt.MatchExactly]], sync_source_layer, True)
-                self.dlg_refresh_sync_source_fields()
+            # also without layer, to clear the field-selectors
+            self.dlg_refresh_sync_source_fields()
 
             enable_criteria = {
                 # 'data_provider': ['ogr'],
@@ -2216,7 +3158,7 @@ class FileSync(object):
             sync_target_layer = self.tool_get_sync_target_layer()
             if sync_target_layer:
                 self.my_dialog.qcbn_sync_target_layer.select_by_value([[0, Qt_Roles.RETURN_VALUE, QtCore.Qt.MatchExactly]], sync_target_layer, True)
-                self.dlg_refresh_sync_target_fields()
+            self.dlg_refresh_sync_target_fields()
 
     def dlg_refresh_post_scan_layers(self):
         """refreshes list of selectable post_scan_layers"""
@@ -2299,6 +3241,7 @@ class FileSync(object):
                     self.my_dialog.qcb_select_pre_scan_patterns.setCurrentIndex(1)
 
                 self.stored_settings.pre_scan_sub_dirs = self.my_dialog.qcb_pre_scan_sub_dirs.isChecked()
+                self.stored_settings.pre_scan_parallel = self.my_dialog.qcb_pre_scan_parallel.currentData() or ''
 
                 # re-scan the widget
                 pre_scan_fields, pre_scan_rel_root_dir = self.file_meta_extractor.parse_pre_scan_widget()
@@ -2320,14 +3263,9 @@ class FileSync(object):
                 self.stored_settings.sync_source_rel_path_field = self.my_dialog.qcb_sync_source_rel_path_field.currentText()
                 self.stored_settings.sync_target_abs_path_field = self.my_dialog.qcb_sync_target_abs_path_field.currentText()
 
-                self.stored_settings.sync_fields = {}
-
-                for rc in range(self.my_dialog.qtw_sync_mappings.model().rowCount()):
-                    sync_source_qlwi = self.my_dialog.qtw_sync_mappings.item(rc, 0)
-                    sync_source_field_name = sync_source_qlwi.data(QtCore.Qt.DisplayRole)
-                    sync_target_qlwi = self.my_dialog.qtw_sync_mappings.item(rc, 2)
-                    sync_target_field_name = sync_target_qlwi.data(QtCore.Qt.DisplayRole)
-                    self.stored_settings.sync_fields[sync_target_field_name] = sync_source_field_name
+                # one pass over the table, key: target-field-name (column 2), value: source-field-name (column 0)
+                qtw_sync_mappings = self.my_dialog.qtw_sync_mappings
+                self.stored_settings.sync_fields = {qtw_sync_mappings.item(rc, 2).text(): qtw_sync_mappings.item(rc, 0).text() for rc in range(qtw_sync_mappings.rowCount())}
 
                 self.stored_settings.sync_file_mode = ''
                 if self.my_dialog.qrb_sync_file_mode_copy.isChecked():
@@ -2354,6 +3292,7 @@ class FileSync(object):
                 self.stored_settings.post_scan_rel_root_dir = ''
                 self.stored_settings.post_scan_preserve_existing = self.my_dialog.qcb_post_scan_preserve_existing.isChecked()
                 self.stored_settings.post_scan_update_geometry_from_exif = self.my_dialog.qcb_post_scan_update_geometry_from_exif.isChecked()
+                self.stored_settings.post_scan_parallel = self.my_dialog.qcb_post_scan_parallel.currentData() or ''
                 post_scan_layer = self.my_dialog.qcbn_post_scan_layer.currentData(Qt_Roles.RETURN_VALUE)
                 if post_scan_layer:
                     self.stored_settings.post_scan_layer_id = post_scan_layer.id()
@@ -2384,6 +3323,7 @@ class FileSync(object):
         if check_ok:
             process_log.append(f"{tab}✓ pre_scan_dir '{self.stored_settings.pre_scan_dir}'")
             process_log.append(f"{tab}✓ pre_scan_sub_dirs '{self.stored_settings.pre_scan_sub_dirs}'")
+            process_log.append(f"{tab}✓ pre_scan_parallel '{self.stored_settings.pre_scan_parallel}'")
             process_log.append(f"{tab}✓ pre_scan_patterns '{self.stored_settings.pre_scan_patterns}'")
             process_log.append(f"{tab}✓ pre_scan_epsg '{self.stored_settings.pre_scan_epsg}'")
             pre_scan_crs = qgis._core.QgsCoordinateReferenceSystem(self.stored_settings.pre_scan_epsg)
@@ -2414,20 +3354,18 @@ class FileSync(object):
                 self.my_dialog.qprb_pre_scan.setValue(0)
                 self.my_dialog.qlbl_pre_scan_progress.setText('')
 
-                layer_names = [layer.name() for layer in qgis._core.QgsProject.instance().mapLayers().values()]
+                layer_names = {layer.name() for layer in qgis._core.QgsProject.instance().mapLayers().values()}
                 template = f"pre_scan_result {self.stored_settings.pre_scan_dir}_{{curr_i}}"
                 pre_scan_layer_name = MyTools.get_unique_string(layer_names, template, 1)
 
                 # create the new temorary layer
                 # geometry-type PointZ to store GPS-altitude if exists
-                pre_scan_vl = qgis._core.QgsVectorLayer(f"PointZ?crs={self.stored_settings.pre_scan_epsg}&index=yes", pre_scan_layer_name, "memory")
+                # without index=yes: spatial-index created once after the features are added, see below
+                pre_scan_vl = qgis._core.QgsVectorLayer(f"PointZ?crs={self.stored_settings.pre_scan_epsg}", pre_scan_layer_name, "memory")
 
-                # populate fields
-                field_list = {}
-                for meta_name, field_name in self.stored_settings.pre_scan_fields.items():
-                    extract_field = self.file_meta_extractor.get_extract_field(meta_name, field_name)
-                    if extract_field:
-                        field_list[meta_name] = extract_field
+                # populate fields, get_extract_field returns None for metas not in extractable_file_metas
+                extractable_file_metas = self.file_meta_extractor.extractable_file_metas
+                field_list = {meta_name: self.file_meta_extractor.get_extract_field(meta_name, field_name) for meta_name, field_name in self.stored_settings.pre_scan_fields.items() if meta_name in extractable_file_metas}
 
                 pre_scan_vl.dataProvider().addAttributes(field_list.values())
                 pre_scan_vl.updateFields()
@@ -2444,26 +3382,58 @@ class FileSync(object):
                 wgs_84_crs = qgis._core.QgsCoordinateReferenceSystem("EPSG:4326")
                 tr_wgs_2_vl = qgis._core.QgsCoordinateTransform(wgs_84_crs, pre_scan_crs, qgis._core.QgsProject.instance())
 
-                pre_scan_vl.startEditing()
-
                 process_log.append(f"{tab}File-Iteration-Start...")
                 fc = 0
-                for posix_path in scan_result:
-                    # runtime-environment-independent: allways slash as directory separator
-                    fc += 1
-                    self.my_dialog.qprb_pre_scan.setValue(fc)
-                    self.my_dialog.qlbl_pre_scan_progress.setText(f"File {fc} from {num_files}")
-                    feature = qgis._core.QgsFeature(pre_scan_vl.dataProvider().fields())
+                field_indices = self.file_meta_extractor.get_field_indices(pre_scan_vl.fields())
+                # features added together after the batch-transformation of their exif-gps-coords
+                pre_scan_features = []
+                gps_points = []
+                # progress-display max. 200 times, each setValue repaints the QProgressBar
+                progress_step = max(1, num_files // 200)
+                verbose_log = self.stored_settings.verbose_log
+                # settings and fields used per file, bound once
+                pre_scan_fields = self.stored_settings.pre_scan_fields
+                pre_scan_rel_root_dir = self.stored_settings.pre_scan_rel_root_dir
+                pre_scan_provider_fields = pre_scan_vl.dataProvider().fields()
+                with self.file_meta_extractor.meta_cache_batch():
+                    if self.stored_settings.pre_scan_parallel == 'threads':
+                        # hash, xmp, exif... in a thread-pool, pipelined with the feature-creation in this loop
+                        parallel_results = self.file_meta_extractor.iter_expensive_metas_threaded(scan_result, pre_scan_fields, True, scan_result)
+                    else:
+                        parallel_results = [({}, []) for posix_path in scan_result]
+
+                    for posix_path, (extracted_metas, parallel_log) in zip(scan_result, parallel_results):
+                        # runtime-environment-independent: allways slash as directory separator
+                        fc += 1
+                        if not fc % progress_step or fc == num_files:
+                            self.my_dialog.qprb_pre_scan.setValue(fc)
+                            self.my_dialog.qlbl_pre_scan_progress.setText(f"File {fc} from {num_files}")
+                        feature = qgis._core.QgsFeature(pre_scan_provider_fields)
 
-                    extract_ok, feature_altered, extract_log = self.file_meta_extractor.extract_file_metas(posix_path, feature, self.stored_settings.pre_scan_fields, self.stored_settings.pre_scan_rel_root_dir, False, True, tr_wgs_2_vl)
+                        extract_ok, feature_altered, extract_log = self.file_meta_extractor.extract_file_metas(posix_path, feature, pre_scan_fields, pre_scan_rel_root_dir, False, True, tr_wgs_2_vl, extracted_metas, field_indices, gps_points, scan_result[posix_path])
 
-                    process_log += extract_log
+                        pre_scan_features.append(feature)
 
-                    pre_scan_vl.dataProvider().addFeature(feature)
-                    process_log.append(f"{tab}{tab}✔ {posix_path.as_posix()}")
+                        if verbose_log:
+                            process_log += parallel_log
+                            process_log += extract_log
+                            process_log.append(f"{tab}{tab}✔ {posix_path.as_posix()}")
+                        else:
+                            problem_log = [log_line for log_line in parallel_log + extract_log if log_line.startswith('<b>')]
+                            if problem_log:
+                                process_log.append(f"{tab}{tab}{posix_path.as_posix()}")
+                                process_log += problem_log
+
+                # not transformable points are logged, their features are added without geometry
+                process_log += self.file_meta_extractor.transform_gps_points(gps_points, tr_wgs_2_vl)
+                # new temporary layer: written directly to the provider, no edit-buffer and no undo-stack
+                # FastInsert => the provider does not update the fids of pre_scan_features, not used afterwards
+                pre_scan_vl.dataProvider().addFeatures(pre_scan_features, qgis._core.QgsFeatureSink.FastInsert)
+                # memory-provider-index for rendering and selection, built in one pass instead of one insert per added feature
+                pre_scan_vl.dataProvider().createSpatialIndex()
+                pre_scan_vl.updateExtents()
 
                 process_log.append(f"{tab}...File-Iteration-End")
-                pre_scan_vl.commitChanges()
 
                 self.iface.showAttributeTable(pre_scan_vl)
 
@@ -2514,6 +3484,9 @@ class FileSync(object):
         # Rev. 2025-06-11
         self.sys_store_settings()
 
+        if self._file_meta_extractor is not None:
+            self.file_meta_extractor.close_meta_cache()
+
         self.iface.removeToolBarIcon(self.qact_open_dialog)
         self.iface.removeToolBarIcon(self.qact_show_help)
         self.iface.removePluginMenu('FileSync', self.qact_open_dialog)
@@ -2554,9 +3527,10 @@ class FileSync(object):
                     cl.reload()
 
     def sys_restore_settings(self):
-        """restore last-usage-settings from ini-file (Name => self.ini_storage_file_name file)
-        Unix: /home/_user_name_/.QGis_FileSync_Plugin.ini
-        Windows: c:/Users/_user_name_/.QGis_FileSync_Plugin.ini
+        """restore last-usage-settings from json-file (Name => self.json_storage_file_name file)
+        Unix: /home/_user_name_/.QGis_FileSync_Plugin.json
+        Windows: c:/Users/_user_name_/.QGis_FileSync_Plugin.json
+        if not available, the settings of previous versions are migrated once from the ini-file (Name => self.ini_storage_file_name file)
 
         Note:
             Settings are stored independend from QgsProject, so all layer- and field-references probably do not match if a new or an other project ist openend
@@ -2569,96 +3543,45 @@ class FileSync(object):
 
         self.stored_settings = StoredSettings()
 
-        # for prop_name in StoredSettings._str_props:
-        #     restored_value, type_conversion_ok = qgis._core.QgsProject.instance().readEntry('FileSync', prop_name)
-        #     if type_conversion_ok:
-        #         debug_log(prop_name,restored_value)
-        #         setattr(self.stored_settings, prop_name, restored_value)
-        #
-        #
-        #
-        # check_ok, check_log = self.sys_check_settings()
-        # # note: restore_settings_log ist shown on first dlg_init
-        # self.restore_settings_log += check_log
-        #
-        # return
-
-        int_types = [
-            QtCore.QVariant.Int,
-            QtCore.QVariant.LongLong,
-            QtCore.QVariant.UInt,
-            QtCore.QVariant.ULongLong,
-        ]
-
-        config_object = ConfigParser()
+        json_path = Path(f'~/{self.json_storage_file_name}').expanduser()
 
-        config_object.optionxform = str
+        stored_settings_dict = None
+        try:
+            with open(json_path, encoding='utf-8') as json_file:
+                stored_settings_dict = json.load(json_file)
+            self.restore_settings_log += [f"{tab}restored settings from file '{json_path}'"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            self.restore_settings_log += [f"{tab}settings-file '{json_path}' not readable: {e}"]
 
-        ini_path = Path(f'~/{self.ini_storage_file_name}')
-
-        parsed_file_names = config_object.read(ini_path.expanduser())
-
-        if parsed_file_names:
-            self.restore_settings_log += [f"{tab}restored settings from file '{ini_path.expanduser()}'"]
-            if config_object.has_section('PRE_SCAN_SETTINGS'):
-                stored_settings_dict = config_object["PRE_SCAN_SETTINGS"]
-                # parse "as is", no check here
-                self.stored_settings.pre_scan_dir = stored_settings_dict.get('pre_scan_dir', '')
-                self.stored_settings.pre_scan_epsg = stored_settings_dict.get('pre_scan_epsg', '')
-
-                # Note: == 'True' because the ini-contents are read as strings
-                self.stored_settings.pre_scan_sub_dirs = stored_settings_dict.get('pre_scan_sub_dirs', '') == 'True'
-                self.stored_settings.pre_scan_patterns = stored_settings_dict.get('pre_scan_patterns', '')
-
-                self.stored_settings.pre_scan_rel_root_dir = stored_settings_dict.get('pre_scan_rel_root_dir', '')
-
-            if config_object.has_section('PRE_SCAN_FIELDS'):
-                self.stored_settings.pre_scan_fields = dict(config_object["PRE_SCAN_FIELDS"])
-
-            if config_object.has_section('SYNC_SETTINGS'):
-                stored_settings_dict = config_object["SYNC_SETTINGS"]
-
-                # no check here
-                self.stored_settings.sync_source_layer_id = stored_settings_dict.get('sync_source_layer_id', '')
-                self.stored_settings.sync_target_layer_id = stored_settings_dict.get('sync_target_layer_id', '')
-                self.stored_settings.sync_source_abs_path_field = stored_settings_dict.get('sync_source_abs_path_field', '')
-                self.stored_settings.sync_source_rel_path_field = stored_settings_dict.get('sync_source_rel_path_field', '')
-                self.stored_settings.sync_target_abs_path_field = stored_settings_dict.get('sync_target_abs_path_field', '')
-                self.stored_settings.sync_file_mode = stored_settings_dict.get('sync_file_mode', '')
-                self.stored_settings.sync_existing_file_mode = stored_settings_dict.get('sync_existing_file_mode', '')
-                self.stored_settings.sync_existing_feature_mode = stored_settings_dict.get('sync_existing_feature_mode', '')
-                self.stored_settings.sync_update_geometries = stored_settings_dict.get('sync_update_geometries', '') == 'True'
-
-                if stored_settings_dict.get('sync_target_dir'):
-                    if os.path.isdir(stored_settings_dict.get('sync_target_dir', '')):
-                        self.stored_settings.sync_target_dir = stored_settings_dict.get('sync_target_dir', '')
-
-            if config_object.has_section('SYNC_FIELDS'):
-                store_sync_fields = dict(config_object["SYNC_FIELDS"])
-                for title, mapping in store_sync_fields.items():
-                    # title => field_0, field_1... => only to get valid and unique ConfigParser-ini-key, content not used
-                    # mapping => f"{sync_target_field_name}{self.ini_delimiter}{sync_source_field_name}"
-                    try:
-                        (sync_target_field_name, sync_source_field_name) = mapping.split(self.ini_delimiter)
-                        sync_target_field = self.tool_get_sync_target_field(sync_target_field_name)
-                        sync_source_field = self.tool_get_sync_source_field(sync_source_field_name)
-                        if sync_target_field and sync_source_field and (sync_target_field.type() == sync_source_field.type() or (sync_source_field.type() in int_types and sync_target_field.type() in int_types)):
-                            self.stored_settings.sync_fields[sync_target_field_name] = sync_source_field_name
-                    except Exception as e:
-                        pass
+        if stored_settings_dict is None:
+            # previous versions: ini-file, migrated on next sys_store_settings
+            stored_settings_dict = self.sys_read_ini_settings()
+
+        if isinstance(stored_settings_dict, dict):
+            # parse "as is", only known properties with the default-type, no further check here
+            for prop_name, restored_value in stored_settings_dict.items():
+                if not prop_name.startswith('_') and hasattr(self.stored_settings, prop_name) and isinstance(restored_value, type(getattr(self.stored_settings, prop_name))):
+                    setattr(self.stored_settings, prop_name, restored_value)
 
-            if config_object.has_section('POST_SCAN_SETTINGS'):
-                stored_settings_dict = config_object["POST_SCAN_SETTINGS"]
+            # 'processes' of previous versions: worker-processes can't be started reliably from inside QGis, replaced by the thread-pipeline
+            for setting_name in ['pre_scan_parallel', 'post_scan_parallel']:
+                if getattr(self.stored_settings, setting_name) == 'processes':
+                    setattr(self.stored_settings, setting_name, 'threads')
 
-                # no check here
-                self.stored_settings.post_scan_layer_id = stored_settings_dict.get('post_scan_layer_id', '')
-                self.stored_settings.post_scan_abs_path_field = stored_settings_dict.get('post_scan_abs_path_field', '')
-                self.stored_settings.post_scan_rel_root_dir = stored_settings_dict.get('post_scan_rel_root_dir', '')
-                self.stored_settings.post_scan_preserve_existing = stored_settings_dict.get('post_scan_preserve_existing', '') == 'True'
-                self.stored_settings.post_scan_update_geometry_from_exif = stored_settings_dict.get('post_scan_update_geometry_from_exif', '') == 'True'
+            if self.stored_settings.sync_target_dir and not os.path.isdir(self.stored_settings.sync_target_dir):
+                self.stored_settings.sync_target_dir = ''
 
-            if config_object.has_section('POST_SCAN_FIELDS'):
-                self.stored_settings.post_scan_fields = dict(config_object["POST_SCAN_FIELDS"])
+            restored_sync_fields = self.stored_settings.sync_fields
+            self.stored_settings.sync_fields = {}
+            sync_source_layer = self.tool_get_sync_source_layer()
+            sync_target_layer = self.tool_get_sync_target_layer()
+            for sync_target_field_name, sync_source_field_name in restored_sync_fields.items():
+                sync_target_field = self.tool_get_sync_target_field(sync_target_field_name, sync_target_layer)
+                sync_source_field = self.tool_get_sync_source_field(sync_source_field_name, sync_source_layer)
+                if sync_target_field and sync_source_field and (sync_target_field.type() == sync_source_field.type() or (sync_source_field.type() in INT_TYPES and sync_target_field.type() in INT_TYPES)):
+                    self.stored_settings.sync_fields[sync_target_field_name] = sync_source_field_name
 
             check_ok, check_log = self.sys_check_settings()
             # note: restore_settings_log ist shown on first dlg_init
@@ -2667,78 +3590,87 @@ class FileSync(object):
         else:
             self.restore_settings_log += [f"{tab}no stored settings"]
 
-    def sys_store_settings(self):
-        """store current settings to ini-file (Name => self.ini_storage_file_name file)
-        Unix: /home/_user_name_/.QGis_FileSync_Plugin.ini
-        Windows: c:/Users/_user_name_/.QGis_FileSync_Plugin.ini
-
-        Note:
-            Settings are stored independend from QgsProject, so all layer- and field-references probably do not match if a new or an other project ist openend
+    def sys_read_ini_settings(self) -> dict | None:
+        """read the settings of previous plugin-versions from ini-file (Name => self.ini_storage_file_name file)
+        used once to migrate to json-file
+        :return: dictionary property-name => value like StoredSettings or None if no ini-file available
         """
         # Rev. 2025-06-11
 
-        # Create a ConfigParser object
-        # https://docs.python.org/3/library/configparser.html
-        config_object = ConfigParser()
-        # Keys in der ini-Datei case-sensitive (default: all lowercase)
+        tab = '&nbsp;' * 3
+
+        # delimiter-string for key-value-contents in SYNC_FIELDS-section of previous versions
+        ini_delimiter = '|◁=▷|'
+
+        config_object = ConfigParser(interpolation=None)
+
         config_object.optionxform = str
-        # stringify self.stored_settings
-        #  all stored properties must be string, else TypeError("option values must be strings")
-        # caveat: no None, NULL, True/False as boolean, but stringified as '0', '1', 'True', 'False' and restore these strings in sys_restore_settings
 
-        self.dlg_parse_settings()
+        ini_path = Path(f'~/{self.ini_storage_file_name}').expanduser()
 
-        check_ok, check_log = self.sys_check_settings()
+        if not ini_path.is_file():
+            return None
 
-        config_object["PRE_SCAN_SETTINGS"] = {
-            'pre_scan_dir': self.stored_settings.pre_scan_dir,
-            'pre_scan_epsg': self.stored_settings.pre_scan_epsg,
-            'pre_scan_patterns': self.stored_settings.pre_scan_patterns,
-            'pre_scan_sub_dirs': str(self.stored_settings.pre_scan_sub_dirs),
-            'pre_scan_rel_root_dir': self.stored_settings.pre_scan_rel_root_dir,
-        }
+        try:
+            parsed_file_names = config_object.read(ini_path, encoding='utf-8')
+        except Exception as e:
+            self.restore_settings_log += [f"{tab}settings-file '{ini_path}' not readable: {e}"]
+            return None
 
-        config_object["PRE_SCAN_FIELDS"] = self.stored_settings.pre_scan_fields
+        if not parsed_file_names:
+            return None
 
-        config_object["SYNC_SETTINGS"] = {
-            'sync_source_layer_id': self.stored_settings.sync_source_layer_id,
-            'sync_target_layer_id': self.stored_settings.sync_target_layer_id,
-            'sync_source_abs_path_field': self.stored_settings.sync_source_abs_path_field,
-            'sync_source_rel_path_field': self.stored_settings.sync_source_rel_path_field,
-            'sync_target_abs_path_field': self.stored_settings.sync_target_abs_path_field,
-            'sync_target_dir': self.stored_settings.sync_target_dir,
-            'sync_file_mode': self.stored_settings.sync_file_mode,
-            'sync_existing_file_mode': self.stored_settings.sync_existing_file_mode,
-            'sync_existing_feature_mode': self.stored_settings.sync_existing_feature_mode,
-            'sync_update_geometries': str(self.stored_settings.sync_update_geometries),
+        self.restore_settings_log += [f"{tab}migrated settings from file '{ini_path}'"]
 
-        }
+        default_settings = StoredSettings()
+        stored_settings_dict = {}
 
-        store_sync_fields = {}
-        # one disadvantage of ConfigParser: special characters in keys, especially if they are the ConfigParser-delimiters, default '='
-        # Delimiters are substrings that delimit keys from values within a section.
-        # The first occurrence of a delimiting substring on a line is considered a delimiter.
-        # This means values (but not keys) can contain the delimiters.
-        # therfore a special syntax for storing self.stored_settings.sync_fields
-        for idx, (sync_target_field_name, sync_source_field_name) in enumerate(self.stored_settings.sync_fields.items()):
-            store_sync_fields[f'field_{idx}'] = f"{sync_target_field_name}{self.ini_delimiter}{sync_source_field_name}"
-
-        config_object["SYNC_FIELDS"] = store_sync_fields
-
-        config_object["POST_SCAN_SETTINGS"] = {
-            'post_scan_layer_id': self.stored_settings.post_scan_layer_id,
-            'post_scan_abs_path_field': self.stored_settings.post_scan_abs_path_field,
-            'post_scan_rel_root_dir': self.stored_settings.post_scan_rel_root_dir,
-            'post_scan_preserve_existing': str(self.stored_settings.post_scan_preserve_existing),
-            'post_scan_update_geometry_from_exif': str(self.stored_settings.post_scan_update_geometry_from_exif)
-        }
+        for section in ['PRE_SCAN_SETTINGS', 'SYNC_SETTINGS', 'POST_SCAN_SETTINGS']:
+            if config_object.has_section(section):
+                for prop_name, restored_value in config_object[section].items():
+                    # Note: == 'True' because the ini-contents are read as strings
+                    if isinstance(getattr(default_settings, prop_name, None), bool):
+                        restored_value = restored_value == 'True'
+                    stored_settings_dict[prop_name] = restored_value
+
+        # previous versions: 'True'/'False' from a checkbox for worker-processes, now the thread-pipeline
+        pre_scan_parallel = stored_settings_dict.get('pre_scan_parallel', '')
+        stored_settings_dict['pre_scan_parallel'] = {'True': 'threads', 'False': ''}.get(pre_scan_parallel, pre_scan_parallel)
+
+        if config_object.has_section('PRE_SCAN_FIELDS'):
+            stored_settings_dict['pre_scan_fields'] = dict(config_object['PRE_SCAN_FIELDS'])
+
+        if config_object.has_section('POST_SCAN_FIELDS'):
+            stored_settings_dict['post_scan_fields'] = dict(config_object['POST_SCAN_FIELDS'])
+
+        if config_object.has_section('SYNC_FIELDS'):
+            # title => field_0, field_1... => only to get valid and unique ConfigParser-ini-key, content not used
+            # mapping => f"{sync_target_field_name}{ini_delimiter}{sync_source_field_name}"
+            stored_settings_dict['sync_fields'] = dict(mapping.split(ini_delimiter, 1) for mapping in config_object['SYNC_FIELDS'].values() if ini_delimiter in mapping)
+
+        return stored_settings_dict
 
-        config_object["POST_SCAN_FIELDS"] = self.stored_settings.post_scan_fields
+    def sys_store_settings(self):
+        """store current settings to json-file (Name => self.json_storage_file_name file)
+        Unix: /home/_user_name_/.QGis_FileSync_Plugin.json
+        Windows: c:/Users/_user_name_/.QGis_FileSync_Plugin.json
+
+        Note:
+            Settings are stored independend from QgsProject, so all layer- and field-references probably do not match if a new or an other project ist openend
+        """
+        # Rev. 2025-06-11
 
-        # Write the configuration to a file named self.ini_storage_file_name inside current user directory
-        ini_path = Path(f'~/{self.ini_storage_file_name}')
-        with open(ini_path.expanduser(), 'w') as conf:
-            config_object.write(conf)
+        self.dlg_parse_settings()
+
+        check_ok, check_log = self.sys_check_settings()
+
+        # json handles the types (str, bool, dict) natively, no stringify and no special syntax for the field-mappings
+        stored_settings_dict = {prop_name: value for prop_name, value in vars(self.stored_settings).items() if not prop_name.startswith('_')}
+
+        # Write the configuration to a file named self.json_storage_file_name inside current user directory
+        json_path = Path(f'~/{self.json_storage_file_name}').expanduser()
+        with open(json_path, 'w', encoding='utf-8') as json_file:
+            json.dump(stored_settings_dict, json_file, ensure_ascii=False, indent=4)
 
     def sys_check_settings(self, use_cases=None) -> tuple:
         """check stored settings
@@ -2782,6 +3714,7 @@ class FileSync(object):
             process_log.append(f"{tab}{tab}pre_scan_patterns '{self.stored_settings.pre_scan_patterns}'")
 
             process_log.append(f"{tab}{tab}pre_scan_sub_dirs '{self.stored_settings.pre_scan_sub_dirs}'")
+            process_log.append(f"{tab}{tab}pre_scan_parallel '{self.stored_settings.pre_scan_parallel}'")
 
             if 'rel_path' in self.stored_settings.pre_scan_fields:
                 process_log.append(f"{tab}{tab}pre_scan_rel_root_dir '{self.stored_settings.pre_scan_rel_root_dir}'")
@@ -2865,14 +3798,8 @@ class FileSync(object):
 
             process_log.append(f"{tab}{tab}sync_update_geometries '{self.stored_settings.sync_update_geometries}'")
             if sync_source_layer and sync_target_layer and self.stored_settings.sync_update_geometries:
-                point_wkb_types = [
-                    qgis._core.QgsWkbTypes.Point,
-                    qgis._core.QgsWkbTypes.PointZ,
-                    qgis._core.QgsWkbTypes.PointM,
-                    qgis._core.QgsWkbTypes.PointZM,
-                ]
-                if sync_source_layer.dataProvider().wkbType() in point_wkb_types:
-                    if sync_target_layer.dataProvider().wkbType() in point_wkb_types:
+                if sync_source_layer.dataProvider().wkbType() in POINT_WKB_TYPES:
+                    if sync_target_layer.dataProvider().wkbType() in POINT_WKB_TYPES:
                         tr_source_2_target = qgis._core.QgsCoordinateTransform(sync_source_layer.crs(), sync_target_layer.crs(), qgis._core.QgsProject.instance())
                         if not tr_source_2_target.isValid():
                             process_log.append(f"<b>{tab}⭍ Coordinate-Transformation '{sync_source_layer.crs().authid()} -> {sync_target_layer.crs().authid()}' not valid</b>")
@@ -2891,19 +3818,13 @@ class FileSync(object):
 
             process_log.append(f"{tab}{tab}sync_fields:")
             if self.stored_settings.sync_fields:
-                int_types = [
-                    QtCore.QVariant.Int,
-                    QtCore.QVariant.LongLong,
-                    QtCore.QVariant.UInt,
-                    QtCore.QVariant.ULongLong,
-                ]
                 # check existence and mapping-validity
                 for sync_target_field_name, sync_source_field_name in self.stored_settings.sync_fields.items():
-                    sync_source_field = self.tool_get_sync_source_field(sync_source_field_name)
-                    sync_target_field = self.tool_get_sync_target_field(sync_target_field_name)
+                    sync_source_field = self.tool_get_sync_source_field(sync_source_field_name, sync_source_layer)
+                    sync_target_field = self.tool_get_sync_target_field(sync_target_field_name, sync_target_layer)
                     if sync_target_field:
                         if sync_source_field:
-                            if sync_source_field.type() == sync_target_field.type() or (sync_source_field.type() in int_types and sync_target_field.type() in int_types):
+                            if sync_source_field.type() == sync_target_field.type() or (sync_source_field.type() in INT_TYPES and sync_target_field.type() in INT_TYPES):
                                 process_log.append(f"{tab}{tab}{tab}{sync_source_field_name} -> {sync_target_field_name}")
                             else:
                                 process_log.append(f"<b>{tab}{tab}{tab}⭍ Fields '{sync_source_field_name}' -> '{sync_target_field_name}' with unsuitable types</b>")
@@ -2931,6 +3852,7 @@ class FileSync(object):
 
             process_log.append(f"{tab}{tab}post_scan_preserve_existing '{self.stored_settings.post_scan_preserve_existing}'")
             process_log.append(f"{tab}{tab}post_scan_update_geometry_from_exif '{self.stored_settings.post_scan_update_geometry_from_exif}'")
+            process_log.append(f"{tab}{tab}post_scan_parallel '{self.stored_settings.post_scan_parallel}'")
 
             if self.stored_settings.post_scan_abs_path_field:
                 process_log.append(f"{tab}{tab}post_scan_abs_path_field '{self.stored_settings.post_scan_abs_path_field}'")
@@ -2944,14 +3866,8 @@ class FileSync(object):
             if self.stored_settings.post_scan_layer_id:
 
                 if self.stored_settings.post_scan_update_geometry_from_exif:
-                    point_wkb_types = [
-                        qgis._core.QgsWkbTypes.Point,
-                        qgis._core.QgsWkbTypes.PointZ,
-                        qgis._core.QgsWkbTypes.PointM,
-                        qgis._core.QgsWkbTypes.PointZM,
-                    ]
                     post_scan_layer = self.tool_get_post_scan_layer()
-                    if not (post_scan_layer and post_scan_layer.isValid() and post_scan_layer.type() == qgis._core.Qgis.LayerType.VectorLayer and post_scan_layer.dataProvider().wkbType() in point_wkb_types):
+                    if not (post_scan_layer and post_scan_layer.isValid() and post_scan_layer.type() == qgis._core.Qgis.LayerType.VectorLayer and post_scan_layer.dataProvider().wkbType() in POINT_WKB_TYPES):
                         process_log.append(f"<b>{tab}{tab}{tab}⭍ 'update geometries' selected, but layer-geometry-type != point</b>")
                         check_ok = False
 
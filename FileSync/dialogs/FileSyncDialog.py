@@ -80,6 +80,20 @@ class FileSyncDialog(QtWidgets.QDockWidget):
             self.qcb_pre_scan_sub_dirs = QtWidgets.QCheckBox()
             pre_scan_tab.layout().addWidget(self.qcb_pre_scan_sub_dirs, row, 1)
 
+            row += 1
+            pre_scan_tab.layout().addWidget(QtWidgets.QLabel('Parallel Extraction:', self), row, 0)
+            self.qcb_pre_scan_parallel = QtWidgets.QComboBox(self)
+            self.qcb_pre_scan_parallel.setToolTip('read hash, XMP, IPTC and EXIF parallel, faster for many large files')
+            self.qcb_pre_scan_parallel.addItem(None)
+
+            pre_scan_parallel_modes = {
+                "threads": 'threads (overlapped file-read and hash)',
+            }
+            for pre_scan_parallel_mode, pre_scan_parallel_mode_str in pre_scan_parallel_modes.items():
+                self.qcb_pre_scan_parallel.addItem(pre_scan_parallel_mode_str, pre_scan_parallel_mode)
+
+            pre_scan_tab.layout().addWidget(self.qcb_pre_scan_parallel, row, 1)
+
             row += 1
             pre_scan_tab.layout().addWidget(QtWidgets.QLabel('File-Extension(s):', self), row, 0)
 
@@ -438,6 +452,16 @@ class FileSyncDialog(QtWidgets.QDockWidget):
             self.qcb_post_scan_update_geometry_from_exif.setToolTip("only for jpeg-files with exif-metas containing gps-latitude/longitude/altitude")
             post_scan_tab.layout().addWidget(self.qcb_post_scan_update_geometry_from_exif, row, 1, 1, 3)
 
+            row += 1
+            post_scan_tab.layout().addWidget(QtWidgets.QLabel('Parallel Extraction:', self), row, 0)
+            self.qcb_post_scan_parallel = QtWidgets.QComboBox(self)
+            self.qcb_post_scan_parallel.setToolTip('read hash, XMP, IPTC and EXIF parallel, faster for many large files')
+            self.qcb_post_scan_parallel.addItem(None)
+            for post_scan_parallel_mode, post_scan_parallel_mode_str in pre_scan_parallel_modes.items():
+                self.qcb_post_scan_parallel.addItem(post_scan_parallel_mode_str, post_scan_parallel_mode)
+
+            post_scan_tab.layout().addWidget(self.qcb_post_scan_parallel, row, 1, 1, 3)
+
             row += 1
             post_scan_export_fields_grb = MyQtWidgets.QGroupBoxExpandable('Extract File-Metas:', False, self)
             post_scan_export_fields_grb.setLayout(QtWidgets.QHBoxLayout())
@@ -569,6 +593,10 @@ class FileSyncDialog(QtWidgets.QDockWidget):
             self.qpb_clear_log.setIcon(QtGui.QIcon(f'{Path(__file__).resolve().parent}/icons/mActionDeleteSelectedFeatures.svg'))
             sub_wdg.layout().addWidget(self.qpb_clear_log)
 
+            self.qcb_verbose_log = QtWidgets.QCheckBox("detailed")
+            self.qcb_verbose_log.setToolTip("log each file/feature of PreScan, PostScan and Sync\nelse only problems and summaries (faster and less memory for many files)")
+            sub_wdg.layout().addWidget(self.qcb_verbose_log)
+
             log_tab.layout().addWidget(sub_wdg)
 
             #
@@ -518,6 +518,9 @@ class MyLayerSelectorQComboBox(MyQComboBox):
         for ltrl_layer in ltr_layers:
             if ltrl_layer.layer() and ltrl_layer.layer().isValid():
                 cl = ltrl_layer.layer()
+                # provider and its name queried once per layer, used for the columns and the criteria
+                cl_provider = cl.dataProvider()
+                cl_provider_name = cl_provider.name()
                 name_item = self.MyStandardItem()
                 name_item.setData(cl.name(), QtCore.Qt.DisplayRole)
                 name_item.setData(cl.name(), Qt_Roles.CUSTOM_SORT)
@@ -526,7 +529,7 @@ class MyLayerSelectorQComboBox(MyQComboBox):
 
                 geometry_item = self.MyStandardItem()
                 if isinstance(cl, qgis._core.QgsVectorLayer):
-                    display_value = qgis._core.QgsWkbTypes.displayString(cl.dataProvider().wkbType())
+                    display_value = qgis._core.QgsWkbTypes.displayString(cl_provider.wkbType())
                 else:
                     display_value = 'Raster'
 
@@ -534,12 +537,12 @@ class MyLayerSelectorQComboBox(MyQComboBox):
                 geometry_item.setData(display_value, Qt_Roles.CUSTOM_SORT)
 
                 provider_item = self.MyStandardItem()
-                if isinstance(cl, qgis._core.QgsVectorLayer) and cl.dataProvider().name() != 'virtual':
-                    display_value = f"{cl.dataProvider().name()} ({cl.dataProvider().storageType()})"
+                if isinstance(cl, qgis._core.QgsVectorLayer) and cl_provider_name != 'virtual':
+                    display_value = f"{cl_provider_name} ({cl_provider.storageType()})"
                 else:
-                    display_value = cl.dataProvider().name()
+                    display_value = cl_provider_name
 
-                provider_item.setData(cl.dataProvider().name(), QtCore.Qt.DisplayRole)
+                provider_item.setData(cl_provider_name, QtCore.Qt.DisplayRole)
                 provider_item.setData(display_value, Qt_Roles.CUSTOM_SORT)
 
                 index_item = self.MyStandardItem(Qt_Roles.CUSTOM_SORT)
@@ -566,7 +569,7 @@ class MyLayerSelectorQComboBox(MyQComboBox):
                         elif key == 'layer':
                             enabled &= cl in value_list
                         elif key == 'data_provider':
-                            enabled &= hasattr(cl, 'dataProvider') and cl.dataProvider().name() in value_list
+                            enabled &= cl_provider_name in value_list
                         elif key == 'crs':
                             enabled &= hasattr(cl, 'crs') and cl.crs() in value_list
                         else:
@@ -588,7 +591,7 @@ class MyLayerSelectorQComboBox(MyQComboBox):
                         elif key == 'layer':
                             enabled &= cl not in value_list
                         elif key == 'data_provider':
-                            enabled &= not(hasattr(cl, 'dataProvider') and cl.dataProvider().name() in value_list)
+                            enabled &= cl_provider_name not in value_list
                         elif key == 'crs':
                             enabled &= not(hasattr(cl, 'crs') and cl.crs() in value_list)
                         else:
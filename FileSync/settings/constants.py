@@ -23,6 +23,10 @@ the Free Software Foundation; either version 2 of the License, or
 """
 from enum import IntEnum
 
+import qgis._core
+import qgis.core
+from PyQt5 import QtCore
+
 # Qt_Roles
 # used for storing data in QStandardItemModel, f.e. MyQComboBox, MyQTreeView...
 # QStandardItem.setData(value,role) rsp. value = QStandardItem.data(role)
@@ -39,3 +43,47 @@ from enum import IntEnum
 # OPTION_TEXT: MyQComboBox -> role for Wildcard-replacements {0} {1}... in option_text_template, used for the selected option (QLineEdit)
 # RETURN_VALUE: universal role, f.e. QgsField inside MyQComboBox in Plugin-layer-field-configuration
 Qt_Roles = IntEnum('Qt_Roles', ['CUSTOM_SORT', 'RETURN_VALUE','OPTION_TEXT'], start=257)
+
+# field- and geometry-types for the checks of layer-fields, hashable for O(1) membership-checks
+# usage: field.type() in STRING_TYPES
+STRING_TYPES = frozenset([
+    QtCore.QVariant.String,
+    QtCore.QMetaType.QString,
+])
+
+DOUBLE_TYPES = frozenset([
+    QtCore.QVariant.Double,
+    QtCore.QMetaType.Double,
+])
+
+DATE_TIME_TYPES = frozenset([
+    QtCore.QVariant.DateTime,
+    QtCore.QMetaType.QDateTime,
+])
+
+# integer-like field-types are interchangeable
+INT_TYPES = frozenset([
+    QtCore.QVariant.Int,
+    QtCore.QVariant.LongLong,
+    QtCore.QVariant.UInt,
+    QtCore.QVariant.ULongLong,
+])
+
+POINT_WKB_TYPES = frozenset([
+    qgis._core.QgsWkbTypes.Point,
+    qgis._core.QgsWkbTypes.PointZ,
+    qgis._core.QgsWkbTypes.PointM,
+    qgis._core.QgsWkbTypes.PointZM,
+])
+
+# empty attribute-values
+# tuple, not frozenset: NULL-QVariants are not hashable by value, the membership-test has to use ==
+EMPTY_VALUES = (qgis.core.NULL, None, '')
+
+# Qt.ItemFlags for the field-lists and the mapping-table, constructed once
+# 53 => ItemIsSelectable | ItemIsDragEnabled | ItemIsUserCheckable | ItemIsEnabled
+ITEM_FLAGS_DEFAULT = QtCore.Qt.ItemFlags(53)
+# 21 => like ITEM_FLAGS_DEFAULT but without ItemIsEnabled
+ITEM_FLAGS_NOT_SELECTABLE = QtCore.Qt.ItemFlags(21)
+# 32 => ItemIsEnabled only
+ITEM_FLAGS_ENABLED = QtCore.Qt.ItemFlags(32)
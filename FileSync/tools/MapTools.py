@@ -29,7 +29,7 @@ from PyQt5 import QtCore
 
 from PyQt5.QtWidgets import QDialog, QWidget, QLabel, QVBoxLayout, QPushButton, QHBoxLayout, QComboBox, QCheckBox
 
-import time, math, platform, subprocess
+import time, math, platform, subprocess, re
 
 from pathlib import Path
 
@@ -57,6 +57,11 @@ class FeatureDigitizeMapTool(qgis.gui.QgsMapToolEmitPoint):
     show_file_act_id = QtCore.QUuid('{fa3440e3-0464-431b-9c41-945d46433154}')
     show_form_act_id = QtCore.QUuid('{fa3440e3-0464-431b-9c41-945d46433155}')
 
+    # parse the assigned field-names from the commands of existing layer-actions, see add_show_file_action/add_show_feature_action
+    abs_path_field_pattern = re.compile(r"\.abs_path_field_name='([^']*)'")
+    direction_field_pattern = re.compile(r"\.direction_field_name='([^']*)'")
+    last_edit_date_time_field_pattern = re.compile(r"\.last_edit_date_time_field_name='([^']*)'")
+
     def __init__(self, iface: qgis._gui.QgisInterface):
         """
         constructor
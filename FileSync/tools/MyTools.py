@@ -28,7 +28,11 @@ the Free Software Foundation; either version 2 of the License, or
 ********************************************************************
 """
 import os, sys, re, tempfile
+import stat
+import fnmatch
 import hashlib
+import mmap
+import shutil
 from pathlib import Path
 import typing
 from typing import Any
@@ -37,6 +41,17 @@ from datetime import datetime
 import qgis
 from PyQt5 import QtCore, QtWidgets
 
+# optional, not part of the QGis-Python-Environment, install via pip install blake3
+# without blake3 the hash-algorithm 'blake3' falls back to hashlib.blake2b, see resolve_hash_alg
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# minimal size for multi-threaded blake3-hashing, below that the thread-overhead exceeds the gain
+# especially inside the parallel workers of FileMetaExtractor, where many small files are hashed concurrently
+BLAKE3_THREADS_MIN_SIZE = 1 << 20
+
 
 
 def qcbx_select_by_value(qcbx:QtWidgets.QComboBox, value:Any, role:QtCore.Qt.ItemDataRole = QtCore.Qt.DisplayRole):
@@ -50,9 +65,9 @@ def qcbx_select_by_value(qcbx:QtWidgets.QComboBox, value:Any, role:QtCore.Qt.Ite
         with QtCore.QSignalBlocker(qcbx):
             qcbx.setCurrentIndex(matching_items[0].row())
 
-def get_unique_string(used_strings: list, template: str, start_i: int = 1) -> str:
+def get_unique_string(used_strings: typing.Container, template: str, start_i: int = 1) -> str:
     """get unique string replacing Wildcard {curr_i} with incremented integer
-    :param used_strings: List of already used strings, f.e. table-names in a GeoPackage or layer in QGis-Project [layer.name() for layer in  qgis._core.QgsProject.instance().mapLayers().values()]
+    :param used_strings: already used strings, f.e. table-names in a GeoPackage or layer in QGis-Project {layer.name() for layer in  qgis._core.QgsProject.instance().mapLayers().values()}, preferably a set for O(1) membership-checks
     :param template: template with Wildcard {curr_i}
     :param start_i: start index for incrementing, usually 1
     """
@@ -67,30 +82,120 @@ def get_unique_string(used_strings: list, template: str, start_i: int = 1) -> st
         start_i += 1
 
 
-def get_file_hash(file_path: str | Path, hash_alg: str = 'sha1') -> str:
+def resolve_hash_alg(hash_alg: str) -> str:
+    """hash-algorithm actually used by get_file_hash/get_buffer_hash
+    'blake3' without the optional package blake3 => 'blake2b', which results in different hash-values,
+    so the resolved name has to be stored together with the hashes, f.e. in the meta-cache
+    :param hash_alg: requested hash-algorithm
+    :return: hash_alg or 'blake2b'
+    """
+    if hash_alg == 'blake3' and not blake3:
+        return 'blake2b'
+    return hash_alg
+
+def get_file_hash(file_path: str | Path, hash_alg: str = 'blake3') -> str:
     """
     get a hash-value for a file, used to identify duplicates
     :param file_path:
-    :param hash_alg: md5,sha1,sha256... see https://docs.python.org/3/library/hashlib.html
+    :param hash_alg: blake3 (default, SIMD-vectorized and multi-threaded, requires optional package blake3, else fallback to blake2b) or md5,sha1,sha256... see https://docs.python.org/3/library/hashlib.html
     :return: str, the hash-value, unique for a file, f.e. for storage in database
     """
     if isinstance(file_path, str):
         file_path = Path(file_path)
 
     if file_path.exists():
-        with open(file_path, "rb") as f:
-            file_hash = hashlib.new(hash_alg)
-
-            while chunk := f.read(8192):
-                file_hash.update(chunk)
+        hash_alg = resolve_hash_alg(hash_alg)
+        if hash_alg == 'blake3':
+            # update_mmap => memory-mapped file, multi-threaded hashing for large files
+            return blake3.blake3(max_threads=blake3.blake3.AUTO).update_mmap(file_path).hexdigest()
 
-        # digest => binary
-        # hexdigest => printable/storable str:
-        return file_hash.hexdigest()
+        with open(file_path, "rb") as f:
+            # digest => binary
+            # hexdigest => printable/storable str:
+            return hashlib.file_digest(f, hash_alg).hexdigest()
     else:
         raise FileNotFoundError(f"File '{file_path}' not found")
 
-def create_unique_file_path(check_file_path:str|Path, randomize_mode:str='i', create_dir:bool=True)->Path:
+def get_buffer_hash(buffer: bytes | mmap.mmap, hash_alg: str = 'blake3') -> str:
+    """
+    get a hash-value for already read file-contents, same result as get_file_hash for the same file
+    :param buffer: bytes-like, f.e. mmap of the file
+    :param hash_alg: see get_file_hash
+    :return: str, the hash-value
+    """
+    hash_alg = resolve_hash_alg(hash_alg)
+    if hash_alg == 'blake3':
+        max_threads = blake3.blake3.AUTO if len(buffer) >= BLAKE3_THREADS_MIN_SIZE else 1
+        return blake3.blake3(buffer, max_threads=max_threads).hexdigest()
+
+    return hashlib.new(hash_alg, buffer).hexdigest()
+
+# factors for degree, minutes, seconds, see dms_to_dd
+DMS_FACTORS = (1.0, 1.0 / 60.0, 1.0 / 3600.0)
+
+def dms_to_dd(dms: tuple, ref: str | bytes = 'N') -> float:
+    """
+    convert GPS-coordinates from degree, minutes, seconds to decimal degree
+    :param dms: tuple of three numbers (float, int, IFDRational...): degree, minutes, seconds
+    :param ref: GPSLatitudeRef/GPSLongitudeRef, southern and western coordinates are negative
+    :return: float, decimal degree
+    """
+    dd = float(dms[0]) * DMS_FACTORS[0] + float(dms[1]) * DMS_FACTORS[1] + float(dms[2]) * DMS_FACTORS[2]
+    return -dd if ref in ('S', 'W', b'S', b'W') else dd
+
+def copy_file(source_path: str | Path, target_path: str | Path):
+    """
+    copy a file with permissions and metadata like shutil.copy2
+    Linux: os.copy_file_range, the copy stays inside the kernel, reflink (copy-on-write, near-instant) on Btrfs/XFS
+    else or if not supported for these file-systems: shutil.copyfile (sendfile/fcopyfile/CopyFile-API)
+    :param source_path:
+    :param target_path:
+    :raises shutil.SameFileError: source and target are the same file, checked before the target is opened (and truncated)
+    """
+    if os.path.exists(target_path) and os.path.samefile(source_path, target_path):
+        raise shutil.SameFileError(f"'{source_path}' and '{target_path}' are the same file")
+
+    copied = False
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(source_path, 'rb') as source_file, open(target_path, 'wb') as target_file:
+                remaining = os.fstat(source_file.fileno()).st_size
+                while remaining > 0:
+                    # returns 0 at EOF, f.e. if the file was truncated meanwhile
+                    copied_size = os.copy_file_range(source_file.fileno(), target_file.fileno(), remaining)
+                    if not copied_size:
+                        break
+                    remaining -= copied_size
+            # incomplete => not copied, copyfile below overwrites the short target
+            copied = remaining <= 0
+        except OSError:
+            # f.e. EXDEV (cross-device before Linux 5.3), ENOSYS, EINVAL => copyfile overwrites the partial target
+            pass
+
+    if not copied:
+        shutil.copyfile(source_path, target_path)
+
+    shutil.copystat(source_path, target_path)
+
+def copy_files(source_paths: list, target_path: str | Path) -> list:
+    """
+    copy one or more files successively to the same target-path, see copy_file
+    intended as job for a thread-pool, several copies to the same target must not run concurrently, the last one wins
+    :param source_paths: list of source-paths
+    :param target_path:
+    :return: list in order of source_paths, None if copied else the OSError
+    """
+    copy_errors = []
+    for source_path in source_paths:
+        try:
+            copy_file(source_path, target_path)
+            copy_errors.append(None)
+        except OSError as e:
+            # includes shutil.SameFileError
+            copy_errors.append(e)
+    return copy_errors
+
+def create_unique_file_path(check_file_path:str|Path, randomize_mode:str='i', create_dir:bool=True, reserved_paths:typing.Container=())->Path:
     """
     Check uniquenes and return a unique file-path
     :param check_file_path: path to check for duplicate
@@ -98,6 +203,7 @@ def create_unique_file_path(check_file_path:str|Path, randomize_mode:str='i', cr
     i => incremented integer between prefix and suffix
     r => random string between prefix and suffix
     :param create_dir: to to create the directory on demand
+    :param reserved_paths: Path-objects not existing yet but already taken, f.e. pending copies, treated like existing files
     :return: unique file-path for this directory
     """
     if isinstance(check_file_path, str):
@@ -115,14 +221,14 @@ def create_unique_file_path(check_file_path:str|Path, randomize_mode:str='i', cr
         else:
             raise FileNotFoundError(f"directory '{directory}' not found")
 
-    if check_file_path.is_file():
+    if check_file_path.is_file() or check_file_path in reserved_paths:
         suffix = check_file_path.suffix
         prefix = check_file_path.stem
         if randomize_mode == 'i':
             # Variante 1: hochgezählte integer zwischen altem prefix und suffix
             ci = 1
             unique_file_path = directory / f"{prefix}_{ci}{suffix}"
-            while unique_file_path.is_file():
+            while unique_file_path.is_file() or unique_file_path in reserved_paths:
                 ci += 1
                 unique_file_path = directory / f"{prefix}_{ci}{suffix}"
         else:
@@ -157,15 +263,31 @@ def get_features_by_value(vlayer: qgis._core.QgsVectorLayer, field: qgis._core.Q
 
 
 
-def scan_files(root_path: str|Path, search_patterns='', recursive: bool = True, case_sensitive: bool = False) -> set:
+def get_file_stat(file_path: str | Path) -> os.stat_result | None:
+    """
+    one stat-syscall instead of is_file() + stat()
+    :param file_path: path to the file
+    :return: os.stat_result or None, if file_path is no (existing) regular file
+    """
+    try:
+        stat_result = os.stat(file_path)
+    except (OSError, ValueError):
+        return None
+
+    if stat.S_ISREG(stat_result.st_mode):
+        return stat_result
+
+
+def scan_files(root_path: str|Path, search_patterns='', recursive: bool = True, case_sensitive: bool = False) -> dict:
     """Scans directory for files by list of wildcards
+    os.scandir-walk: the directory-entries provide file-type and stat without extra syscalls per file (Windows), on other systems one stat per file
     :param root_path: root-directory, type string or Path
     :param search_patterns: seperated list of patterns, f.e. '*.JPG, *.png, *.pdf, *.PDF', not only for extensions 'bla.*', multiple split-characters (comma, semicolon, blank)
     :param recursive: recursiv scan of subdirectories
     :param case_sensitive: consider case in search_patterns '*.JPG' vs. '*.jpg', default: False
-    :returns' set of Path (set => unique)
+    :returns: dict key: Path value: os.stat_result (dict => unique, usable like the former set of Path)
     """
-    scan_result = set()
+    scan_result = {}
 
     if isinstance(root_path, str):
         root_path = Path(root_path)
@@ -177,22 +299,34 @@ def scan_files(root_path: str|Path, search_patterns='', recursive: bool = True,
         pattern_set = set()
         for pattern in re.split('[;, ]', search_patterns):
             if pattern:
-                pattern_set.add(pattern.strip())
+                pattern_set.add(pattern.strip() if case_sensitive else pattern.strip().lower())
 
         # special case: *.* => all Files => makes all other patterns superfluous
         if '*.*' in pattern_set:
-            pattern_set = set('*.*')
+            # also files without extension
+            pattern_set = {'*'}
 
-        for pattern in pattern_set:
-            if recursive:
-                iterator = root_path.rglob(pattern, case_sensitive=case_sensitive)
-            else:
-                iterator = root_path.glob(pattern, case_sensitive=case_sensitive)
+        # all wildcards in one compiled regular expression, one C-level match per directory-entry instead of one fnmatchcase-call per pattern
+        pattern_re = re.compile('|'.join(fnmatch.translate(pattern) for pattern in pattern_set))
 
-            for scan_file in iterator:
-                if scan_file.is_file():
-                    # glob/rglob does not differentiate between "regular" files and directories
-                    scan_result.add(scan_file)
+        # no valid pattern => no matching file, the empty regular expression would match all
+        scan_dirs = [root_path] if pattern_set else []
+        while scan_dirs:
+            scan_dir = scan_dirs.pop()
+            try:
+                with os.scandir(scan_dir) as dir_entries:
+                    for dir_entry in dir_entries:
+                        if dir_entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                scan_dirs.append(dir_entry.path)
+                        elif dir_entry.is_file():
+                            # scandir does differentiate between "regular" files and directories
+                            entry_name = dir_entry.name if case_sensitive else dir_entry.name.lower()
+                            if pattern_re.match(entry_name):
+                                scan_result[Path(dir_entry.path)] = dir_entry.stat()
+            except OSError:
+                # f.e. no permission for sub-directory
+                pass
 
         return scan_result
 